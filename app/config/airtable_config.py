@@ -4,6 +4,20 @@ from functools import lru_cache
 class AirtableSettings(BaseSettings):
     AIRTABLE_API_KEY: str
     AIRTABLE_BASE_ID: str
+    AIRTABLE_MAX_CONCURRENCY: int = 5
+    AIRTABLE_CONNECT_TIMEOUT_SECONDS: int = 5
+    AIRTABLE_READ_TIMEOUT_SECONDS: int = 30
+    AIRTABLE_RATE_LIMIT_PER_SECOND: float = 5
+    AIRTABLE_RATE_LIMIT_BURST: int = 5
+    AIRTABLE_MAX_RATE_LIMIT_RETRIES: int = 5
+    AIRTABLE_BACKOFF_MAX_SECONDS: float = 30
+    AIRTABLE_CACHE_TTL_SECONDS: float = 60
+    AIRTABLE_CACHE_STALE_SECONDS: float = 300
+    AIRTABLE_CACHE_SIZE: int = 256
+    AIRTABLE_BULK_CONCURRENCY: int = 3
+    AIRTABLE_MIRROR_INTERVAL_SECONDS: float = 300
+    AIRTABLE_MIRROR_MAX_LAG_SECONDS: float = 3600
+    AIRTABLE_MIRROR_FULL_SYNC_HOURS: float = 24
     
     class Config:
         env_file = ".env"
@@ -0,0 +1,259 @@
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, TypeVar
+from pyairtable import Api, Table
+from requests import RequestException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from app.config.airtable_config import get_airtable_settings
+
+R = TypeVar("R")
+
+
+class AirtableError(Exception):
+    """An Airtable request failed; ``status_code`` is None when no response arrived."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+    @property
+    def not_found(self) -> bool:
+        return self.status_code == 404
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by every request to one Airtable base.
+
+    Holds up to ``burst`` tokens refilled at ``rate`` per second; ``acquire``
+    sleeps the calling worker thread until a token is free. ``pause`` empties
+    the bucket for a while after a 429, so every thread backs off together
+    instead of each one discovering the penalty separately.
+    """
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self.acquired = 0
+        self.throttled = 0
+        self.wait_seconds = 0.0
+        self.rate_limited = 0
+        self.retries_exhausted = 0
+
+    def acquire(self) -> float:
+        """Take one token, returning how long the caller waited for it."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                else:
+                    self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        self.acquired += 1
+                        if waited:
+                            self.throttled += 1
+                            self.wait_seconds += waited
+                        return waited
+                    delay = (1 - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self.rate_limited += 1
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+            self._tokens = 0.0
+            self._updated = self._paused_until
+
+    def stats(self) -> dict:
+        return {
+            "rate_per_second": self.rate,
+            "burst": self.burst,
+            "requests": self.acquired,
+            "throttled": self.throttled,
+            "wait_seconds": round(self.wait_seconds, 3),
+            "rate_limited_429": self.rate_limited,
+            "retries_exhausted": self.retries_exhausted,
+            "paused_for_seconds": round(max(0.0, self._paused_until - self._clock()), 3),
+        }
+
+
+# One bucket per base, shared by every client and table in the process
+_limiters: Dict[str, TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+def get_rate_limiter(base_id: str) -> TokenBucket:
+    with _limiters_lock:
+        if base_id not in _limiters:
+            settings = get_airtable_settings()
+            _limiters[base_id] = TokenBucket(settings.AIRTABLE_RATE_LIMIT_PER_SECOND,
+                                             settings.AIRTABLE_RATE_LIMIT_BURST)
+        return _limiters[base_id]
+
+
+class ThrottledAdapter(HTTPAdapter):
+    """
+    Transport that takes a limiter token before every HTTP request, page
+    fetches included, and retries 429s with capped exponential backoff.
+
+    A ``Retry-After`` header wins over the computed delay. Backoff is
+    jittered so threads released together do not collide again.
+    """
+
+    def __init__(self, limiter: TokenBucket, max_rate_limit_retries: int = 5,
+                 backoff_base: float = 1.0, backoff_max: float = 30.0, **kwargs):
+        self.limiter = limiter
+        self.max_rate_limit_retries = max_rate_limit_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        super().__init__(**kwargs)
+
+    def _backoff(self, response, attempt: int) -> float:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(self.backoff_max, float(retry_after))
+            except ValueError:
+                pass
+        return min(self.backoff_max, self.backoff_base * 2 ** attempt) * random.uniform(0.5, 1.0)
+
+    def send(self, request, **kwargs):
+        attempt = 0
+        while True:
+            self.limiter.acquire()
+            response = super().send(request, **kwargs)
+            if response.status_code != 429:
+                return response
+            if attempt >= self.max_rate_limit_retries:
+                self.limiter.retries_exhausted += 1
+                return response
+            self.limiter.pause(self._backoff(response, attempt))
+            response.close()
+            attempt += 1
+
+
+class AirtableClient:
+    """
+    Runs pyairtable's blocking calls on a bounded thread pool.
+
+    pyairtable is synchronous; calling it from an ``async def`` holds the
+    event loop for a whole HTTPS round trip. Every table shares one ``Api``
+    and therefore one requests session, whose connection pool is sized to
+    ``max_workers`` so keep-alive connections are reused rather than
+    reopened. At most ``max_workers`` Airtable requests are in flight; the
+    rest wait in the executor queue without blocking other requests.
+    """
+
+    def __init__(self, api_key: str, base_id: str, max_workers: int = 5,
+                 timeout: Optional[tuple] = None, limiter: Optional[TokenBucket] = None,
+                 max_rate_limit_retries: int = 5, backoff_max: float = 30.0):
+        # 429s are retried by ThrottledAdapter, not pyairtable's short urllib3 backoff
+        self.api = Api(api_key, timeout=timeout, retry_strategy=None)
+        self.base_id = base_id
+        self.max_workers = max_workers
+        self.limiter = limiter or get_rate_limiter(base_id)
+        # Only failed connects are retried here; the request never reached Airtable
+        adapter = ThrottledAdapter(
+            self.limiter,
+            max_rate_limit_retries=max_rate_limit_retries,
+            backoff_max=backoff_max,
+            pool_connections=1,
+            pool_maxsize=max_workers,
+            max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.5,
+                              respect_retry_after_header=False, raise_on_status=False),
+        )
+        self.api.session.mount("https://", adapter)
+        self.api.session.mount("http://", adapter)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+        self.errors = 0
+        self.total_ms = 0.0
+
+    def table(self, table_name: str) -> Table:
+        return self.api.table(self.base_id, table_name)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="airtable")
+        return self._executor
+
+    async def run(self, func: Callable[..., R], *args, **kwargs) -> R:
+        """Await ``func(*args, **kwargs)`` on a worker thread."""
+        self._in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), lambda: func(*args, **kwargs))
+        except RequestException as e:
+            self.errors += 1
+            response = getattr(e, "response", None)
+            raise AirtableError(str(e), response.status_code if response is not None else None) from e
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            self._in_flight -= 1
+            self.calls += 1
+            self.total_ms += (time.perf_counter() - started) * 1000
+
+    def stats(self) -> dict:
+        return {
+            "max_workers": self.max_workers,
+            "in_flight": self._in_flight,
+            "max_in_flight": self.max_in_flight,
+            "calls": self.calls,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.calls, 2) if self.calls else None,
+            "rate_limiter": self.limiter.stats(),
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.api.session.close()
+
+
+# Process-wide client; every table DAO shares its pool and session
+_client: Optional[AirtableClient] = None
+
+def get_airtable_client() -> AirtableClient:
+    global _client
+    if _client is None:
+        settings = get_airtable_settings()
+        _client = AirtableClient(
+            settings.AIRTABLE_API_KEY,
+            settings.AIRTABLE_BASE_ID,
+            max_workers=settings.AIRTABLE_MAX_CONCURRENCY,
+            timeout=(settings.AIRTABLE_CONNECT_TIMEOUT_SECONDS, settings.AIRTABLE_READ_TIMEOUT_SECONDS),
+            max_rate_limit_retries=settings.AIRTABLE_MAX_RATE_LIMIT_RETRIES,
+            backoff_max=settings.AIRTABLE_BACKOFF_MAX_SECONDS,
+        )
+    return _client
+
+def get_airtable_stats() -> Optional[dict]:
+    return _client.stats() if _client is not None else None
+
+def close_airtable_client() -> None:
+    global _client
+    if _client is not None:
+        _client.shutdown()
+        _client = None
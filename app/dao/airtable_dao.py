@@ -1,20 +1,82 @@
-from pyairtable import Table
+import asyncio
+from datetime import date
+from decimal import Decimal
 from app.config.airtable_config import get_airtable_settings
-from typing import List, Optional, TypeVar, Generic, Type, Any
+from app.dao.airtable_client import AirtableError, get_airtable_client
+from app.dao.airtable_mirror import AirtableMirror, get_airtable_mirror
+from app.dao.record_decoder import decoder_for, split_list
+from app.dao.relation_index import get_relation_index, register_relation_index, table_relation_indexes
+from app.models.models import BulkRecordResult, BulkWriteResponse, InvestorPage
+from dao.ttl_cache import TTLCache
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar, Generic, Type, Any
 from pydantic import BaseModel, HttpUrl
 
 T = TypeVar('T', bound=BaseModel)
 
+# Airtable's limit on records per create/update request
+BATCH_SIZE = 10
+# Airtable's largest list page
+MAX_PAGE_SIZE = 100
+# Prefix that marks a page cursor issued by the local mirror rather than Airtable
+MIRROR_CURSOR = "m:"
+
+def _equals_clause(field: str, value: Any) -> str:
+    escaped = str(value).replace("\\", "\\\\").replace("'", "\\'")
+    return f"{{{field}}} = '{escaped}'"
+
+def equals_formula(filters: Dict[str, str]) -> Optional[str]:
+    """Airtable formula matching every field = value pair."""
+    clauses = [_equals_clause(field, value) for field, value in filters.items()]
+    if not clauses:
+        return None
+    return clauses[0] if len(clauses) == 1 else f"AND({', '.join(clauses)})"
+
+def any_equals_formula(field: str, values: List[str]) -> str:
+    """Airtable formula matching records whose ``field`` equals any of ``values``."""
+    clauses = [_equals_clause(field, value) for value in values]
+    return clauses[0] if len(clauses) == 1 else f"OR({', '.join(clauses)})"
+
+# One read-through cache per table, shared by every DAO instance for that table
+table_caches: Dict[str, TTLCache] = {}
+
+def get_table_cache(table_name: str) -> TTLCache:
+    if table_name not in table_caches:
+        settings = get_airtable_settings()
+        table_caches[table_name] = TTLCache(
+            maxsize=settings.AIRTABLE_CACHE_SIZE,
+            ttl=settings.AIRTABLE_CACHE_TTL_SECONDS,
+            stale_ttl=settings.AIRTABLE_CACHE_STALE_SECONDS
+        )
+    return table_caches[table_name]
+
+def get_airtable_cache_stats() -> Dict[str, dict]:
+    return {name: cache.stats() for name, cache in table_caches.items()}
+
 class AirtableDAO(Generic[T]):
+    # Foreign-key fields answered by in-memory relation indexes in search()
+    relation_fields: Tuple[str, ...] = ()
+
     def __init__(self, table_name: str, model_class: Type[T]):
-        settings = get_airtable_settings()
-        self.table = Table(settings.AIRTABLE_API_KEY, settings.AIRTABLE_BASE_ID, table_name)
+        self.table_name = table_name
+        self.client = get_airtable_client()
+        self.table = self.client.table(table_name)
+        self.cache = get_table_cache(table_name)
         self.model_class = model_class
+        self.decoder = decoder_for(model_class)
+        self.bulk_concurrency = get_airtable_settings().AIRTABLE_BULK_CONCURRENCY
+        for field in self.relation_fields:
+            register_relation_index(table_name, field, self.list_all,
+                                    ttl=get_airtable_settings().AIRTABLE_CACHE_TTL_SECONDS)
 
     def _convert_value(self, value: Any) -> Any:
         """Convert special types to Airtable-compatible values"""
         if isinstance(value, HttpUrl):
             return str(value)
+        if isinstance(value, Decimal):
+            # Number fields take JSON numbers; pydantic's JSON mode would send a string
+            return float(value)
+        if isinstance(value, date):
+            return value.isoformat()
         if isinstance(value, list):
             # For list fields, convert each item to string and join with commas
             # This matches Airtable's expected format for multiple select fields
@@ -26,69 +88,286 @@ class AirtableDAO(Generic[T]):
         return {k: self._convert_value(v) for k, v in data.items() if v is not None}
 
     def _from_airtable_record(self, record: dict) -> T:
-        fields = record['fields']
-        
-        # Add missing fields with default values based on model field types
-        for field_name, field in self.model_class.model_fields.items():
-            # Skip id field as it's handled separately
-            if field_name == 'id':
-                continue
-                
-            # Handle list fields (convert comma-separated strings to lists)
-            if field_name in fields and isinstance(field.annotation, type(List)):
-                if isinstance(fields[field_name], str):
-                    fields[field_name] = [item.strip() for item in fields[field_name].split(",") if item.strip()]
-            
-            # Ensure all required fields have values
-            if field_name not in fields:
-                # Default empty list for List types
-                if isinstance(field.annotation, type(List)):
-                    fields[field_name] = []
-                # Default empty string for str types
-                elif field.annotation == str:
-                    fields[field_name] = ""
-                # Other types would need specific defaults as needed
-        
-        return self.model_class(id=record['id'], **fields)
+        return self.decoder.decode(record)
+
+    def _written(self, item: Optional[T], deleted_id: Optional[str] = None) -> None:
+        """Write-through: drop every cached list, keep the fresh record and update relation indexes."""
+        self.cache.clear()
+        if item is not None and item.id:
+            self.cache.set(("get", item.id), item)
+        for index in table_relation_indexes(self.table_name):
+            index.apply(item=item, deleted_id=deleted_id)
+
+    def _serving_mirror(self) -> Optional[AirtableMirror]:
+        """The local mirror when it is complete and fresh enough to read from."""
+        mirror = get_airtable_mirror()
+        if mirror is not None and mirror.is_fresh(self.table_name):
+            return mirror
+        return None
+
+    async def _mirror_write(self, record: Optional[dict] = None, deleted_id: Optional[str] = None) -> None:
+        # Keep the mirror read-your-writes between syncs
+        mirror = get_airtable_mirror()
+        if mirror is None:
+            return
+        if record is not None:
+            await mirror.store(self.table_name, record)
+        if deleted_id is not None:
+            await mirror.remove(self.table_name, deleted_id)
 
     async def create(self, item: T) -> T:
-        record = self.table.create(self._to_airtable_record(item))
-        return self._from_airtable_record(record)
+        record = await self.client.run(self.table.create, self._to_airtable_record(item))
+        await self._mirror_write(record=record)
+        created = self._from_airtable_record(record)
+        self._written(created)
+        return created
+
+    async def _fetch(self, id: str) -> Optional[T]:
+        mirror = self._serving_mirror()
+        if mirror is not None:
+            record = await mirror.get(self.table_name, id)
+        else:
+            record = await self.client.run(self.table.get, id)
+        return self._from_airtable_record(record) if record else None
 
     async def get_by_id(self, id: str) -> Optional[T]:
         try:
-            record = self.table.get(id)
-            return self._from_airtable_record(record) if record else None
-        except:
-            return None
+            return await self.cache.get_or_load(("get", id), lambda: self._fetch(id))
+        except AirtableError as e:
+            # Only a missing record is "not found"; throttling and outages propagate
+            if e.not_found:
+                return None
+            raise
+
+    async def _fetch_all(self, formula: str = None) -> List[T]:
+        mirror = self._serving_mirror()
+        if mirror is not None and formula is None:
+            records = await mirror.find(self.table_name)
+        else:
+            records = await self.client.run(self.table.all, formula=formula)
+        return self._convert_records(records)
+
+    def _convert_records(self, records: List[dict]) -> List[T]:
+        # Invalid records are skipped rather than failing the whole list
+        items, rejected = self.decoder.decode_many(records)
+        for record_id, error in rejected:
+            print(f"Error converting record {record_id}: {error}")
+        return items
 
     async def list_all(self, formula: str = None) -> List[T]:
-        records = self.table.all(formula=formula)
-        result = []
-        for record in records:
-            try:
-                # Try to convert the record, skip if it fails
-                item = self._from_airtable_record(record)
-                result.append(item)
-            except Exception as e:
-                print(f"Error converting record {record.get('id', 'unknown')}: {str(e)}")
-                continue
-        return result
+        # Copy so callers cannot mutate the cached list
+        return list(await self.cache.get_or_load(("all", formula), lambda: self._fetch_all(formula)))
 
     async def update(self, id: str, item: T) -> Optional[T]:
         try:
-            record = self.table.update(id, self._to_airtable_record(item))
-            return self._from_airtable_record(record)
-        except:
-            return None
+            record = await self.client.run(self.table.update, id, self._to_airtable_record(item))
+        except AirtableError as e:
+            if e.not_found:
+                return None
+            raise
+        await self._mirror_write(record=record)
+        updated = self._from_airtable_record(record)
+        self._written(updated)
+        return updated
 
     async def delete(self, id: str) -> bool:
         try:
-            self.table.delete(id)
-            return True
-        except:
-            return False
+            await self.client.run(self.table.delete, id)
+        except AirtableError as e:
+            if e.not_found:
+                return False
+            raise
+        await self._mirror_write(deleted_id=id)
+        self._written(None, deleted_id=id)
+        return True
+
+    async def _bulk(self, entries: List[Tuple[int, dict]], call: Callable[[List[dict]], Any],
+                    status: str, failures: List[BulkRecordResult]) -> BulkWriteResponse:
+        """
+        Send ``entries`` (input index, Airtable payload) in chunks of
+        ``BATCH_SIZE``, at most ``bulk_concurrency`` chunks at a time.
+
+        Airtable rejects a whole batch when one record is invalid, so a chunk
+        failing with 422 is retried record by record to pin the error on the
+        records that caused it.
+        """
+        semaphore = asyncio.Semaphore(self.bulk_concurrency)
+        written: List[dict] = []
+
+        async def send(chunk: List[Tuple[int, dict]]) -> List[BulkRecordResult]:
+            try:
+                response = await self.client.run(call, [payload for _, payload in chunk])
+            except Exception as e:
+                if len(chunk) > 1 and isinstance(e, AirtableError) and e.status_code == 422:
+                    results = []
+                    for entry in chunk:
+                        results.extend(await send([entry]))
+                    return results
+                return [BulkRecordResult(index=index, status="failed", error=str(e)) for index, _ in chunk]
+
+            # Upserts report which ids were created; plain batches return records in order
+            if isinstance(response, dict):
+                created = set(response.get("createdRecords", []))
+                records = response["records"]
+            else:
+                created = {record["id"] for record in response} if status == "created" else set()
+                records = response
+            written.extend(records)
+            return [
+                BulkRecordResult(index=index, id=record["id"],
+                                 status="created" if record["id"] in created else "updated")
+                for (index, _), record in zip(chunk, records)
+            ]
+
+        async def limited(chunk: List[Tuple[int, dict]]) -> List[BulkRecordResult]:
+            async with semaphore:
+                return await send(chunk)
+
+        chunks = [entries[i:i + BATCH_SIZE] for i in range(0, len(entries), BATCH_SIZE)]
+        results = failures + [result for chunk in await asyncio.gather(*(limited(c) for c in chunks))
+                              for result in chunk]
+        if written:
+            self._written(None)
+            for item in self._convert_records(written):
+                for index in table_relation_indexes(self.table_name):
+                    index.apply(item=item)
+            for record in written:
+                await self._mirror_write(record=record)
+
+        results.sort(key=lambda result: result.index)
+        failed = sum(1 for result in results if result.status == "failed")
+        return BulkWriteResponse(succeeded=len(results) - failed, failed=failed, results=results)
+
+    async def bulk_create(self, items: List[T]) -> BulkWriteResponse:
+        entries = [(index, self._to_airtable_record(item)) for index, item in enumerate(items)]
+        return await self._bulk(entries, self.table.batch_create, "created", [])
+
+    async def bulk_update(self, items: List[T]) -> BulkWriteResponse:
+        entries, failures = [], []
+        for index, item in enumerate(items):
+            if not item.id:
+                failures.append(BulkRecordResult(index=index, status="failed", error="id is required to update"))
+            else:
+                entries.append((index, {"id": item.id, "fields": self._to_airtable_record(item)}))
+        return await self._bulk(entries, self.table.batch_update, "updated", failures)
+
+    async def bulk_upsert(self, items: List[T], key_fields: List[str]) -> BulkWriteResponse:
+        """Update records matched by id, or else by ``key_fields``; create the rest."""
+        entries, failures = [], []
+        for index, item in enumerate(items):
+            fields = self._to_airtable_record(item)
+            missing = [field for field in key_fields if field not in fields]
+            if not item.id and missing:
+                failures.append(BulkRecordResult(index=index, status="failed",
+                                                 error=f"missing key fields: {', '.join(missing)}"))
+                continue
+            payload = {"fields": fields}
+            if item.id:
+                payload["id"] = item.id
+            entries.append((index, payload))
+        return await self._bulk(entries, lambda records: self.table.batch_upsert(records, key_fields),
+                                "updated", failures)
+
+    def _check_fields(self, names: List[str]) -> None:
+        unknown = [name for name in names if name == 'id' or name not in self.model_class.model_fields]
+        if unknown:
+            raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+
+    def _project(self, record: dict, fields: Optional[List[str]]) -> dict:
+        values = record.get('fields', {})
+        names = fields or [name for name in self.model_class.model_fields if name != 'id']
+        row = {'id': record['id']}
+        for name in names:
+            value = values.get(name)
+            # Same comma-separated list convention as _from_airtable_record
+            if isinstance(value, str) and name in self.decoder.list_fields:
+                value = split_list(value)
+            row[name] = value
+        return row
+
+    async def _fetch_page(self, limit: int, cursor: Optional[str], fields: Optional[List[str]],
+                          sort: Optional[List[str]], filters: Dict[str, str]) -> InvestorPage:
+        mirror = self._serving_mirror()
+        if mirror is not None:
+            skip = 0
+            if cursor:
+                if not cursor.startswith(MIRROR_CURSOR) or not cursor[len(MIRROR_CURSOR):].isdigit():
+                    raise ValueError("Invalid or expired cursor")
+                skip = int(cursor[len(MIRROR_CURSOR):])
+            # One extra row tells whether another page exists
+            records = await mirror.find(self.table_name, filters, fields, sort, skip, limit + 1)
+            next_cursor = f"{MIRROR_CURSOR}{skip + limit}" if len(records) > limit else None
+            records = records[:limit]
+        else:
+            if cursor and cursor.startswith(MIRROR_CURSOR):
+                raise ValueError("Invalid or expired cursor")
+            options = {'page_size': limit}
+            if cursor:
+                options['offset'] = cursor
+            if fields:
+                options['fields'] = fields
+            if sort:
+                options['sort'] = sort
+            formula = equals_formula(filters)
+            if formula:
+                options['formula'] = formula
+            response = await self.client.run(
+                self.table.api.request, 'get', self.table.url,
+                fallback=('post', f"{self.table.url}/listRecords"), options=options
+            )
+            records = response.get('records', [])
+            next_cursor = response.get('offset')
+        return InvestorPage(records=[self._project(record, fields) for record in records],
+                            next_cursor=next_cursor)
+
+    async def list_page(self, limit: int = MAX_PAGE_SIZE, cursor: Optional[str] = None,
+                        fields: Optional[List[str]] = None, sort: Optional[List[str]] = None,
+                        filters: Optional[Dict[str, str]] = None) -> InvestorPage:
+        """
+        One page of records holding only ``fields`` (all when omitted).
+
+        Maps onto Airtable's pageSize, offset, fields, sort and filterByFormula,
+        or onto the same query against the local mirror. ``sort`` names take
+        a ``-`` prefix for descending; ``filters`` are field = value matches.
+        """
+        filters = filters or {}
+        self._check_fields(list(fields or []) + [name.lstrip('-') for name in sort or []] + list(filters))
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        key = ('page', limit, cursor, tuple(fields or ()), tuple(sort or ()), tuple(sorted(filters.items())))
+        return await self.cache.get_or_load(
+            key, lambda: self._fetch_page(limit, cursor, fields, sort, filters)
+        )
 
     async def search(self, field: str, value: str) -> List[T]:
-        formula = f"{{{field}}} = '{value}'"
-        return await self.list_all(formula=formula)
+        index = get_relation_index(self.table_name, field)
+        if index is not None:
+            return await index.lookup(value)
+        mirror = self._serving_mirror()
+        if mirror is not None:
+            # Indexed equality in Mongo; list-valued link fields match any element
+            return self._convert_records(await mirror.find(self.table_name, {field: value}))
+        return await self.list_all(formula=equals_formula({field: value}))
+
+    async def search_many(self, field: str, values: List[str]) -> Dict[str, List[T]]:
+        """
+        ``search`` for several values in one lookup or query, grouped by value. A
+        record whose list-valued field holds more than one of them appears under each.
+        """
+        values = list(dict.fromkeys(values))
+        if not values:
+            return {}
+        index = get_relation_index(self.table_name, field)
+        if index is not None:
+            return await index.lookup_many(values)
+        mirror = self._serving_mirror()
+        if mirror is not None:
+            items = self._convert_records(await mirror.find(self.table_name, {field: {"$in": values}}))
+        else:
+            items = await self.list_all(formula=any_equals_formula(field, values))
+        grouped: Dict[str, List[T]] = {value: [] for value in values}
+        for item in items:
+            linked = getattr(item, field)
+            for value in linked if isinstance(linked, list) else [linked]:
+                if value in grouped:
+                    grouped[value].append(item)
+        return grouped
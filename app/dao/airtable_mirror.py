@@ -0,0 +1,223 @@
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, ReplaceOne
+from app.config.airtable_config import get_airtable_settings
+from app.dao.airtable_client import AirtableClient, get_airtable_client
+
+# Every table behind app/dao/table_daos.py
+MIRROR_TABLES = ["Companies", "Contacts", "Programs", "Events", "BlogPosts", "Sales", "FundedCompanies"]
+STATE_COLLECTION = "airtable_sync_state"
+# Incremental pulls overlap the previous one so clock skew between this
+# server and Airtable cannot drop an edit; re-applying a record is harmless
+OVERLAP = timedelta(seconds=60)
+
+
+def mirror_collection_name(table_name: str) -> str:
+    return f"airtable_{table_name.lower()}"
+
+
+def modified_since_formula(since: datetime) -> str:
+    stamp = since.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    return f"IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('{stamp}'))"
+
+
+def _utc(value: Optional[datetime]) -> Optional[datetime]:
+    # Mongo hands datetimes back naive; they were stored as UTC
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class AirtableMirror:
+    """
+    Local Mongo copy of the investor base, one ``airtable_<table>`` collection
+    per table holding the raw Airtable ``fields`` under the record id.
+
+    The first sync of a table loads everything; later syncs only pull records
+    whose ``LAST_MODIFIED_TIME()`` is after the previous sync started. Records
+    deleted directly in Airtable are invisible to incremental pulls, so a full
+    sync is repeated every ``full_sync_interval`` and removes them. Reads fall
+    back to Airtable for a table until its mirror is complete and no older
+    than ``max_lag_seconds``.
+    """
+
+    def __init__(self, db: AsyncIOMotorDatabase, client: AirtableClient,
+                 max_lag_seconds: float = 3600, full_sync_interval: timedelta = timedelta(hours=24),
+                 clock: Callable[[], datetime] = _utc_now):
+        self.db = db
+        self.client = client
+        self.max_lag_seconds = max_lag_seconds
+        self.full_sync_interval = full_sync_interval
+        self.clock = clock
+        self.state: Dict[str, dict] = {}
+
+    def collection(self, table_name: str):
+        return self.db[mirror_collection_name(table_name)]
+
+    async def load_state(self) -> None:
+        async for doc in self.db[STATE_COLLECTION].find():
+            for key in ("watermark", "last_synced_at", "last_full_sync_at", "last_error_at"):
+                doc[key] = _utc(doc.get(key))
+            self.state[doc["_id"]] = doc
+
+    async def _save_state(self, state: dict) -> None:
+        self.state[state["_id"]] = state
+        await self.db[STATE_COLLECTION].replace_one({"_id": state["_id"]}, state, upsert=True)
+
+    def _needs_full_sync(self, state: dict) -> bool:
+        last_full = state.get("last_full_sync_at")
+        return last_full is None or self.clock() - last_full >= self.full_sync_interval
+
+    async def sync_table(self, table_name: str, full: bool = False) -> dict:
+        state = dict(self.state.get(table_name) or {"_id": table_name})
+        full = full or self._needs_full_sync(state)
+        collection = self.collection(table_name)
+        table = self.client.table(table_name)
+        started_at = self.clock()
+        started = time.perf_counter()
+
+        try:
+            if full:
+                records = await self.client.run(table.all)
+            else:
+                formula = modified_since_formula(state["watermark"] - OVERLAP)
+                records = await self.client.run(table.all, formula=formula)
+            if records:
+                await collection.bulk_write([
+                    ReplaceOne({"_id": record["id"]}, self._document(record, started_at), upsert=True)
+                    for record in records
+                ], ordered=False)
+            deleted = 0
+            if full:
+                result = await collection.delete_many({"_id": {"$nin": [record["id"] for record in records]}})
+                deleted = result.deleted_count
+        except Exception as e:
+            state.update(last_error=f"{type(e).__name__}: {e}", last_error_at=started_at)
+            await self._save_state(state)
+            raise
+
+        state.update(
+            watermark=started_at,
+            last_synced_at=self.clock(),
+            last_duration_ms=round((time.perf_counter() - started) * 1000, 2),
+            last_changed=len(records),
+            last_deleted=deleted,
+            record_count=await collection.count_documents({}),
+            last_error=None,
+        )
+        if full:
+            state["last_full_sync_at"] = started_at
+        await self._save_state(state)
+        return {"table": table_name, "full": full, "changed": len(records), "deleted": deleted}
+
+    async def sync_all(self, full: bool = False, tables: Optional[List[str]] = None) -> List[dict]:
+        """
+        Sync tables one after another to stay well inside Airtable's rate
+        limit. A failing table is reported and does not stop the others.
+        """
+        results = []
+        for table_name in tables or MIRROR_TABLES:
+            try:
+                results.append(await self.sync_table(table_name, full=full))
+            except Exception as e:
+                results.append({"table": table_name, "full": full, "error": f"{type(e).__name__}: {e}"})
+        return results
+
+    def lag_seconds(self, table_name: str) -> Optional[float]:
+        last_synced = (self.state.get(table_name) or {}).get("last_synced_at")
+        if last_synced is None:
+            return None
+        return (self.clock() - last_synced).total_seconds()
+
+    def is_fresh(self, table_name: str) -> bool:
+        state = self.state.get(table_name) or {}
+        lag = self.lag_seconds(table_name)
+        return state.get("last_full_sync_at") is not None and lag is not None and lag <= self.max_lag_seconds
+
+    def status(self) -> Dict[str, dict]:
+        report = {}
+        for table_name in MIRROR_TABLES:
+            state = self.state.get(table_name) or {}
+            lag = self.lag_seconds(table_name)
+            report[table_name] = {
+                "serving": self.is_fresh(table_name),
+                "lag_seconds": round(lag, 1) if lag is not None else None,
+                "last_synced_at": state.get("last_synced_at"),
+                "last_full_sync_at": state.get("last_full_sync_at"),
+                "record_count": state.get("record_count"),
+                "last_changed": state.get("last_changed"),
+                "last_duration_ms": state.get("last_duration_ms"),
+                "last_error": state.get("last_error"),
+            }
+        return report
+
+    # Reads and write-through, in Airtable's record shape
+    def _document(self, record: dict, synced_at: datetime) -> dict:
+        return {
+            "_id": record["id"],
+            "fields": record.get("fields", {}),
+            "created_time": record.get("createdTime"),
+            "synced_at": synced_at,
+        }
+
+    def _record(self, doc: dict) -> dict:
+        return {"id": doc["_id"], "fields": doc.get("fields", {}), "createdTime": doc.get("created_time")}
+
+    async def get(self, table_name: str, record_id: str) -> Optional[dict]:
+        doc = await self.collection(table_name).find_one({"_id": record_id})
+        return self._record(doc) if doc else None
+
+    async def find(self, table_name: str, match: Optional[Dict[str, str]] = None,
+                   fields: Optional[List[str]] = None, sort: Optional[List[str]] = None,
+                   skip: int = 0, limit: Optional[int] = None) -> List[dict]:
+        """
+        Records whose fields equal ``match``; list-valued fields match any element
+        and a value may also be a query operator such as ``{"$in": [...]}``.
+        ``fields`` projects and ``sort`` orders like Airtable's list parameters.
+        """
+        query = {f"fields.{field}": value for field, value in (match or {}).items()}
+        projection = {f"fields.{field}": 1 for field in fields} if fields else None
+        # Always end on _id: skip/limit pages need a total order, even unsorted
+        # or with equal sort keys, or records repeat or drop between pages
+        order = [
+            (f"fields.{name.lstrip('-')}", DESCENDING if name.startswith("-") else ASCENDING)
+            for name in sort or []
+        ] + [("_id", ASCENDING)]
+        cursor = self.collection(table_name).find(query, projection).sort(order)
+        if skip:
+            cursor = cursor.skip(skip)
+        docs = await cursor.to_list(limit)
+        return [self._record(doc) for doc in docs]
+
+    async def store(self, table_name: str, record: dict) -> None:
+        await self.collection(table_name).replace_one(
+            {"_id": record["id"]}, self._document(record, self.clock()), upsert=True
+        )
+
+    async def remove(self, table_name: str, record_id: str) -> None:
+        await self.collection(table_name).delete_one({"_id": record_id})
+
+
+# Process-wide mirror; None until enabled, in which case DAOs read Airtable directly
+_mirror: Optional[AirtableMirror] = None
+
+def get_airtable_mirror() -> Optional[AirtableMirror]:
+    return _mirror
+
+def enable_airtable_mirror(db: AsyncIOMotorDatabase) -> AirtableMirror:
+    global _mirror
+    if _mirror is None:
+        settings = get_airtable_settings()
+        _mirror = AirtableMirror(
+            db,
+            get_airtable_client(),
+            max_lag_seconds=settings.AIRTABLE_MIRROR_MAX_LAG_SECONDS,
+            full_sync_interval=timedelta(hours=settings.AIRTABLE_MIRROR_FULL_SYNC_HOURS),
+        )
+    return _mirror
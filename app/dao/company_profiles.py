@@ -0,0 +1,46 @@
+import asyncio
+from typing import List, Optional
+from app.dao.table_daos import BlogPostDAO, CompanyDAO, ContactDAO, SaleDAO
+from app.models.models import CompanyFull, CompanyFullBatch
+
+
+class CompanyProfileLoader:
+    """
+    Companies joined with their contacts, blog posts and sales.
+
+    The company lookups and the three related-table lookups all run
+    concurrently. The related tables are answered from their relation
+    indexes, so the whole batch costs dictionary hits rather than a query
+    per company.
+    """
+
+    def __init__(self, companies: CompanyDAO, contacts: ContactDAO, blog_posts: BlogPostDAO, sales: SaleDAO):
+        self.companies = companies
+        self.contacts = contacts
+        self.blog_posts = blog_posts
+        self.sales = sales
+
+    async def load_many(self, company_ids: List[str]) -> CompanyFullBatch:
+        company_ids = list(dict.fromkeys(company_ids))
+        *found, contacts, blog_posts, sales = await asyncio.gather(
+            *(self.companies.get_by_id(company_id) for company_id in company_ids),
+            self.contacts.search_many("company", company_ids),
+            self.blog_posts.search_many("related_company", company_ids),
+            self.sales.search_many("company", company_ids),
+        )
+        batch = CompanyFullBatch(companies=[])
+        for company_id, company in zip(company_ids, found):
+            if company is None:
+                batch.missing.append(company_id)
+                continue
+            batch.companies.append(CompanyFull(
+                company=company,
+                contacts=contacts.get(company_id, []),
+                blog_posts=blog_posts.get(company_id, []),
+                sales=sales.get(company_id, []),
+            ))
+        return batch
+
+    async def load(self, company_id: str) -> Optional[CompanyFull]:
+        batch = await self.load_many([company_id])
+        return batch.companies[0] if batch.companies else None
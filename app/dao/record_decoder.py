@@ -0,0 +1,113 @@
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Generic, List, Tuple, Type, TypeVar, Union, get_args, get_origin
+from typing_extensions import Annotated
+from pydantic import BaseModel, Field, HttpUrl, TypeAdapter, ValidationError
+
+T = TypeVar('T', bound=BaseModel)
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def split_list(value: str) -> List[str]:
+    """Airtable stores list fields as comma-separated text (see AirtableDAO._convert_value)."""
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _coerce_url(value: Any) -> Any:
+    # Airtable URL cells are free text; "acme.com" should still validate
+    if isinstance(value, str):
+        value = value.strip()
+        if value and "://" not in value:
+            return f"https://{value}"
+    return value
+
+
+class RecordDecoder(Generic[T]):
+    """
+    Converts Airtable records into one model class, with the per-field
+    rules worked out once instead of re-inspecting ``model_fields`` for
+    every record.
+
+    - list fields: comma-separated text is split, a missing value becomes []
+    - ``str`` fields: a missing value becomes ""
+    - URL fields: surrounding whitespace is stripped and a bare host gets https://
+
+    ``decode_many`` validates the whole batch in one ``TypeAdapter`` pass.
+    Each row is ``Model | Any`` tried left to right, so a row the model
+    rejects comes back as its plain dict instead of failing the batch; only
+    those rows are validated again, to report why, and are skipped.
+    """
+
+    def __init__(self, model_class: Type[T]):
+        self.model_class = model_class
+        list_fields, str_fields, url_fields = [], [], []
+        for name, field in model_class.model_fields.items():
+            if name == 'id':
+                continue
+            annotation = _unwrap_optional(field.annotation)
+            if get_origin(annotation) is list:
+                list_fields.append(name)
+            elif annotation is str:
+                str_fields.append(name)
+            elif annotation is HttpUrl:
+                url_fields.append(name)
+        self.list_fields: FrozenSet[str] = frozenset(list_fields)
+        self.str_fields: Tuple[str, ...] = tuple(str_fields)
+        self.url_fields: Tuple[str, ...] = tuple(url_fields)
+        self.batch_adapter = TypeAdapter(
+            List[Annotated[Union[model_class, Any], Field(union_mode='left_to_right')]]
+        )
+
+    def prepare(self, record: dict) -> Dict[str, Any]:
+        """Plain dict ready for validation; the record itself is not modified."""
+        row = dict(record.get('fields') or {})
+        row['id'] = record['id']
+        for name in self.list_fields:
+            value = row.get(name)
+            if value is None:
+                row[name] = []
+            elif isinstance(value, str):
+                row[name] = split_list(value)
+        for name in self.str_fields:
+            row.setdefault(name, "")
+        for name in self.url_fields:
+            if name in row:
+                row[name] = _coerce_url(row[name])
+        return row
+
+    def decode(self, record: dict) -> T:
+        return self.model_class.model_validate(self.prepare(record))
+
+    def decode_many(self, records: List[dict]) -> Tuple[List[T], List[Tuple[str, str]]]:
+        """Valid models in input order, plus (record id, error) for each rejected record."""
+        rows, rejected = [], []
+        for record in records:
+            if 'id' not in record:
+                rejected.append(('unknown', "record has no id"))
+                continue
+            rows.append(self.prepare(record))
+        items = []
+        for value in self.batch_adapter.validate_python(rows):
+            if isinstance(value, self.model_class):
+                items.append(value)
+            else:
+                rejected.append((value['id'], self._error(value)))
+        return items, rejected
+
+    def _error(self, row: Dict[str, Any]) -> str:
+        try:
+            self.model_class.model_validate(row)
+        except ValidationError as e:
+            return str(e)
+        return "rejected by batch validation"
+
+
+@lru_cache(maxsize=None)
+def decoder_for(model_class: Type[T]) -> RecordDecoder[T]:
+    return RecordDecoder(model_class)
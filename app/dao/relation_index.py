@@ -0,0 +1,172 @@
+import asyncio
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+from pydantic import BaseModel
+
+
+def _keys(value: Any) -> List[str]:
+    # List-valued link fields are indexed under every element
+    if value is None or value == "":
+        return []
+    return [str(key) for key in value] if isinstance(value, list) else [str(value)]
+
+
+def deep_sizeof(obj: Any, seen: Optional[Set[int]] = None) -> int:
+    """Approximate bytes held by ``obj`` and everything it references, each object counted once."""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(key, seen) + deep_sizeof(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    elif isinstance(obj, BaseModel):
+        size += deep_sizeof(obj.__dict__, seen)
+    return size
+
+
+class RelationIndex:
+    """
+    In-memory hash index from a foreign-key field (e.g. a contact's
+    ``company``) to the records holding each value.
+
+    Built from ``loader`` (the table's cached or mirrored ``list_all``) on
+    first use and again once ``ttl`` seconds old. Writes through the DAO are
+    applied in place, so a lookup right after a write sees it without a
+    rebuild. Like ``BillStatisticsCache``, every change bumps ``version``
+    and a build that raced a change is used once but never stored.
+    """
+
+    def __init__(self, table_name: str, field: str, loader: Callable[[], Awaitable[List[BaseModel]]],
+                 ttl: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        self.table_name = table_name
+        self.field = field
+        self.loader = loader
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = asyncio.Lock()
+        # value -> {record id -> record}; record id -> values it is filed under
+        self._by_key: Optional[Dict[str, Dict[str, BaseModel]]] = None
+        self._keys_of: Dict[str, List[str]] = {}
+        self._built_at = 0.0
+        self.version = 0
+        self.builds = 0
+        self.lookups = 0
+        self.applied = 0
+
+    def _fresh(self) -> bool:
+        return self._by_key is not None and self._clock() - self._built_at < self.ttl
+
+    def _file(self, by_key: Dict[str, Dict[str, BaseModel]], keys_of: Dict[str, List[str]],
+              item: BaseModel) -> None:
+        keys = _keys(getattr(item, self.field, None))
+        keys_of[item.id] = keys
+        for key in keys:
+            by_key.setdefault(key, {})[item.id] = item
+
+    async def _index(self) -> Dict[str, Dict[str, BaseModel]]:
+        if self._fresh():
+            return self._by_key
+        async with self._lock:
+            # Another lookup may have rebuilt it while this one waited
+            if self._fresh():
+                return self._by_key
+            version = self.version
+            by_key: Dict[str, Dict[str, BaseModel]] = {}
+            keys_of: Dict[str, List[str]] = {}
+            for item in await self.loader():
+                self._file(by_key, keys_of, item)
+            self.builds += 1
+            if version == self.version:
+                self._by_key, self._keys_of, self._built_at = by_key, keys_of, self._clock()
+            return by_key
+
+    async def lookup(self, value: str) -> List[BaseModel]:
+        self.lookups += 1
+        return list((await self._index()).get(value, {}).values())
+
+    async def lookup_many(self, values: Iterable[str]) -> Dict[str, List[BaseModel]]:
+        index = await self._index()
+        grouped = {}
+        for value in values:
+            self.lookups += 1
+            grouped[value] = list(index.get(value, {}).values())
+        return grouped
+
+    def _unfile(self, record_id: str) -> None:
+        for key in self._keys_of.pop(record_id, []):
+            bucket = self._by_key.get(key)
+            if bucket is not None:
+                bucket.pop(record_id, None)
+                if not bucket:
+                    del self._by_key[key]
+
+    def apply(self, item: Optional[BaseModel] = None, deleted_id: Optional[str] = None) -> None:
+        """Reflect a created, updated or deleted record."""
+        self.version += 1
+        if self._by_key is None:
+            return
+        self.applied += 1
+        if deleted_id is not None:
+            self._unfile(deleted_id)
+        if item is not None and item.id:
+            self._unfile(item.id)
+            self._file(self._by_key, self._keys_of, item)
+
+    def invalidate(self) -> None:
+        """Drop the index; the next lookup rebuilds it from the table."""
+        self.version += 1
+        self._by_key = None
+        self._keys_of = {}
+
+    def stats(self) -> dict:
+        by_key = self._by_key or {}
+        # Records are the same objects the table cache holds; count them apart from the index itself
+        records = {record_id: item for bucket in by_key.values() for record_id, item in bucket.items()}
+        seen: Set[int] = set(id(item) for item in records.values())
+        index_bytes = deep_sizeof(by_key, seen) + deep_sizeof(self._keys_of, seen)
+        record_bytes = sum(deep_sizeof(item) for item in records.values())
+        return {
+            "built": self._by_key is not None,
+            "age_seconds": round(self._clock() - self._built_at, 1) if self._by_key is not None else None,
+            "keys": len(by_key),
+            "records": len(self._keys_of),
+            "index_bytes": index_bytes,
+            "record_bytes": record_bytes,
+            "builds": self.builds,
+            "lookups": self.lookups,
+            "applied_writes": self.applied,
+            "ttl_seconds": self.ttl,
+        }
+
+
+# Indexes by table, shared by every DAO instance for that table
+relation_indexes: Dict[str, Dict[str, RelationIndex]] = {}
+
+def get_relation_index(table_name: str, field: str) -> Optional[RelationIndex]:
+    return relation_indexes.get(table_name, {}).get(field)
+
+def register_relation_index(table_name: str, field: str, loader: Callable[[], Awaitable[List[BaseModel]]],
+                            ttl: float) -> RelationIndex:
+    indexes = relation_indexes.setdefault(table_name, {})
+    if field not in indexes:
+        indexes[field] = RelationIndex(table_name, field, loader, ttl=ttl)
+    return indexes[field]
+
+def table_relation_indexes(table_name: str) -> List[RelationIndex]:
+    return list(relation_indexes.get(table_name, {}).values())
+
+def invalidate_relation_indexes(table_name: str) -> None:
+    for index in table_relation_indexes(table_name):
+        index.invalidate()
+
+def get_relation_index_stats() -> Dict[str, dict]:
+    return {
+        f"{table_name}.{field}": index.stats()
+        for table_name, indexes in relation_indexes.items()
+        for field, index in indexes.items()
+    }
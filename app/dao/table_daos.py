@@ -9,6 +9,8 @@ class CompanyDAO(AirtableDAO[Company]):
         super().__init__("Companies", Company)
 
 class ContactDAO(AirtableDAO[Contact]):
+    relation_fields = ("company",)
+
     def __init__(self):
         super().__init__("Contacts", Contact)
 
@@ -21,10 +23,14 @@ class EventDAO(AirtableDAO[Event]):
         super().__init__("Events", Event)
 
 class BlogPostDAO(AirtableDAO[BlogPost]):
+    relation_fields = ("related_company",)
+
     def __init__(self):
         super().__init__("BlogPosts", BlogPost)
 
 class SaleDAO(AirtableDAO[Sale]):
+    relation_fields = ("company",)
+
     def __init__(self):
         super().__init__("Sales", Sale)
 
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, HttpUrl, EmailStr
-from typing import List, Optional
+from typing import Any, Dict, List, Literal, Optional
 from datetime import date
 from decimal import Decimal
 
@@ -62,3 +62,28 @@ class FundedCompany(BaseModel):
     funding_details: str
     funding_page_link: HttpUrl
     target_audience: str
+
+class BulkRecordResult(BaseModel):
+    index: int  # position in the submitted list
+    id: Optional[str] = None
+    status: Literal["created", "updated", "failed"]
+    error: Optional[str] = None
+
+class BulkWriteResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[BulkRecordResult]
+
+class InvestorPage(BaseModel):
+    records: List[Dict[str, Any]]  # id plus the requested fields
+    next_cursor: Optional[str] = None  # pass back as cursor for the next page
+
+class CompanyFull(BaseModel):
+    company: Company
+    contacts: List[Contact] = []
+    blog_posts: List[BlogPost] = []  # matched on related_company
+    sales: List[Sale] = []
+
+class CompanyFullBatch(BaseModel):
+    companies: List[CompanyFull]  # in the order the ids were requested
+    missing: List[str] = []  # requested ids with no company
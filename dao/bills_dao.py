@@ -2,12 +2,51 @@ from datetime import datetime
 from typing import List, Optional
 from decimal import Decimal
 from bson import Decimal128, ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
 from dao.mongodb import get_database
-from models.bills import Bill, Account
+from models.bills import Bill, Account, BillListAdapter, AccountListAdapter
+from services.recurrence import PERIOD_MONTHS, shift_months
+
+class BillStatisticsCache:
+    """
+    Process-wide memo of the bill statistics aggregation.
+
+    Every bill write calls ``invalidate``, which bumps ``version``; a result
+    computed under an older version is returned but never stored.
+    """
 
-class BillsDAO:
     def __init__(self):
-        self.db = get_database()
+        self.version = 0
+        self._statistics: Optional[dict] = None
+
+    def get(self) -> Optional[dict]:
+        return self._statistics
+
+    def store(self, version: int, statistics: dict) -> dict:
+        statistics = {
+            **statistics,
+            'version': version,
+            'computed_at': datetime.now().isoformat()
+        }
+        if version == self.version:
+            self._statistics = statistics
+        return statistics
+
+    def invalidate(self) -> None:
+        self.version += 1
+        self._statistics = None
+
+bill_statistics = BillStatisticsCache()
+
+def _breakdown(group_key) -> list:
+    return [
+        {'$group': {'_id': group_key, 'total_amount': {'$sum': '$amount'}, 'count': {'$sum': 1}}},
+        {'$sort': {'_id': 1}}
+    ]
+
+class BillsDAO:
+    def __init__(self, db: Optional[AsyncIOMotorDatabase] = None):
+        self.db = db if db is not None else get_database()
         self.bills_collection = self.db.bills
         self.accounts_collection = self.db.accounts
 
@@ -15,6 +54,7 @@ class BillsDAO:
         bill_dict = bill.dict(exclude={'id'})
         bill_dict['_id'] = ObjectId()
         await self.bills_collection.insert_one(bill_dict)
+        bill_statistics.invalidate()
         return str(bill_dict['_id'])
 
     async def get_bills(self, status: Optional[str] = None) -> List[Bill]:
@@ -22,12 +62,22 @@ class BillsDAO:
         if status:
             query['status'] = status
         
-        cursor = self.bills_collection.find(query)
-        bills = []
-        async for doc in cursor:
+        docs = await self.bills_collection.find(query).to_list(None)
+        for doc in docs:
             doc['id'] = str(doc.pop('_id'))
-            bills.append(Bill(**doc))
-        return bills
+        return BillListAdapter.validate_python(docs)
+
+    async def get_bills_for_window(self, start: datetime, end: datetime) -> List[Bill]:
+        """Recurring bills (any due date) plus one-off bills due in [start, end)."""
+        docs = await self.bills_collection.find({
+            '$or': [
+                {'recurring': True},
+                {'due_date': {'$gte': start, '$lt': end}}
+            ]
+        }).to_list(None)
+        for doc in docs:
+            doc['id'] = str(doc.pop('_id'))
+        return BillListAdapter.validate_python(docs)
 
     async def update_bill(self, bill_id: str, bill: Bill) -> bool:
         result = await self.bills_collection.update_one(
@@ -37,28 +87,122 @@ class BillsDAO:
                 'updated_at': datetime.now()
             }}
         )
+        bill_statistics.invalidate()
         return result.modified_count > 0
 
     async def delete_bill(self, bill_id: str) -> bool:
         result = await self.bills_collection.delete_one({'_id': ObjectId(bill_id)})
+        bill_statistics.invalidate()
         return result.deleted_count > 0
 
+    async def mark_overdue(self, now: datetime) -> int:
+        """Flip every pending bill due before ``now`` to overdue; served by status_due_date."""
+        result = await self.bills_collection.update_many(
+            {'status': 'pending', 'due_date': {'$lt': now}},
+            {'$set': {'status': 'overdue', 'updated_at': now}}
+        )
+        if result.modified_count:
+            bill_statistics.invalidate()
+        return result.modified_count
+
+    async def roll_recurring_forward(self, now: datetime) -> int:
+        """
+        Open the next occurrence of every recurring series whose latest bill
+        is paid and past due: a pending copy one period later is inserted and
+        the paid document is kept as payment history.
+
+        A series is a bill's (name, recurring_period), the period compared
+        case-insensitively. Only the latest document of a series counts, so
+        series stored one document per month are not duplicated, and a rerun
+        finds the new pending bill as the head and does nothing. A series that
+        is several periods behind advances one period per call; the new due
+        date is usually still past, so ``mark_overdue`` catches it.
+
+        The new bill records the series' ``anchor_day``, so a bill due on the
+        31st returns to the 31st after a shorter month, both here and in the
+        upcoming expansion.
+        """
+        heads = await self.bills_collection.aggregate([
+            {'$match': {'recurring': True}},
+            {'$sort': {'due_date': -1}},
+            {'$group': {
+                '_id': {'name': '$name', 'period': {'$toLower': {'$ifNull': ['$recurring_period', 'monthly']}}},
+                'head': {'$first': '$$ROOT'}
+            }},
+            {'$match': {'head.status': 'paid', 'head.due_date': {'$lt': now}}}
+        ]).to_list(None)
+
+        next_bills = []
+        for row in heads:
+            bill = row['head']
+            # The head's due_date may already be clamped (Feb 28 of a series on
+            # the 31st); shifting from the series' own day keeps it from drifting
+            day = bill.get('anchor_day') or bill['due_date'].day
+            bill.update(
+                _id=ObjectId(),
+                due_date=shift_months(bill['due_date'], PERIOD_MONTHS.get(row['_id']['period'], 1), day),
+                anchor_day=day,
+                status='pending',
+                created_at=now,
+                updated_at=now
+            )
+            next_bills.append(bill)
+        if not next_bills:
+            return 0
+        await self.bills_collection.insert_many(next_bills)
+        bill_statistics.invalidate()
+        return len(next_bills)
+
     async def get_bill_statistics(self) -> dict:
+        """
+        Totals plus breakdowns by status, category, due month and payment account.
+
+        One $facet pipeline computes everything; the result is memoized until
+        a bill write bumps the statistics version.
+        """
+        cached = bill_statistics.get()
+        if cached is not None:
+            return cached
+
+        version = bill_statistics.version
         pipeline = [
             {
-                '$group': {
-                    '_id': None,
-                    'total_amount': {'$sum': '$amount'},
-                    'count': {'$sum': 1},
-                    'avg_amount': {'$avg': '$amount'},
-                    'categories': {
-                        '$addToSet': '$category'
-                    }
+                '$facet': {
+                    'totals': [
+                        {
+                            '$group': {
+                                '_id': None,
+                                'total_amount': {'$sum': '$amount'},
+                                'count': {'$sum': 1},
+                                'avg_amount': {'$avg': '$amount'},
+                                'categories': {'$addToSet': '$category'}
+                            }
+                        }
+                    ],
+                    'by_status': _breakdown('$status'),
+                    'by_category': _breakdown('$category'),
+                    'by_due_month': _breakdown({'$dateToString': {'format': '%Y-%m', 'date': '$due_date'}}),
+                    'by_payment_account': _breakdown('$payment_account')
                 }
             }
         ]
         result = await self.bills_collection.aggregate(pipeline).to_list(1)
-        return result[0] if result else {}
+        facets = result[0] if result else {}
+
+        totals = (facets.get('totals') or [{}])[0]
+        totals.pop('_id', None)
+        statistics = {
+            'total_amount': float(totals.get('total_amount', 0)),
+            'count': totals.get('count', 0),
+            'avg_amount': float(totals.get('avg_amount') or 0),
+            'categories': sorted(totals.get('categories', []), key=str),
+        }
+        for name in ('by_status', 'by_category', 'by_due_month', 'by_payment_account'):
+            statistics[name] = [
+                {'key': row['_id'], 'total_amount': float(row['total_amount']), 'count': row['count']}
+                for row in facets.get(name, [])
+            ]
+        return bill_statistics.store(version, statistics)
 
     # Account management methods
     async def create_account(self, account: Account) -> str:
@@ -68,12 +212,10 @@ class BillsDAO:
         return str(account_dict['_id'])
 
     async def get_accounts(self) -> List[Account]:
-        cursor = self.accounts_collection.find()
-        accounts = []
-        async for doc in cursor:
+        docs = await self.accounts_collection.find().to_list(None)
+        for doc in docs:
             doc['id'] = str(doc.pop('_id'))
-            accounts.append(Account(**doc))
-        return accounts
+        return AccountListAdapter.validate_python(docs)
 
     async def update_account(self, account_id: str, account: Account) -> bool:
         result = await self.accounts_collection.update_one(
@@ -0,0 +1,16 @@
+from fastapi import Request
+from dao.bills_dao import BillsDAO
+from dao.finance_dao import FinanceDAO
+from dao.user_dao import UserDAO
+
+# FastAPI dependencies for the DAOs the server lifespan builds on the Mongo
+# client it opens; nothing here touches the database at import time.
+
+def get_finance_dao(request: Request) -> FinanceDAO:
+    return request.app.state.finance_dao
+
+def get_bills_dao(request: Request) -> BillsDAO:
+    return request.app.state.bills_dao
+
+def get_user_dao(request: Request) -> UserDAO:
+    return request.app.state.user_dao
@@ -1,72 +1,77 @@
+import asyncio
+import time
 from datetime import datetime
-from typing import List, Optional
-from decimal import Decimal
-from bson import Decimal128, ObjectId
+from typing import AsyncIterator, Awaitable, Dict, List, Optional, Tuple
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClientSession, AsyncIOMotorDatabase
 from dao.mongodb import get_database
-from models.financial_models import Income, Bill, Transaction
+from dao.finance_sync import bill_key, plan_documents, plan_operations, transaction_key
+from dao import rollups
+from dao.bills_dao import bill_statistics
+from dao.pagination import decode_cursor, encode_cursor
+from dao.months import iter_months, month_key, month_range
+from models import bills as bill_models
+from models.financial_models import (
+    Income, Bill, Transaction, TransactionPage, BillListAdapter, TransactionListAdapter,
+    CategorySpend, FinancialSummary, MonthSummary
+)
+from services.recurrence import projected_month_totals
 
 class FinanceDAO:
-    def __init__(self):
-        self.db = get_database()
+    def __init__(self, db: Optional[AsyncIOMotorDatabase] = None):
+        self.db = db if db is not None else get_database()
         self.income_collection = self.db.income
         self.bills_collection = self.db.bills
         self.transactions_collection = self.db.transactions
-
-    def _decimal_to_decimal128(self, value: Decimal) -> Decimal128:
-        return Decimal128(str(value))
-
-    def _decimal128_to_decimal(self, value: Decimal128) -> Decimal:
-        return Decimal(str(value))
+        self.rollups_collection = self.db[rollups.ROLLUP_COLLECTION]
 
     # Income operations
-    async def get_income(self) -> Optional[Income]:
-        income_data = await self.income_collection.find_one()
+    async def get_income(self, session: Optional[AsyncIOMotorClientSession] = None) -> Optional[Income]:
+        income_data = await self.income_collection.find_one(session=session)
         if not income_data:
             return None
         return Income(
-            biweekly=self._decimal128_to_decimal(income_data["biweekly"]),
-            monthly=self._decimal128_to_decimal(income_data["monthly"]),
+            biweekly=income_data["biweekly"],
+            monthly=income_data["monthly"],
             last_updated=income_data.get("last_updated", datetime.now())
         )
 
     async def update_income(self, income: Income) -> bool:
         income_dict = income.model_dump()
-        income_dict["biweekly"] = self._decimal_to_decimal128(income.biweekly)
-        income_dict["monthly"] = self._decimal_to_decimal128(income.monthly)
         result = await self.income_collection.replace_one(
             {}, income_dict, upsert=True
         )
         return result.acknowledged
 
     # Bills operations
-    async def get_bills(self) -> List[Bill]:
-        bills = []
-        async for bill in self.bills_collection.find():
-            bill["amount"] = self._decimal128_to_decimal(bill["amount"])
-            bills.append(Bill(**bill))
-        return bills
+    async def get_bills(self, session: Optional[AsyncIOMotorClientSession] = None) -> List[Bill]:
+        docs = await self.bills_collection.find(session=session).to_list(None)
+        return BillListAdapter.validate_python(docs)
 
     async def add_bill(self, bill: Bill) -> bool:
         bill_dict = bill.model_dump()
-        bill_dict["amount"] = self._decimal_to_decimal128(bill.amount)
         result = await self.bills_collection.insert_one(bill_dict)
+        bill_statistics.invalidate()
         return result.acknowledged
 
     async def update_bill(self, bill_name: str, bill: Bill) -> bool:
         bill_dict = bill.model_dump()
-        bill_dict["amount"] = self._decimal_to_decimal128(bill.amount)
         result = await self.bills_collection.replace_one(
             {"name": bill_name}, bill_dict
         )
+        bill_statistics.invalidate()
         return result.modified_count > 0
 
     async def delete_bill(self, bill_name: str) -> bool:
         result = await self.bills_collection.delete_one({"name": bill_name})
+        bill_statistics.invalidate()
         return result.deleted_count > 0
 
     # Transactions operations
-    async def get_transactions(self, start_date: Optional[datetime] = None, 
-                             end_date: Optional[datetime] = None) -> List[Transaction]:
+    def _transaction_query(self, start_date: Optional[datetime] = None,
+                           end_date: Optional[datetime] = None,
+                           category: Optional[str] = None,
+                           type: Optional[str] = None) -> dict:
         query = {}
         if start_date or end_date:
             query["date"] = {}
@@ -74,22 +79,289 @@ class FinanceDAO:
                 query["date"]["$gte"] = start_date
             if end_date:
                 query["date"]["$lte"] = end_date
+        if category:
+            query["category"] = category
+        if type:
+            query["type"] = type
+        return query
+
+    async def get_transactions(self, start_date: Optional[datetime] = None,
+                             end_date: Optional[datetime] = None,
+                             session: Optional[AsyncIOMotorClientSession] = None) -> List[Transaction]:
+        query = self._transaction_query(start_date, end_date)
+
+        docs = await self.transactions_collection.find(query, session=session).to_list(None)
+        return TransactionListAdapter.validate_python(docs)
+
+    async def get_transactions_page(self, start_date: Optional[datetime] = None,
+                                    end_date: Optional[datetime] = None,
+                                    category: Optional[str] = None,
+                                    type: Optional[str] = None,
+                                    limit: int = 50,
+                                    cursor: Optional[str] = None) -> TransactionPage:
+        """
+        Newest-first page of transactions using keyset pagination on (date, _id).
 
-        transactions = []
-        async for transaction in self.transactions_collection.find(query):
-            transaction["amount"] = self._decimal128_to_decimal(transaction["amount"])
-            transactions.append(Transaction(**transaction))
-        return transactions
+        Each page is an index range scan that starts where the previous one
+        stopped, so its cost does not grow with how deep the client pages.
+        Raises ValueError for a malformed cursor.
+        """
+        query = self._transaction_query(start_date, end_date, category, type)
+        if cursor:
+            last_date, last_id = decode_cursor(cursor)
+            query = {"$and": [query, {"$or": [
+                {"date": {"$lt": last_date}},
+                {"date": last_date, "_id": {"$lt": last_id}},
+            ]}]}
+
+        docs = await self.transactions_collection.find(query) \
+            .sort([("date", -1), ("_id", -1)]) \
+            .limit(limit + 1) \
+            .to_list(limit + 1)
+
+        next_cursor = None
+        if len(docs) > limit:
+            docs = docs[:limit]
+            next_cursor = encode_cursor(docs[-1]["date"], docs[-1]["_id"])
+
+        for doc in docs:
+            doc["id"] = str(doc.pop("_id"))
+        return TransactionPage(items=TransactionListAdapter.validate_python(docs), next_cursor=next_cursor)
+
+    async def _in_transaction(self, callback) -> None:
+        async with await self.db.client.start_session() as session:
+            await session.with_transaction(callback)
 
     async def add_transaction(self, transaction: Transaction) -> bool:
         transaction_dict = transaction.model_dump()
-        transaction_dict["amount"] = self._decimal_to_decimal128(transaction.amount)
-        result = await self.transactions_collection.insert_one(transaction_dict)
-        return result.acknowledged
+        acknowledged = False
+
+        async def apply(session):
+            nonlocal acknowledged
+            result = await self.transactions_collection.insert_one(transaction_dict, session=session)
+            await rollups.apply_rollup_updates(self.db, [], [transaction_dict], session=session)
+            acknowledged = result.acknowledged
+
+        await self._in_transaction(apply)
+        return acknowledged
 
     async def delete_transaction(self, transaction_id: str) -> bool:
-        result = await self.transactions_collection.delete_one({"_id": ObjectId(transaction_id)})
-        return result.deleted_count > 0
+        deleted = None
+
+        async def apply(session):
+            nonlocal deleted
+            deleted = await self.transactions_collection.find_one_and_delete(
+                {"_id": ObjectId(transaction_id)}, session=session)
+            if deleted:
+                await rollups.apply_rollup_updates(self.db, [deleted], [], session=session)
+
+        await self._in_transaction(apply)
+        return deleted is not None
+
+    # Raw streaming reads for exports
+    async def stream_transactions(self, start_date: Optional[datetime] = None,
+                                  end_date: Optional[datetime] = None,
+                                  batch_size: int = 500) -> AsyncIterator[dict]:
+        query = self._transaction_query(start_date, end_date)
+        cursor = self.transactions_collection.find(query, batch_size=batch_size).sort([("date", -1), ("_id", -1)])
+        async for doc in cursor:
+            yield doc
+
+    async def stream_bills(self, batch_size: int = 500) -> AsyncIterator[dict]:
+        async for doc in self.bills_collection.find({}, batch_size=batch_size):
+            yield doc
+
+    # Combined reads
+    async def _timed(self, name: str, read: Awaitable, timings: Dict[str, float]):
+        started = time.perf_counter()
+        try:
+            return await read
+        finally:
+            timings[name] = (time.perf_counter() - started) * 1000
+
+    async def get_financial_snapshot(self, snapshot: bool = False) -> Tuple[dict, Dict[str, float]]:
+        """
+        Read income, bills and transactions together.
+
+        By default the three reads are issued concurrently. With ``snapshot``
+        they run in one snapshot session so all three reflect the same
+        cluster time; a session cannot be shared by concurrent operations,
+        so that mode trades the overlap for consistency.
+        Returns the data and the per-read durations in milliseconds.
+        """
+        timings: Dict[str, float] = {}
+        if snapshot:
+            async with await self.db.client.start_session(snapshot=True) as session:
+                income = await self._timed("income", self.get_income(session=session), timings)
+                bills = await self._timed("bills", self.get_bills(session=session), timings)
+                transactions = await self._timed(
+                    "transactions", self.get_transactions(session=session), timings)
+        else:
+            income, bills, transactions = await asyncio.gather(
+                self._timed("income", self.get_income(), timings),
+                self._timed("bills", self.get_bills(), timings),
+                self._timed("transactions", self.get_transactions(), timings),
+            )
+        return {"income": income, "bills": bills, "payments": transactions}, timings
+
+    # Dashboard summary
+    async def get_summary(self, start_month: Optional[str] = None,
+                          end_month: Optional[str] = None) -> FinancialSummary:
+        """
+        Income versus bills and spending per month and per category.
+
+        Transaction totals come from monthly_rollups, so the cost grows with
+        the number of months rather than transactions; stored bills are
+        grouped by a $group behind an indexed due-date $match. Recurring
+        series only store their current bill, so the periods after it are
+        expanded with services.recurrence and added to their months; future
+        months show the recurring bills that will fall due.
+        Raises ValueError for a malformed month range.
+        """
+        start, end = month_range(start_month, end_month)
+        months = list(iter_months(start, end))
+        bills_pipeline = [
+            {"$match": {"due_date": {"$gte": start, "$lt": end}}},
+            {"$group": {
+                "_id": {"$dateToString": {"format": "%Y-%m", "date": "$due_date"}},
+                "total": {"$sum": "$amount"},
+            }},
+        ]
+
+        income, rollup_rows, bill_rows, recurring_docs = await asyncio.gather(
+            self.income_collection.find_one({}, {"monthly": 1}),
+            self.rollups_collection.find(
+                {"month": {"$gte": months[0], "$lte": months[-1]}}, {"_id": 0}
+            ).to_list(None),
+            self.bills_collection.aggregate(bills_pipeline).to_list(None),
+            self.bills_collection.find({"recurring": True}, {"_id": 0}).to_list(None),
+        )
+        monthly_income = float(income["monthly"]) if income else 0.0
+
+        transaction_totals: Dict[Tuple[str, str], float] = {}
+        category_months = []
+        for row in rollup_rows:
+            total = float(row["total"])
+            key = (row["month"], row["type"])
+            transaction_totals[key] = transaction_totals.get(key, 0.0) + total
+            if row["type"] == "expense" and row["count"]:
+                category_months.append({"month": row["month"], "category": row["category"], "total": total})
+        bill_totals = {row["_id"]: float(row["total"]) for row in bill_rows}
+        recurring = bill_models.BillListAdapter.validate_python(recurring_docs)
+        for month, total in projected_month_totals(recurring, start, end).items():
+            bill_totals[month] = bill_totals.get(month, 0.0) + total
+        return self._build_summary(start, end, monthly_income, transaction_totals, bill_totals, category_months)
+
+    def _build_summary(self, start: datetime, end: datetime, monthly_income: float,
+                       transaction_totals: Dict[Tuple[str, str], float],
+                       bill_totals: Dict[str, float],
+                       category_months: List[dict]) -> FinancialSummary:
+        months = []
+        for month in iter_months(start, end):
+            income_total = monthly_income + transaction_totals.get((month, "income"), 0.0)
+            bills_total = bill_totals.get(month, 0.0)
+            expenses_total = transaction_totals.get((month, "expense"), 0.0)
+            months.append(MonthSummary(
+                month=month,
+                income=round(income_total, 2),
+                bills=round(bills_total, 2),
+                expenses=round(expenses_total, 2),
+                remaining=round(income_total - bills_total - expenses_total, 2),
+            ))
+
+        categories: Dict[str, float] = {}
+        for row in category_months:
+            categories[row["category"]] = categories.get(row["category"], 0.0) + row["total"]
+
+        total_income = sum(m.income for m in months)
+        total_bills = sum(m.bills for m in months)
+        total_expenses = sum(m.expenses for m in months)
+        return FinancialSummary(
+            start_month=month_key(start),
+            end_month=months[-1].month,
+            monthly_income=monthly_income,
+            total_income=round(total_income, 2),
+            total_bills=round(total_bills, 2),
+            total_expenses=round(total_expenses, 2),
+            remaining=round(total_income - total_bills - total_expenses, 2),
+            months=months,
+            categories=[
+                CategorySpend(category=category, amount=round(amount, 2))
+                for category, amount in sorted(categories.items(), key=lambda item: -item[1])
+            ],
+            category_months=[
+                CategorySpend(month=row["month"], category=row["category"], amount=round(row["total"], 2))
+                for row in sorted(category_months, key=lambda row: (row["month"], -row["total"]))
+            ],
+        )
+
+    # Bulk sync
+    async def sync_financial_data(self, income: Optional[Income] = None,
+                                  bills: Optional[List[Bill]] = None,
+                                  transactions: Optional[List[Transaction]] = None) -> dict:
+        """
+        Make the stored income, bills and transactions match the submitted state.
+
+        Only the differences are written, as one ordered bulk_write per
+        collection inside a single transaction, so readers never observe a
+        partially applied save. Transaction changes move monthly_rollups by
+        the same delta in that transaction. ``None`` leaves that collection
+        untouched.
+        """
+        plans = []
+        if bills is not None:
+            plans.append((self.bills_collection, [b.model_dump() for b in bills], bill_key))
+        if transactions is not None:
+            plans.append((self.transactions_collection,
+                          [t.model_dump() for t in transactions], transaction_key))
+
+        summary = {}
+
+        async def apply(session):
+            summary.clear()
+            if income is not None:
+                await self.income_collection.replace_one({}, income.model_dump(), upsert=True, session=session)
+            for collection, desired, key in plans:
+                existing = await collection.find({}, session=session).to_list(None)
+                deletes, updates, inserts = plan_documents(existing, desired, key)
+                operations = plan_operations(deletes, updates, inserts)
+                counts = {"inserted": 0, "updated": 0, "deleted": 0}
+                if operations:
+                    result = await collection.bulk_write(operations, ordered=True, session=session)
+                    counts = {
+                        "inserted": result.inserted_count,
+                        "updated": result.modified_count,
+                        "deleted": result.deleted_count,
+                    }
+                if collection is self.transactions_collection:
+                    counts["rollups"] = await rollups.apply_rollup_updates(
+                        self.db,
+                        deletes + [current for current, _ in updates],
+                        [doc for _, doc in updates] + inserts,
+                        session=session
+                    )
+                summary[collection.name] = counts
+
+        await self._in_transaction(apply)
+        if bills is not None:
+            bill_statistics.invalidate()
+        return summary
+
+    # Monthly rollups
+    async def rebuild_rollups(self) -> int:
+        return await rollups.rebuild_rollups(self.db)
+
+    async def verify_rollups(self) -> List[dict]:
+        return await rollups.verify_rollups(self.db)
+
+    async def ensure_rollups(self) -> bool:
+        """Build monthly_rollups on first start; returns True if a rebuild ran."""
+        if await self.rollups_collection.estimated_document_count():
+            return False
+        if not await self.transactions_collection.estimated_document_count():
+            return False
+        await self.rebuild_rollups()
+        return True
 
     def close(self):
-        pass  # Connection is managed by the shared client
+        pass  # The shared client is closed by dao.mongodb.close_client()
@@ -0,0 +1,94 @@
+from collections import defaultdict
+from decimal import Decimal
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+from bson import Decimal128
+from pymongo import DeleteOne, InsertOne, UpdateOne
+
+KeyFunc = Callable[[dict], Hashable]
+
+
+def _normalize_value(value: Any) -> Any:
+    if isinstance(value, (Decimal, Decimal128)):
+        return Decimal(str(value))
+    return value
+
+
+def _normalize(doc: dict) -> dict:
+    return {k: _normalize_value(v) for k, v in doc.items() if k != "_id"}
+
+
+def _same_contents(current: dict, doc: dict) -> bool:
+    # Fields the submitted model does not declare (created_at, anchor_day, ...) do not count
+    return all(_normalize_value(current.get(k)) == v for k, v in _normalize(doc).items())
+
+
+def bill_key(doc: dict) -> Hashable:
+    return doc["name"]
+
+
+def transaction_key(doc: dict) -> Hashable:
+    return (
+        doc["date"],
+        doc["description"],
+        doc["category"],
+        _normalize_value(doc["amount"]),
+        doc["type"],
+    )
+
+
+def plan_documents(existing: List[dict], desired: List[dict],
+                   key: KeyFunc) -> Tuple[List[dict], List[Tuple[dict, dict]], List[dict]]:
+    """
+    Match ``desired`` against ``existing`` on ``key``.
+
+    Returns the stored documents to delete, the (stored, desired) pairs whose
+    contents changed, and the desired documents to insert. Duplicates are
+    matched one-to-one so the collection ends up as the exact multiset that
+    was submitted. Only the fields of the desired document are compared.
+    """
+    stored: Dict[Hashable, List[dict]] = defaultdict(list)
+    for doc in existing:
+        stored[key(doc)].append(doc)
+
+    # Identical documents are paired first, so re-saving several documents
+    # that share a key (e.g. a monthly bill series) changes none of their _ids
+    unmatched = []
+    for doc in desired:
+        matches = stored.get(key(doc), [])
+        same = next((i for i, current in enumerate(matches) if _same_contents(current, doc)), None)
+        if same is None:
+            unmatched.append(doc)
+        else:
+            matches.pop(same)
+
+    inserts, updates = [], []
+    for doc in unmatched:
+        matches = stored.get(key(doc))
+        if matches:
+            updates.append((matches.pop(0), doc))
+        else:
+            inserts.append(doc)
+
+    deletes = [doc for leftovers in stored.values() for doc in leftovers]
+    return deletes, updates, inserts
+
+
+def plan_operations(deletes: List[dict], updates: List[Tuple[dict, dict]], inserts: List[dict]) -> list:
+    """
+    Ordered bulk_write operations for a plan from ``plan_documents``.
+
+    Deletes are emitted first so unique indexes never see a transient duplicate.
+    Changed documents get a ``$set`` of the submitted fields, so fields other
+    writers keep on the stored document (created_at, anchor_day) survive.
+    """
+    return (
+        [DeleteOne({"_id": doc["_id"]}) for doc in deletes]
+        + [UpdateOne({"_id": current["_id"]}, {"$set": doc}) for current, doc in updates]
+        + [InsertOne(doc) for doc in inserts]
+    )
+
+
+def diff_documents(existing: List[dict], desired: List[dict], key: KeyFunc) -> list:
+    """Build the ordered bulk_write operations that turn ``existing`` into ``desired``."""
+    return plan_operations(*plan_documents(existing, desired, key))
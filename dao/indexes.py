@@ -0,0 +1,115 @@
+import logging
+from typing import Dict, List
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+# Every index the DAOs rely on, keyed by collection. Startup reconciles the
+# database against this registry, so new query patterns declare their index here.
+INDEXES: Dict[str, List[IndexModel]] = {
+    "users": [
+        # get_current_user / authenticate_user lookups
+        IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+    ],
+    "bills": [
+        # FinanceDAO update/delete by name and the bulk sync diff key
+        IndexModel([("name", ASCENDING)], name="name"),
+        # BillsDAO.get_bills(status) and due-date ordering within a status
+        IndexModel([("status", ASCENDING), ("due_date", ASCENDING)], name="status_due_date"),
+        # Summary pipeline's due-date range $match and the upcoming-bills window
+        IndexModel([("due_date", ASCENDING)], name="due_date"),
+        IndexModel([("recurring", ASCENDING)], name="recurring"),
+    ],
+    "transactions": [
+        # Date-range reads and keyset pagination on (date, _id)
+        IndexModel([("date", DESCENDING), ("_id", DESCENDING)], name="date_id"),
+        IndexModel([("category", ASCENDING), ("date", DESCENDING), ("_id", DESCENDING)], name="category_date_id"),
+    ],
+    # Airtable mirror: AirtableDAO.search(field, value) equality lookups
+    "airtable_contacts": [IndexModel([("fields.company", ASCENDING)], name="fields_company")],
+    "airtable_blogposts": [IndexModel([("fields.related_company", ASCENDING)], name="fields_related_company")],
+    "airtable_sales": [IndexModel([("fields.company", ASCENDING)], name="fields_company")],
+    "monthly_rollups": [
+        # $inc upsert target and month-range reads for the summary
+        IndexModel([("month", ASCENDING), ("category", ASCENDING), ("type", ASCENDING)],
+                   name="month_category_type", unique=True),
+    ],
+}
+
+
+def _same_definition(declared: dict, existing: dict) -> bool:
+    declared_keys = list(declared["key"].items())
+    existing_keys = [(field, direction) for field, direction in existing["key"]]
+    return declared_keys == existing_keys and bool(declared.get("unique")) == bool(existing.get("unique"))
+
+
+async def ensure_indexes(db: AsyncIOMotorDatabase) -> dict:
+    """
+    Create any declared index that is missing; safe to run on every startup.
+
+    An existing index with the same name but a different definition is left
+    alone and reported as a conflict rather than dropped automatically.
+    """
+    report = {"created": [], "present": [], "conflicts": [], "failed": []}
+    for collection_name, models in INDEXES.items():
+        collection = db[collection_name]
+        existing = await collection.index_information()
+        missing = []
+        for model in models:
+            declared = model.document
+            qualified = f"{collection_name}.{declared['name']}"
+            current = existing.get(declared["name"])
+            if current is None:
+                # The same key pattern may already exist under another name
+                if any(_same_definition(declared, info) for info in existing.values()):
+                    report["present"].append(qualified)
+                else:
+                    missing.append(model)
+            elif _same_definition(declared, current):
+                report["present"].append(qualified)
+            else:
+                logger.warning("Index %s exists with a different definition", qualified)
+                report["conflicts"].append(qualified)
+
+        for model in missing:
+            qualified = f"{collection_name}.{model.document['name']}"
+            try:
+                await collection.create_indexes([model])
+                report["created"].append(qualified)
+            except OperationFailure as e:
+                # e.g. duplicate emails blocking the unique index; keep serving
+                logger.error("Could not create index %s: %s", qualified, e)
+                report["failed"].append(qualified)
+    return report
+
+
+async def index_usage_report(db: AsyncIOMotorDatabase) -> dict:
+    """
+    Compare declared indexes with what exists and how often each is used.
+
+    ``$indexStats`` counters reset when the server restarts, so an index
+    listed as unused has not been used since then.
+    """
+    report = {"missing": [], "unused": [], "undeclared": [], "usage": {}}
+    for collection_name, models in INDEXES.items():
+        declared_names = {model.document["name"] for model in models}
+        stats = await db[collection_name].aggregate([{"$indexStats": {}}]).to_list(None)
+        seen = set()
+        for stat in stats:
+            name = stat["name"]
+            qualified = f"{collection_name}.{name}"
+            ops = stat.get("accesses", {}).get("ops", 0)
+            seen.add(name)
+            report["usage"][qualified] = ops
+            if name == "_id_":
+                continue
+            if name not in declared_names:
+                report["undeclared"].append(qualified)
+            elif ops == 0:
+                report["unused"].append(qualified)
+        report["missing"].extend(
+            f"{collection_name}.{name}" for name in sorted(declared_names - seen)
+        )
+    return report
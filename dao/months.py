@@ -0,0 +1,47 @@
+from datetime import datetime
+from typing import Iterator, Optional, Tuple
+
+# Widest range month_range accepts, so one request cannot ask for centuries
+MAX_MONTHS = 120
+
+
+def month_key(value: datetime) -> str:
+    return value.strftime("%Y-%m")
+
+
+def parse_month(value: str) -> datetime:
+    """Parse ``YYYY-MM`` into the first instant of that month."""
+    try:
+        return datetime.strptime(value, "%Y-%m")
+    except ValueError as e:
+        raise ValueError(f"Invalid month '{value}', expected YYYY-MM") from e
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=index // 12, month=index % 12 + 1, day=1,
+                         hour=0, minute=0, second=0, microsecond=0)
+
+
+def month_range(start: Optional[str] = None, end: Optional[str] = None,
+                default_months: int = 12) -> Tuple[datetime, datetime]:
+    """
+    Half-open [start, end) datetimes covering the months ``start`` through ``end``.
+    Defaults to the ``default_months`` months ending with the current one;
+    more than ``MAX_MONTHS`` months is a ValueError.
+    """
+    end_month = parse_month(end) if end else add_months(datetime.now(), 0)  # first of this month
+    start_month = parse_month(start) if start else add_months(end_month, 1 - default_months)
+    if start_month > end_month:
+        raise ValueError("start month must not be after end month")
+    span = (end_month.year - start_month.year) * 12 + end_month.month - start_month.month + 1
+    if span > MAX_MONTHS:
+        raise ValueError(f"Month range covers {span} months, at most {MAX_MONTHS} are allowed")
+    return start_month, add_months(end_month, 1)
+
+
+def iter_months(start: datetime, end: datetime) -> Iterator[str]:
+    current = start
+    while current < end:
+        yield month_key(current)
+        current = add_months(current, 1)
@@ -0,0 +1,21 @@
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+from bson import ObjectId
+from bson.errors import InvalidId
+
+
+def encode_cursor(date: datetime, doc_id: ObjectId) -> str:
+    """Opaque keyset cursor pointing just past the (date, _id) of the last row served."""
+    payload = json.dumps({"d": date.isoformat(), "i": str(doc_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["d"]), ObjectId(payload["i"])
+    except (ValueError, KeyError, TypeError, InvalidId) as e:
+        raise ValueError("Invalid pagination cursor") from e
@@ -0,0 +1,108 @@
+from collections import defaultdict
+from decimal import Decimal
+from typing import Dict, Iterable, List, Tuple
+from motor.motor_asyncio import AsyncIOMotorClientSession, AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from dao.months import month_key
+
+ROLLUP_COLLECTION = "monthly_rollups"
+
+RollupKey = Tuple[str, str, str]
+
+
+def rollup_key(transaction: dict) -> RollupKey:
+    return month_key(transaction["date"]), transaction["category"], transaction["type"]
+
+
+def rollup_updates(removed: Iterable[dict], added: Iterable[dict]) -> List[UpdateOne]:
+    """
+    $inc upserts that move monthly_rollups from the old transactions to the new.
+
+    Changes that cancel out within a (month, category, type) bucket are
+    dropped, so editing a description touches no rollup at all.
+    """
+    deltas: Dict[RollupKey, List] = defaultdict(lambda: [Decimal(0), 0])
+    for doc in removed:
+        delta = deltas[rollup_key(doc)]
+        delta[0] -= Decimal(doc["amount"])
+        delta[1] -= 1
+    for doc in added:
+        delta = deltas[rollup_key(doc)]
+        delta[0] += Decimal(doc["amount"])
+        delta[1] += 1
+
+    return [
+        UpdateOne(
+            {"month": month, "category": category, "type": type},
+            {"$inc": {"total": total, "count": count}},
+            upsert=True
+        )
+        for (month, category, type), (total, count) in deltas.items()
+        if total or count
+    ]
+
+
+async def apply_rollup_updates(db: AsyncIOMotorDatabase, removed: Iterable[dict], added: Iterable[dict],
+                               session: AsyncIOMotorClientSession = None) -> int:
+    operations = rollup_updates(removed, added)
+    if operations:
+        await db[ROLLUP_COLLECTION].bulk_write(operations, ordered=False, session=session)
+    return len(operations)
+
+
+def _recompute_pipeline() -> list:
+    return [
+        {"$group": {
+            "_id": {
+                "month": {"$dateToString": {"format": "%Y-%m", "date": "$date"}},
+                "category": "$category",
+                "type": "$type",
+            },
+            "total": {"$sum": "$amount"},
+            "count": {"$sum": 1},
+        }},
+        {"$project": {
+            "_id": 0,
+            "month": "$_id.month",
+            "category": "$_id.category",
+            "type": "$_id.type",
+            "total": 1,
+            "count": 1,
+        }},
+    ]
+
+
+async def rebuild_rollups(db: AsyncIOMotorDatabase) -> int:
+    """
+    Recompute monthly_rollups from every transaction.
+
+    $out swaps the collection in atomically and keeps its indexes, so
+    readers see either the old rollups or the new ones, never a partial set.
+    """
+    await db.transactions.aggregate(_recompute_pipeline() + [{"$out": ROLLUP_COLLECTION}]).to_list(None)
+    return await db[ROLLUP_COLLECTION].count_documents({})
+
+
+async def verify_rollups(db: AsyncIOMotorDatabase) -> List[dict]:
+    """Compare stored rollups with a fresh recomputation; returns the mismatches."""
+    expected = {
+        (row["month"], row["category"], row["type"]): (Decimal(row["total"]), row["count"])
+        async for row in db.transactions.aggregate(_recompute_pipeline())
+    }
+    stored = {
+        (row["month"], row["category"], row["type"]): (Decimal(row["total"]), row["count"])
+        async for row in db[ROLLUP_COLLECTION].find({}, {"_id": 0})
+    }
+
+    mismatches = []
+    for key in sorted(expected.keys() | stored.keys()):
+        want = expected.get(key, (Decimal(0), 0))
+        have = stored.get(key, (Decimal(0), 0))
+        if want != have:
+            month, category, type = key
+            mismatches.append({
+                "month": month, "category": category, "type": type,
+                "expected_total": str(want[0]), "expected_count": want[1],
+                "stored_total": str(have[0]), "stored_count": have[1],
+            })
+    return mismatches
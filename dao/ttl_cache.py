@@ -0,0 +1,172 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set, Tuple
+
+
+class TTLCache:
+    """
+    In-process LRU cache whose entries also expire after ``ttl`` seconds.
+
+    ``get_or_load`` coalesces concurrent misses for the same key onto a single
+    loader call, so a burst of parallel requests costs one lookup. The load
+    runs in its own task, so it survives the caller that started it being
+    cancelled; if the load itself is cancelled, waiters start a new one. With a
+    ``stale_ttl``, ``get_or_load`` keeps serving an expired entry for that
+    many more seconds while one background load refreshes it.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0,
+                 clock: Callable[[], float] = time.monotonic, stale_ttl: float = 0.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+        self._loading: Set[asyncio.Task] = set()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.stale_hits = 0
+        self.refresh_failures = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _lookup(self, key: Hashable, allow_stale: bool = False) -> Tuple[bool, Any, bool]:
+        """Return (found, value, stale)."""
+        entry = self._data.get(key)
+        if entry is None:
+            return False, None, False
+        expires_at, value = entry
+        now = self._clock()
+        stale = expires_at <= now
+        if stale:
+            if expires_at + self.stale_ttl <= now:
+                del self._data[key]
+                return False, None, False
+            if not allow_stale:
+                return False, None, False
+        self._data.move_to_end(key)
+        return True, value, stale
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        found, value, _ = self._lookup(key)
+        if found:
+            self.hits += 1
+            return value
+        self.misses += 1
+        return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        self._data[key] = (self._clock() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+        # A load already in flight must not repopulate the stale value
+        self._pending.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._pending.clear()
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        while True:
+            found, value, stale = self._lookup(key, allow_stale=True)
+            if found:
+                self.hits += 1
+                if stale:
+                    self.stale_hits += 1
+                    if key not in self._pending:
+                        self._start_load(key, loader, background=True)
+                return value
+
+            pending = self._pending.get(key)
+            if pending is not None:
+                self.coalesced += 1
+            else:
+                self.misses += 1
+                pending = self._start_load(key, loader)
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # Only the load was cancelled, not this caller: look the key up again
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+    def _start_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]],
+                    background: bool = False) -> asyncio.Future:
+        """
+        Run ``loader`` in its own task and return the future every caller for
+        ``key`` awaits. Cancelling the caller that started it, e.g. on a client
+        disconnect, leaves the load running for the others.
+        """
+        # Registered before the task runs so later callers see it as pending
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+
+        async def run():
+            try:
+                await self._load(key, loader, future)
+            except Exception:
+                if background:
+                    # Keep serving the stale value; the next stale hit retries
+                    self.refresh_failures += 1
+
+        def finished(task: asyncio.Task) -> None:
+            self._loading.discard(task)
+            # A task cancelled before it first ran never reached _load
+            if not future.done():
+                if self._pending.get(key) is future:
+                    del self._pending[key]
+                future.cancel()
+
+        task = asyncio.get_running_loop().create_task(run())
+        self._loading.add(task)
+        task.add_done_callback(finished)
+        return future
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]],
+                    future: asyncio.Future) -> Any:
+        try:
+            value = await loader()
+        except BaseException as exc:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+            if isinstance(exc, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(exc)
+                # Mark retrieved so an unobserved failure is not logged as lost
+                future.exception()
+            raise
+
+        if self._pending.get(key) is future:
+            del self._pending[key]
+            # Misses are not cached so a newly created entry is seen at once
+            if value is not None:
+                self.set(key, value)
+        future.set_result(value)
+        return value
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "stale_hits": self.stale_hits,
+            "refresh_failures": self.refresh_failures,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl,
+            "stale_ttl_seconds": self.stale_ttl,
+        }
@@ -1,14 +1,21 @@
+import os
 from datetime import datetime
 from typing import Optional
-from passlib.context import CryptContext
+from motor.motor_asyncio import AsyncIOMotorDatabase
 from dao.mongodb import get_database
+from dao.password_hasher import password_hasher
+from dao.ttl_cache import TTLCache
 from models.user_models import User, UserCreate
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Resolved principals keyed by email, shared by every UserDAO in the process
+user_cache = TTLCache(
+    maxsize=int(os.getenv("AUTH_USER_CACHE_SIZE", "1024")),
+    ttl=float(os.getenv("AUTH_USER_CACHE_TTL_SECONDS", "60"))
+)
 
 class UserDAO:
-    def __init__(self):
-        self.db = get_database()
+    def __init__(self, db: Optional[AsyncIOMotorDatabase] = None):
+        self.db = db if db is not None else get_database()
         self.users_collection = self.db.users
 
     async def init_admin(self):
@@ -30,8 +37,11 @@ class UserDAO:
             return User(**user_data)
         return None
 
+    async def get_cached_user(self, email: str) -> Optional[User]:
+        return await user_cache.get_or_load(email, lambda: self.get_user_by_email(email))
+
     async def create_user(self, user: UserCreate) -> User:
-        hashed_password = pwd_context.hash(user.password)
+        hashed_password = await password_hasher.hash(user.password)
         user_data = {
             "email": user.email,
             "hashed_password": hashed_password,
@@ -40,15 +50,16 @@ class UserDAO:
             "created_at": datetime.now()
         }
         await self.users_collection.insert_one(user_data)
+        user_cache.invalidate(user.email)
         return User(**user_data)
 
     async def authenticate_user(self, email: str, password: str) -> Optional[User]:
         user = await self.get_user_by_email(email)
         if not user:
             return None
-        if not pwd_context.verify(password, user.hashed_password):
+        if not await password_hasher.verify(password, user.hashed_password):
             return None
         return user
 
     def close(self):
-        pass  # Connection is managed by the shared client
+        pass  # The shared client is closed by dao.mongodb.close_client()
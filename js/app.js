@@ -12,7 +12,9 @@ let state = {
         monthly: 0
     },
     bills: [],
-    payments: []
+    payments: [],
+    // Current month from /api/finances/summary; totals are aggregated server-side
+    month: null
 };
 
 // Initialize components
@@ -85,8 +87,11 @@ function initializeApp() {
 async function loadFinancialData() {
     try {
         console.log('Fetching financial data from /api/finances...');
-        const response = await window.auth.fetchWithAuth(`${apiBaseUrl}${window.config.endpoints.finances}`);
-        
+        const [response] = await Promise.all([
+            window.auth.fetchWithAuth(`${apiBaseUrl}${window.config.endpoints.finances}`),
+            loadMonthSummary()
+        ]);
+
         if (!response.ok) {
             console.error('Server response not ok:', {
                 status: response.status,
@@ -125,6 +130,19 @@ async function loadFinancialData() {
     }
 }
 
+async function loadMonthSummary() {
+    try {
+        const response = await window.auth.fetchWithAuth(`${apiBaseUrl}${window.config.endpoints.financesSummary}`);
+        if (!response.ok) throw new Error(`Failed to load summary: ${response.status}`);
+        const summary = await response.json();
+        // The default range ends with the current month
+        state.month = summary.months[summary.months.length - 1] || null;
+    } catch (error) {
+        console.error('Error loading monthly summary:', error);
+        state.month = null;
+    }
+}
+
 function updateDashboard() {
     // Update income display
     const biweeklyIncome = document.getElementById('biweeklyIncome');
@@ -153,16 +171,15 @@ function updateDashboard() {
         `).join('');
     }
 
-    // Update total bills and progress
-    const totalBills = state.bills.reduce((sum, bill) => sum + Number(bill.amount), 0);
+    // Update total bills and progress from this month's server-side summary
+    const month = state.month || { income: 0, bills: 0 };
+    const totalBills = month.bills;
     const totalBillsElement = document.getElementById('totalBills');
     if (totalBillsElement) {
         totalBillsElement.textContent = formatCurrency(totalBills);
     }
 
-    // Calculate percentage
-    const biweeklyIncomeValue = Number(state.income.biweekly);
-    const billsPercentage = (totalBills / biweeklyIncomeValue) * 100;
+    const billsPercentage = month.income ? (totalBills / month.income) * 100 : 0;
     
     const progressBar = document.querySelector('.progress');
     if (progressBar) {
@@ -171,7 +188,7 @@ function updateDashboard() {
     
     const progressText = document.querySelector('.progress-text');
     if (progressText) {
-        progressText.textContent = `${billsPercentage.toFixed(1)}% of Biweekly Income`;
+        progressText.textContent = `${billsPercentage.toFixed(1)}% of Monthly Income`;
     }
 
     // Update payments table
@@ -432,6 +449,7 @@ async function updateFinancialData() {
         state.income = data.income || { biweekly: 0, monthly: 0 };
         state.bills = data.bills || [];
         state.payments = data.payments || [];
+        await loadMonthSummary();
         updateDashboard();
     } catch (error) {
         console.error('Error updating financial data:', error);
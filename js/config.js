@@ -15,6 +15,7 @@ const config = {
         token: '/token',  // Removed trailing slash to match FastAPI
         register: '/api/users/register',
         finances: '/api/finances',
+        financesSummary: '/api/finances/summary',
         health: '/api/health',
         bills: '/api/bills',
         billsAccounts: '/api/bills/accounts'
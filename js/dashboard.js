@@ -96,17 +96,42 @@ export class DashboardManager {
 
     async loadDashboardData() {
         try {
-            const response = await auth.fetchWithAuth(`${config.apiUrl}/api/finances`);
-            if (!response.ok) throw new Error('Failed to load dashboard data');
-            
-            const data = await response.json();
-            this.updateDashboard(data);
+            const [summaryResponse, transactionsResponse] = await Promise.all([
+                auth.fetchWithAuth(`${config.apiUrl}/api/finances/summary`),
+                auth.fetchWithAuth(`${config.apiUrl}/api/transactions?limit=10`)
+            ]);
+            if (!summaryResponse.ok || !transactionsResponse.ok) throw new Error('Failed to load dashboard data');
+
+            const summary = await summaryResponse.json();
+            const transactions = await transactionsResponse.json();
+            this.updateDashboard(this.toDashboardData(summary, transactions.items));
         } catch (error) {
             this.toast.show('Error loading dashboard data', 'error');
             console.error('Dashboard data error:', error);
         }
     }
 
+    // Totals are aggregated server-side; the dashboard shows the current month
+    toDashboardData(summary, recentTransactions) {
+        const currentMonth = summary.months[summary.months.length - 1] || {};
+        return {
+            income: { monthly: summary.monthly_income },
+            totalBills: currentMonth.bills || 0,
+            totalExpenses: currentMonth.expenses || 0,
+            cashFlow: summary.months.map(month => ({
+                date: month.month,
+                income: month.income,
+                expenses: month.bills + month.expenses
+            })),
+            expensesByCategory: summary.categories,
+            savingsProgress: summary.months.map(month => ({
+                month: month.month,
+                amount: month.remaining
+            })),
+            recentTransactions
+        };
+    }
+
     updateDashboard(data) {
         // Update statistics cards
         document.getElementById('monthlyIncome').textContent = this.formatCurrency(data.income?.monthly || 0);
@@ -1,6 +1,7 @@
 import json
 from datetime import datetime
 from app.DataAccessLayer.finance_dao import FinanceDAO
+from dao.mongodb import close_client
 from app.models.financial_models import Income, Bill, Transaction
 import asyncio
 from decimal import Decimal
@@ -50,7 +51,7 @@ async def migrate_data():
     except Exception as e:
         print(f"❌ Error during migration: {str(e)}")
     finally:
-        dao.close()
+        close_client()
 
 if __name__ == "__main__":
     asyncio.run(migrate_data())
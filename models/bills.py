@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 class Account(BaseModel):
     name: str
@@ -18,5 +18,20 @@ class Bill(BaseModel):
     payment_account: Optional[str] = None  # Reference to Account
     recurring: bool = False
     recurring_period: Optional[str] = None  # monthly, quarterly, yearly
+    anchor_day: Optional[int] = None  # Day of month the series falls on; due_date may be clamped below it
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
+
+class BillOccurrence(BaseModel):
+    bill_id: Optional[str] = None
+    name: str
+    amount: float
+    category: str
+    due_date: datetime
+    status: str
+    payment_account: Optional[str] = None
+    recurring_period: Optional[str] = None
+    projected: bool = False  # True when expanded from a recurring bill, not stored
+
+BillListAdapter = TypeAdapter(List[Bill])
+AccountListAdapter = TypeAdapter(List[Account])
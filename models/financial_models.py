@@ -1,7 +1,7 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
-from pydantic import BaseModel
+from typing import List, Optional
+from pydantic import BaseModel, TypeAdapter
 
 class Income(BaseModel):
     biweekly: Decimal
@@ -25,3 +25,35 @@ class Transaction(BaseModel):
     category: str
     amount: Decimal
     type: str  # 'income' or 'expense'
+
+# Whole-list validators; models.bills defines the same for its own Bill and Account
+BillListAdapter = TypeAdapter(List[Bill])
+TransactionListAdapter = TypeAdapter(List[Transaction])
+
+class TransactionPage(BaseModel):
+    items: List[Transaction]
+    next_cursor: Optional[str] = None
+
+class MonthSummary(BaseModel):
+    month: str
+    income: float
+    bills: float
+    expenses: float
+    remaining: float
+
+class CategorySpend(BaseModel):
+    category: str
+    amount: float
+    month: Optional[str] = None
+
+class FinancialSummary(BaseModel):
+    start_month: str
+    end_month: str
+    monthly_income: float
+    total_income: float
+    total_bills: float
+    total_expenses: float
+    remaining: float
+    months: List[MonthSummary]
+    categories: List[CategorySpend]
+    category_months: List[CategorySpend]
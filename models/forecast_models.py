@@ -0,0 +1,49 @@
+from datetime import date
+from typing import Dict, List, Literal, Optional
+from pydantic import BaseModel, Field
+
+class ScenarioAdjustment(BaseModel):
+    """
+    One what-if change applied from start_date (default: forecast start).
+
+    income_change: scale paychecks by percent (5 = a 5% raise)
+    cancel_bill: drop every occurrence of bill_name
+    recurring_flow: signed amount every period, optionally for months
+    one_time: signed amount on start_date
+    loan: amount credited on start_date, repaid monthly over months at rate (APR %)
+    """
+    kind: Literal["income_change", "cancel_bill", "recurring_flow", "one_time", "loan"]
+    start_date: Optional[date] = None
+    percent: Optional[float] = None
+    amount: Optional[float] = None
+    bill_name: Optional[str] = None
+    account: Optional[str] = None
+    period: Literal["biweekly", "monthly", "quarterly", "yearly"] = "monthly"
+    months: Optional[int] = Field(None, ge=1)
+    rate: float = 0.0
+
+class ForecastScenario(BaseModel):
+    name: str
+    adjustments: List[ScenarioAdjustment] = []
+
+class ForecastRequest(BaseModel):
+    months: int = Field(12, ge=1, le=36)
+    start_date: Optional[date] = None
+    paycheck_anchor: Optional[date] = None  # a past or upcoming payday; defaults to start_date
+    scenarios: List[ForecastScenario] = Field([], max_length=1000)
+
+class ScenarioResult(BaseModel):
+    name: str
+    ending_balances: Dict[str, float]
+    ending_total: float
+    min_total: float
+    min_total_date: date
+    first_negative_date: Optional[date] = None
+    month_end_totals: List[float]
+
+class ForecastResponse(BaseModel):
+    start_date: date
+    end_date: date
+    months: List[str]
+    accounts: List[str]
+    scenarios: List[ScenarioResult]
@@ -1,43 +1,60 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
-from models.bills import Bill, Account
+from datetime import datetime, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional
+from models.bills import Bill, BillOccurrence, Account, BillListAdapter, AccountListAdapter
 from dao.bills_dao import BillsDAO
+from dao.dependencies import get_bills_dao
 from app.auth.auth_utils import get_current_user
+from routers.responses import trusted_json
+from services.recurrence import upcoming
 
 # Remove trailing slash from prefix
 router = APIRouter(prefix="/api/bills", tags=["bills"])
-bills_dao = BillsDAO()
 
 # Remove trailing slashes from all routes
 @router.post("", response_model=str)
-async def create_bill(bill: Bill, current_user: dict = Depends(get_current_user)):
+async def create_bill(bill: Bill, bills_dao: BillsDAO = Depends(get_bills_dao), current_user: dict = Depends(get_current_user)):
     return await bills_dao.create_bill(bill)
 
 @router.get("", response_model=List[Bill])
-async def get_bills(status: str = None, current_user: dict = Depends(get_current_user)):
-    return await bills_dao.get_bills(status)
+async def get_bills(status: str = None, bills_dao: BillsDAO = Depends(get_bills_dao), current_user: dict = Depends(get_current_user)):
+    return trusted_json(await bills_dao.get_bills(status), BillListAdapter)
 
 @router.put("/{bill_id}", response_model=bool)
-async def update_bill(bill_id: str, bill: Bill, current_user: dict = Depends(get_current_user)):
+async def update_bill(bill_id: str, bill: Bill, bills_dao: BillsDAO = Depends(get_bills_dao), current_user: dict = Depends(get_current_user)):
     return await bills_dao.update_bill(bill_id, bill)
 
 @router.delete("/{bill_id}", response_model=bool)
-async def delete_bill(bill_id: str, current_user: dict = Depends(get_current_user)):
+async def delete_bill(bill_id: str, bills_dao: BillsDAO = Depends(get_bills_dao), current_user: dict = Depends(get_current_user)):
     return await bills_dao.delete_bill(bill_id)
 
 @router.get("/statistics", response_model=dict)
-async def get_bill_statistics(current_user: dict = Depends(get_current_user)):
+async def get_bill_statistics(bills_dao: BillsDAO = Depends(get_bills_dao), current_user: dict = Depends(get_current_user)):
     return await bills_dao.get_bill_statistics()
 
+@router.get("/upcoming", response_model=List[BillOccurrence])
+async def get_upcoming_bills(
+    days: int = Query(30, ge=1, le=3660),
+    limit: Optional[int] = Query(None, ge=1, le=5000),
+    include_paid: bool = False,
+    bills_dao: BillsDAO = Depends(get_bills_dao),
+    current_user: dict = Depends(get_current_user)
+):
+    # Recurring bills are expanded on the fly, nothing is stored per occurrence
+    start = datetime.now()
+    end = start + timedelta(days=days)
+    bills = await bills_dao.get_bills_for_window(start, end)
+    return upcoming(bills, start, end, limit=limit, include_paid=include_paid)
+
 # Account management endpoints - keep /accounts as it's part of the path
 @router.post("/accounts", response_model=str)
-async def create_account(account: Account, current_user: dict = Depends(get_current_user)):
+async def create_account(account: Account, bills_dao: BillsDAO = Depends(get_bills_dao), current_user: dict = Depends(get_current_user)):
     return await bills_dao.create_account(account)
 
 @router.get("/accounts", response_model=List[Account])
-async def get_accounts(current_user: dict = Depends(get_current_user)):
-    return await bills_dao.get_accounts()
+async def get_accounts(bills_dao: BillsDAO = Depends(get_bills_dao), current_user: dict = Depends(get_current_user)):
+    return trusted_json(await bills_dao.get_accounts(), AccountListAdapter)
 
 @router.put("/accounts/{account_id}", response_model=bool)
-async def update_account(account_id: str, account: Account, current_user: dict = Depends(get_current_user)):
+async def update_account(account_id: str, account: Account, bills_dao: BillsDAO = Depends(get_bills_dao), current_user: dict = Depends(get_current_user)):
     return await bills_dao.update_account(account_id, account)
@@ -0,0 +1,116 @@
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from typing import AsyncIterator, List, Optional
+from bson import Decimal128, ObjectId
+from fastapi import APIRouter, Depends, Query
+from fastapi.encoders import decimal_encoder
+from fastapi.responses import StreamingResponse
+from models.user_models import User
+from dao.finance_dao import FinanceDAO
+from dao.dependencies import get_finance_dao
+from app.auth.auth_utils import get_current_user
+
+router = APIRouter(prefix="/api/export", tags=["Export"])
+
+TRANSACTION_COLUMNS = ["id", "date", "description", "category", "amount", "type"]
+BILL_COLUMNS = [
+    "id", "name", "amount", "due_date", "category", "status",
+    "payment_account", "recurring", "recurring_period"
+]
+
+def _plain(value, csv_text: bool = False):
+    if isinstance(value, Decimal128):
+        value = value.to_decimal()
+    if isinstance(value, Decimal):
+        # NDJSON amounts are JSON numbers like every other API response; CSV keeps the exact digits
+        return str(value) if csv_text else decimal_encoder(value)
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+def _row(doc: dict, columns: List[str], csv_text: bool = False) -> dict:
+    doc["id"] = doc.pop("_id", None)
+    return {column: _plain(doc.get(column), csv_text) for column in columns}
+
+async def _encode(docs: AsyncIterator[dict], columns: List[str], format: str,
+                  batch_size: int) -> AsyncIterator[bytes]:
+    """Serialize documents as they arrive, emitting one chunk per batch."""
+    buffer = io.StringIO()
+    writer = None
+    if format == "csv":
+        writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+
+    pending = 0
+    async for doc in docs:
+        row = _row(doc, columns, csv_text=writer is not None)
+        if writer is not None:
+            writer.writerow(row)
+        else:
+            buffer.write(json.dumps(row, separators=(",", ":")))
+            buffer.write("\n")
+        pending += 1
+        if pending >= batch_size:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+async def _gzip(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+def _stream(docs: AsyncIterator[dict], columns: List[str], name: str,
+            format: str, batch_size: int, gzip: bool) -> StreamingResponse:
+    body = _encode(docs, columns, format, batch_size)
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    filename = f"{name}.{'csv' if format == 'csv' else 'ndjson'}"
+    headers = {}
+    if gzip:
+        body = _gzip(body)
+        headers["Content-Encoding"] = "gzip"
+    headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return StreamingResponse(body, media_type=media_type, headers=headers)
+
+@router.get("/transactions")
+async def export_transactions(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    batch_size: int = Query(500, ge=1, le=10000),
+    gzip: bool = False,
+    finance_dao: FinanceDAO = Depends(get_finance_dao),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Stream transactions as NDJSON or CSV straight from the database cursor
+    """
+    docs = finance_dao.stream_transactions(start_date, end_date, batch_size=batch_size)
+    return _stream(docs, TRANSACTION_COLUMNS, "transactions", format, batch_size, gzip)
+
+@router.get("/bills")
+async def export_bills(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    batch_size: int = Query(500, ge=1, le=10000),
+    gzip: bool = False,
+    finance_dao: FinanceDAO = Depends(get_finance_dao),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Stream bills as NDJSON or CSV straight from the database cursor
+    """
+    docs = finance_dao.stream_bills(batch_size=batch_size)
+    return _stream(docs, BILL_COLUMNS, "bills", format, batch_size, gzip)
@@ -0,0 +1,42 @@
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException
+from starlette.concurrency import run_in_threadpool
+from models.forecast_models import ForecastRequest, ForecastResponse
+from models.user_models import User
+from dao.bills_dao import BillsDAO
+from dao.finance_dao import FinanceDAO
+from dao.dependencies import get_bills_dao, get_finance_dao
+from app.auth.auth_utils import get_current_user
+from services.forecast import CashFlowProjection
+
+router = APIRouter(prefix="/api/forecast", tags=["Financial Data"])
+
+@router.post("", response_model=ForecastResponse)
+async def run_forecast(
+    request: ForecastRequest,
+    finance_dao: FinanceDAO = Depends(get_finance_dao),
+    bills_dao: BillsDAO = Depends(get_bills_dao),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Project daily balances per account over the next ``months`` months for the
+    baseline plus every submitted scenario. The baseline is always returned first.
+    """
+    income = await finance_dao.get_income()
+    accounts = await bills_dao.get_accounts()
+    bills = await bills_dao.get_bills()
+
+    def project() -> ForecastResponse:
+        projection = CashFlowProjection(
+            accounts, bills, income,
+            start=request.start_date or date.today(),
+            months=request.months,
+            paycheck_anchor=request.paycheck_anchor,
+        )
+        return projection.run(request.scenarios)
+
+    # Numpy work is CPU-bound; keep it off the event loop
+    try:
+        return await run_in_threadpool(project)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
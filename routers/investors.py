@@ -1,12 +1,19 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List
-from app.models.models import Company, Contact, Program, Event, BlogPost, Sale, FundedCompany
+from fastapi import APIRouter, Body, HTTPException, Depends, Query
+from typing import List, Optional, Type, Union
+from pydantic import BaseModel
+from app.models.models import (
+    Company, Contact, Program, Event, BlogPost, Sale, FundedCompany, BulkWriteResponse, InvestorPage,
+    CompanyFull, CompanyFullBatch
+)
+from app.dao.airtable_dao import AirtableDAO, MAX_PAGE_SIZE
 from app.dao.table_daos import (
     CompanyDAO, ContactDAO, ProgramDAO, EventDAO,
     BlogPostDAO, SaleDAO, FundedCompanyDAO
 )
 from models.user_models import User
 from app.auth.auth_utils import get_current_user
+from app.dao.airtable_mirror import get_airtable_mirror
+from app.dao.company_profiles import CompanyProfileLoader
 
 # Initialize DAOs
 company_dao = CompanyDAO()
@@ -16,6 +23,58 @@ event_dao = EventDAO()
 blog_dao = BlogPostDAO()
 sale_dao = SaleDAO()
 funded_company_dao = FundedCompanyDAO()
+company_profiles = CompanyProfileLoader(company_dao, contact_dao, blog_dao, sale_dao)
+
+# Ids per /companies/full request: each id is a company fetch (an Airtable call on a cache
+# miss) and carries all of its contacts, posts and sales into the response
+COMPANY_FULL_MAX_IDS = 50
+
+class ListQuery:
+    """
+    Optional paging, projection, sorting and filtering for the list routes.
+    Without any of them a list route returns every record as before.
+    """
+
+    def __init__(
+        self,
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+        cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+        fields: Optional[str] = Query(None, description="Comma-separated fields to return"),
+        sort: Optional[str] = Query(None, description="Comma-separated fields, '-' prefix for descending"),
+        filter: List[str] = Query([], description="field=value equality match, repeatable")
+    ):
+        self.limit = limit
+        self.cursor = cursor
+        self.fields = [name.strip() for name in fields.split(",") if name.strip()] if fields else None
+        self.sort = [name.strip() for name in sort.split(",") if name.strip()] if sort else None
+        self.filter = filter
+
+    @property
+    def paged(self) -> bool:
+        return any((self.limit, self.cursor, self.fields, self.sort, self.filter))
+
+    def filters(self) -> dict:
+        filters = {}
+        for expression in self.filter:
+            field, separator, value = expression.partition("=")
+            if not separator or not field.strip():
+                raise ValueError(f"Invalid filter '{expression}', expected field=value")
+            filters[field.strip()] = value
+        return filters
+
+async def list_records(dao: AirtableDAO, query: ListQuery):
+    if not query.paged:
+        return await dao.list_all()
+    try:
+        return await dao.list_page(
+            limit=query.limit or MAX_PAGE_SIZE,
+            cursor=query.cursor,
+            fields=query.fields,
+            sort=query.sort,
+            filters=query.filters()
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 # Create separate routers for each entity
 companies_router = APIRouter(tags=["VC Investors - Companies"])
@@ -31,6 +90,31 @@ funded_companies_router = APIRouter(tags=["VC Investors - Previously Funded"])
 async def create_company(company: Company, current_user: User = Depends(get_current_user)):
     return await company_dao.create(company)
 
+# Declared before /{company_id} so "full" is not taken for an id
+@companies_router.get("/full", response_model=CompanyFullBatch)
+async def get_companies_full(
+    # Optional: FastAPI 0.103 answers a missing required list query parameter with a 500
+    ids: Optional[List[str]] = Query(None, max_length=COMPANY_FULL_MAX_IDS, description="Company ids, repeatable"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Several companies with their contacts, blog posts and sales in one
+    response; ids that match no company are listed under ``missing``.
+    """
+    if not ids:
+        raise HTTPException(status_code=422, detail="At least one company id is required")
+    return await company_profiles.load_many(ids)
+
+@companies_router.get("/{company_id}/full", response_model=CompanyFull)
+async def get_company_full(company_id: str, current_user: User = Depends(get_current_user)):
+    """
+    The company with its contacts, blog posts and sales, fetched concurrently.
+    """
+    profile = await company_profiles.load(company_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="Company not found")
+    return profile
+
 @companies_router.get("/{company_id}", response_model=Company)
 async def get_company(company_id: str, current_user: User = Depends(get_current_user)):
     company = await company_dao.get_by_id(company_id)
@@ -38,9 +122,9 @@ async def get_company(company_id: str, current_user: User = Depends(get_current_
         raise HTTPException(status_code=404, detail="Company not found")
     return company
 
-@companies_router.get("", response_model=List[Company])
-async def list_companies(current_user: User = Depends(get_current_user)):
-    return await company_dao.list_all()
+@companies_router.get("", response_model=Union[List[Company], InvestorPage])
+async def list_companies(query: ListQuery = Depends(), current_user: User = Depends(get_current_user)):
+    return await list_records(company_dao, query)
 
 @companies_router.put("/{company_id}", response_model=Company)
 async def update_company(
@@ -72,9 +156,9 @@ async def get_contact(contact_id: str, current_user: User = Depends(get_current_
         raise HTTPException(status_code=404, detail="Contact not found")
     return contact
 
-@contacts_router.get("", response_model=List[Contact])
-async def list_contacts(current_user: User = Depends(get_current_user)):
-    return await contact_dao.list_all()
+@contacts_router.get("", response_model=Union[List[Contact], InvestorPage])
+async def list_contacts(query: ListQuery = Depends(), current_user: User = Depends(get_current_user)):
+    return await list_records(contact_dao, query)
 
 @contacts_router.get("/company/{company_id}", response_model=List[Contact])
 async def get_contacts_by_company(
@@ -113,9 +197,9 @@ async def get_program(program_id: str, current_user: User = Depends(get_current_
         raise HTTPException(status_code=404, detail="Program not found")
     return program
 
-@programs_router.get("", response_model=List[Program])
-async def list_programs(current_user: User = Depends(get_current_user)):
-    return await program_dao.list_all()
+@programs_router.get("", response_model=Union[List[Program], InvestorPage])
+async def list_programs(query: ListQuery = Depends(), current_user: User = Depends(get_current_user)):
+    return await list_records(program_dao, query)
 
 @programs_router.put("/{program_id}", response_model=Program)
 async def update_program(
@@ -147,9 +231,9 @@ async def get_event(event_id: str, current_user: User = Depends(get_current_user
         raise HTTPException(status_code=404, detail="Event not found")
     return event
 
-@events_router.get("", response_model=List[Event])
-async def list_events(current_user: User = Depends(get_current_user)):
-    return await event_dao.list_all()
+@events_router.get("", response_model=Union[List[Event], InvestorPage])
+async def list_events(query: ListQuery = Depends(), current_user: User = Depends(get_current_user)):
+    return await list_records(event_dao, query)
 
 @events_router.put("/{event_id}", response_model=Event)
 async def update_event(
@@ -181,9 +265,9 @@ async def get_blog_post(post_id: str, current_user: User = Depends(get_current_u
         raise HTTPException(status_code=404, detail="Blog post not found")
     return post
 
-@blog_posts_router.get("", response_model=List[BlogPost])
-async def list_blog_posts(current_user: User = Depends(get_current_user)):
-    return await blog_dao.list_all()
+@blog_posts_router.get("", response_model=Union[List[BlogPost], InvestorPage])
+async def list_blog_posts(query: ListQuery = Depends(), current_user: User = Depends(get_current_user)):
+    return await list_records(blog_dao, query)
 
 @blog_posts_router.get("/company/{company_id}", response_model=List[BlogPost])
 async def get_posts_by_company(
@@ -222,9 +306,9 @@ async def get_sale(sale_id: str, current_user: User = Depends(get_current_user))
         raise HTTPException(status_code=404, detail="Sale not found")
     return sale
 
-@sales_router.get("", response_model=List[Sale])
-async def list_sales(current_user: User = Depends(get_current_user)):
-    return await sale_dao.list_all()
+@sales_router.get("", response_model=Union[List[Sale], InvestorPage])
+async def list_sales(query: ListQuery = Depends(), current_user: User = Depends(get_current_user)):
+    return await list_records(sale_dao, query)
 
 @sales_router.get("/company/{company_id}", response_model=List[Sale])
 async def get_sales_by_company(
@@ -263,9 +347,9 @@ async def get_funded_company(company_id: str, current_user: User = Depends(get_c
         raise HTTPException(status_code=404, detail="Funded company not found")
     return company
 
-@funded_companies_router.get("", response_model=List[FundedCompany])
-async def list_funded_companies(current_user: User = Depends(get_current_user)):
-    return await funded_company_dao.list_all()
+@funded_companies_router.get("", response_model=Union[List[FundedCompany], InvestorPage])
+async def list_funded_companies(query: ListQuery = Depends(), current_user: User = Depends(get_current_user)):
+    return await list_records(funded_company_dao, query)
 
 @funded_companies_router.put("/{company_id}", response_model=FundedCompany)
 async def update_funded_company(
@@ -285,6 +369,43 @@ async def delete_funded_company(company_id: str, current_user: User = Depends(ge
         raise HTTPException(status_code=404, detail="Funded company not found")
     return {"message": "Funded company deleted successfully"}
 
+# Bulk routes: chunked into Airtable's 10-record batches, results reported per record
+BULK_MAX_RECORDS = 1000
+
+def add_bulk_routes(entity_router: APIRouter, dao: AirtableDAO, model: Type[BaseModel]) -> None:
+    @entity_router.post("/bulk", response_model=BulkWriteResponse)
+    async def bulk_create(
+        items: List[model] = Body(..., max_length=BULK_MAX_RECORDS),
+        current_user: User = Depends(get_current_user)
+    ):
+        return await dao.bulk_create(items)
+
+    @entity_router.patch("/bulk", response_model=BulkWriteResponse)
+    async def bulk_update(
+        items: List[model] = Body(..., max_length=BULK_MAX_RECORDS),
+        current_user: User = Depends(get_current_user)
+    ):
+        return await dao.bulk_update(items)
+
+    @entity_router.post("/bulk/upsert", response_model=BulkWriteResponse)
+    async def bulk_upsert(
+        items: List[model] = Body(..., max_length=BULK_MAX_RECORDS),
+        key_fields: Optional[List[str]] = Query(None, description="Fields that identify an existing record"),
+        current_user: User = Depends(get_current_user)
+    ):
+        # Checked here rather than with Query(...), see get_companies_full
+        if not key_fields:
+            raise HTTPException(status_code=422, detail="At least one key field is required")
+        return await dao.bulk_upsert(items, key_fields)
+
+add_bulk_routes(companies_router, company_dao, Company)
+add_bulk_routes(contacts_router, contact_dao, Contact)
+add_bulk_routes(programs_router, program_dao, Program)
+add_bulk_routes(events_router, event_dao, Event)
+add_bulk_routes(blog_posts_router, blog_dao, BlogPost)
+add_bulk_routes(sales_router, sale_dao, Sale)
+add_bulk_routes(funded_companies_router, funded_company_dao, FundedCompany)
+
 # Main router to include all sub-routers
 router = APIRouter(prefix="/api/investors")
 
@@ -296,3 +417,14 @@ router.include_router(events_router, prefix="/events")
 router.include_router(blog_posts_router, prefix="/blog-posts")
 router.include_router(sales_router, prefix="/sales")
 router.include_router(funded_companies_router, prefix="/funded-companies")
+
+@router.get("/mirror/status", tags=["Monitoring"])
+async def get_mirror_status(current_user: User = Depends(get_current_user)):
+    """
+    Per-table freshness of the local Airtable mirror. ``serving`` is false
+    while a table still reads from Airtable directly.
+    """
+    mirror = get_airtable_mirror()
+    if mirror is None:
+        return {"enabled": False, "tables": {}}
+    return {"enabled": True, "max_lag_seconds": mirror.max_lag_seconds, "tables": mirror.status()}
@@ -0,0 +1,31 @@
+from decimal import Decimal
+from typing import Any
+import orjson
+from fastapi.encoders import decimal_encoder
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
+
+
+def _default(value: Any) -> Any:
+    # Decimal amounts stay JSON numbers, as jsonable_encoder writes a bare Decimal
+    if isinstance(value, Decimal):
+        return decimal_encoder(value)
+    return str(value)
+
+
+def trusted_json(content: Any, adapter: TypeAdapter = None) -> Response:
+    """
+    Serialize data the DAO has already validated, in one pass through pydantic-core.
+
+    Returning a Response skips FastAPI's second validation of the result
+    against response_model; keep response_model on the route for the docs.
+    Output matches what the default ORJSONResponse writes for plain data such
+    as /api/finances: Decimals are numbers, not the strings pydantic's JSON
+    mode would write.
+    """
+    if isinstance(content, BaseModel):
+        data = content.model_dump(mode="python")
+    else:
+        data = adapter.dump_python(content, mode="python")
+    body = orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return Response(content=body, media_type=ORJSONResponse.media_type)
@@ -0,0 +1,39 @@
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional
+from models.financial_models import TransactionPage
+from models.user_models import User
+from dao.finance_dao import FinanceDAO
+from dao.dependencies import get_finance_dao
+from app.auth.auth_utils import get_current_user
+from routers.responses import trusted_json
+
+router = APIRouter(prefix="/api/transactions", tags=["Financial Data"])
+
+@router.get("", response_model=TransactionPage)
+async def list_transactions(
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    category: Optional[str] = None,
+    type: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    finance_dao: FinanceDAO = Depends(get_finance_dao),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Newest-first transactions, one page at a time.
+    Pass the returned next_cursor back as cursor to fetch the following page.
+    """
+    try:
+        page = await finance_dao.get_transactions_page(
+            start_date=start_date,
+            end_date=end_date,
+            category=category,
+            type=type,
+            limit=limit,
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return trusted_json(page)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Time GET /api/bills serialization for 5k bills, old path versus trusted path.
+
+Old: Bill(**doc) per document, then FastAPI re-validates the list against
+response_model=List[Bill] and renders it with the stdlib JSON encoder.
+New: one TypeAdapter pass over the batch, one dump to Python and one orjson
+encode with Decimals kept as numbers.
+
+    python scripts/bench_bill_serialization.py --bills 5000 --repeat 5
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from bson import ObjectId
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from models.bills import Bill, BillListAdapter
+from routers.responses import trusted_json
+
+
+def build_docs(count: int) -> List[dict]:
+    start = datetime(2024, 1, 1)
+    return [
+        {
+            "_id": ObjectId(),
+            "name": f"Bill {i}",
+            "amount": float(i % 3000) + 0.99,
+            "due_date": start + timedelta(days=i % 365),
+            "category": ("rent", "utilities", "phone", "subscriptions")[i % 4],
+            "status": ("pending", "paid", "overdue")[i % 3],
+            "payment_account": "Main Checking",
+            "recurring": i % 2 == 0,
+            "recurring_period": "monthly" if i % 2 == 0 else None,
+            "created_at": start,
+            "updated_at": start,
+        }
+        for i in range(count)
+    ]
+
+
+def fresh(docs: List[dict]) -> List[dict]:
+    # The DAO mutates documents, so each run gets its own copies
+    return [dict(doc) for doc in docs]
+
+
+async def old_path(docs: List[dict], field) -> bytes:
+    bills = []
+    for doc in docs:
+        doc["id"] = str(doc.pop("_id"))
+        bills.append(Bill(**doc))
+    content = await serialize_response(field=field, response_content=bills)
+    return JSONResponse(content).body
+
+
+async def old_path_orjson(docs: List[dict], field) -> bytes:
+    bills = []
+    for doc in docs:
+        doc["id"] = str(doc.pop("_id"))
+        bills.append(Bill(**doc))
+    content = await serialize_response(field=field, response_content=bills)
+    return ORJSONResponse(content).body
+
+
+async def trusted_path(docs: List[dict], field) -> bytes:
+    for doc in docs:
+        doc["id"] = str(doc.pop("_id"))
+    return trusted_json(BillListAdapter.validate_python(docs), BillListAdapter).body
+
+
+async def best_of(func, docs: List[dict], field, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        batch = fresh(docs)
+        started = time.perf_counter()
+        await func(batch, field)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Bill list serialization benchmark")
+    parser.add_argument("--bills", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    docs = build_docs(args.bills)
+    field = create_response_field(name="Response_get_bills", type_=List[Bill], mode="serialization")
+
+    print(f"Serializing {args.bills:,} bills (best of {args.repeat})")
+    baseline = None
+    for label, func in (
+        ("Bill(**doc) + re-validate + json", old_path),
+        ("Bill(**doc) + re-validate + orjson", old_path_orjson),
+        ("TypeAdapter + trusted_json", trusted_path),
+    ):
+        elapsed = await best_of(func, docs, field, args.repeat)
+        baseline = baseline or elapsed
+        print(f"{label:<38} {elapsed * 1000:8.2f} ms  {baseline / elapsed:5.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
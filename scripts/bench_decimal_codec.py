@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Compare decoding transactions with manual Decimal(str()) conversion against
+the Decimal codec registered on the shared database.
+
+    python scripts/bench_decimal_codec.py --rows 10000 --repeat 5
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import bson
+from bson import Decimal128, ObjectId
+from bson.codec_options import DEFAULT_CODEC_OPTIONS
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from dao.mongodb import CODEC_OPTIONS
+from models.financial_models import Transaction
+
+
+def build_payload(rows: int) -> bytes:
+    start = datetime(2024, 1, 1)
+    return b"".join(
+        bson.encode({
+            "_id": ObjectId(),
+            "id": None,
+            "date": start + timedelta(hours=i),
+            "description": f"Transaction {i}",
+            "category": ("Food", "Transportation", "Utilities", "Housing")[i % 4],
+            "amount": Decimal128(f"{(i % 5000) / 100:.2f}"),
+            "type": "expense",
+        })
+        for i in range(rows)
+    )
+
+
+def decode_manual(payload: bytes):
+    # What FinanceDAO did before: default codec, then a str() round-trip per field
+    transactions = []
+    for doc in bson.decode_all(payload, DEFAULT_CODEC_OPTIONS):
+        doc["amount"] = Decimal(str(doc["amount"]))
+        transactions.append(Transaction(**doc))
+    return transactions
+
+
+def decode_codec(payload: bytes):
+    return [Transaction(**doc) for doc in bson.decode_all(payload, CODEC_OPTIONS)]
+
+
+def decode_manual_raw(payload: bytes):
+    docs = bson.decode_all(payload, DEFAULT_CODEC_OPTIONS)
+    for doc in docs:
+        doc["amount"] = Decimal(str(doc["amount"]))
+    return docs
+
+
+def decode_codec_raw(payload: bytes):
+    return bson.decode_all(payload, CODEC_OPTIONS)
+
+
+def best_of(func, payload: bytes, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(payload)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Decimal decode micro-benchmark")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    payload = build_payload(args.rows)
+    assert decode_manual(payload) == decode_codec(payload)
+
+    print(f"Decoding {args.rows:,} transactions (best of {args.repeat})")
+    for label, func in (
+        ("manual str() round-trip, dicts", decode_manual_raw),
+        ("Decimal codec, dicts", decode_codec_raw),
+        ("manual str() round-trip, models", decode_manual),
+        ("Decimal codec, models", decode_codec),
+    ):
+        elapsed = best_of(func, payload, args.repeat)
+        print(f"{label:<34} {elapsed * 1000:8.2f} ms  {args.rows / elapsed:12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Time POST /api/forecast's projection engine: N scenarios over M months.
+
+Compares the vectorized CashFlowProjection against a straightforward
+per-scenario, per-day loop and checks both produce the same balances.
+
+    python scripts/bench_forecast.py --scenarios 500 --months 36
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+import numpy as np
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from models.bills import Account, Bill
+from models.financial_models import Income
+from models.forecast_models import ForecastScenario, ScenarioAdjustment
+from services.forecast import CashFlowProjection
+
+
+def build_inputs(bill_count: int):
+    rng = random.Random(7)
+    accounts = [
+        Account(name="Main Checking", balance=4200.0, type="checking"),
+        Account(name="Savings", balance=15000.0, type="savings"),
+        Account(name="Visa", balance=850.0, type="credit"),
+    ]
+    names = [account.name for account in accounts]
+    bills = [
+        Bill(
+            name=f"Bill {i}",
+            amount=round(rng.uniform(15, 1800), 2),
+            due_date=date(2025, 1, 1) + timedelta(days=rng.randrange(28)),
+            category=("rent", "utilities", "phone", "subscriptions")[i % 4],
+            payment_account=names[i % len(names)],
+            recurring=i % 5 != 0,
+            recurring_period=("monthly", "monthly", "quarterly", "yearly")[i % 4],
+        )
+        for i in range(bill_count)
+    ]
+    income = Income(biweekly=Decimal("3100.00"), monthly=Decimal("0"))
+    return accounts, bills, income
+
+
+def build_scenarios(count: int, bills, start: date):
+    rng = random.Random(11)
+    kinds = ("income_change", "cancel_bill", "recurring_flow", "one_time", "loan")
+    scenarios = []
+    for i in range(count):
+        adjustments = []
+        for _ in range(rng.randint(1, 4)):
+            kind = rng.choice(kinds)
+            adjustments.append(ScenarioAdjustment(
+                kind=kind,
+                start_date=start + timedelta(days=rng.randrange(365)),
+                percent=rng.uniform(-10, 10),
+                amount=rng.uniform(-500, 5000) if kind != "loan" else rng.uniform(1000, 20000),
+                bill_name=rng.choice(bills).name,
+                account=rng.choice(("Main Checking", "Savings", "Visa")),
+                period=rng.choice(("biweekly", "monthly", "quarterly")),
+                months=rng.randint(3, 24),
+                rate=rng.uniform(0, 12),
+            ))
+        scenarios.append(ForecastScenario(name=f"scenario {i}", adjustments=adjustments))
+    return scenarios
+
+
+def naive_ending_totals(projection: CashFlowProjection, scenarios) -> np.ndarray:
+    """Reference: replay every scenario day by day with plain Python loops."""
+    flows = np.diff(projection.cumulative, axis=1, prepend=0.0).tolist()
+    totals = []
+    for scenario in [ForecastScenario(name="baseline")] + list(scenarios):
+        weights = {}
+        extra = []
+        for adjustment in scenario.adjustments:
+            t = projection._day_index(adjustment.start_date)
+            if t >= projection.days:
+                continue
+            if adjustment.kind == "income_change":
+                for k in projection.income_components:
+                    weights.setdefault(k, []).append((t, (adjustment.percent or 0.0) / 100))
+            elif adjustment.kind == "cancel_bill":
+                for name, k in projection.bill_components:
+                    if name == adjustment.bill_name:
+                        weights.setdefault(k, []).append((t, -1.0))
+            else:
+                extra.append(projection._flow_row(adjustment).tolist())
+        total = float(projection.initial.sum())
+        for day in range(projection.days):
+            for k, row in enumerate(flows):
+                factor = 1.0 + sum(w for t, w in weights.get(k, ()) if day >= t)
+                total += row[day] * factor
+            for row in extra:
+                total += row[day]
+        totals.append(total)
+    return np.array(totals)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cash-flow projection benchmark")
+    parser.add_argument("--scenarios", type=int, default=500)
+    parser.add_argument("--months", type=int, default=36)
+    parser.add_argument("--bills", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-naive", action="store_true", help="only time the vectorized engine")
+    args = parser.parse_args()
+
+    start = date(2025, 1, 1)
+    accounts, bills, income = build_inputs(args.bills)
+    scenarios = build_scenarios(args.scenarios, bills, start)
+
+    timings = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        projection = CashFlowProjection(accounts, bills, income, start=start, months=args.months)
+        result = projection.run(scenarios)
+        timings.append(time.perf_counter() - started)
+    vectorized = min(timings)
+
+    print(f"{args.scenarios:,} scenarios x {args.months} months, {args.bills} bills, "
+          f"{len(accounts)} accounts (best of {args.repeat})")
+    print(f"{'vectorized engine':<20} {vectorized * 1000:9.2f} ms")
+    if args.skip_naive:
+        return
+
+    started = time.perf_counter()
+    expected = naive_ending_totals(projection, scenarios)
+    naive = time.perf_counter() - started
+    print(f"{'naive day loop':<20} {naive * 1000:9.2f} ms  {naive / vectorized:6.1f}x slower")
+
+    actual = np.array([scenario.ending_total for scenario in result.scenarios])
+    worst = float(np.abs(actual - expected).max())
+    print(f"max ending-total difference: {worst:.4f}")
+    if worst > 0.02:
+        sys.exit("vectorized and naive results disagree")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Measure health-check latency while logins are hashing passwords.
+
+In-process mode (default) compares the old inline ``pwd_context.verify`` with
+the thread-pool ``PasswordHasher`` on one event loop, which is what a single
+uvicorn worker does. With ``--url`` it drives a running server instead:
+worker threads hammer ``/token`` while ``/api/health`` is sampled.
+
+    python scripts/bench_login_load.py
+    python scripts/bench_login_load.py --url http://localhost:8000 --email admin@familydash.com --password admin123
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import threading
+import time
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from dao.password_hasher import PasswordHasher, pwd_context
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def report(label, samples):
+    print(f"{label:<34} n={len(samples):<5} "
+          f"p50={statistics.median(samples) * 1000:8.2f} ms  "
+          f"p99={percentile(samples, 99) * 1000:8.2f} ms  "
+          f"max={max(samples) * 1000:8.2f} ms")
+
+
+async def health_probe(stop: asyncio.Event, interval: float):
+    samples = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        # Anything beyond the requested sleep is time the loop was blocked
+        samples.append(time.perf_counter() - started - interval)
+    return samples
+
+
+async def run_in_process(logins: int, concurrency: int, interval: float):
+    hashed = pwd_context.hash("benchmark-password")
+    hasher = PasswordHasher(pwd_context, max_workers=concurrency, max_queue=logins)
+
+    async def inline_verify():
+        return pwd_context.verify("benchmark-password", hashed)
+
+    async def pooled_verify():
+        return await hasher.verify("benchmark-password", hashed)
+
+    for label, verify in (("inline verify", inline_verify), ("thread-pool verify", pooled_verify)):
+        stop = asyncio.Event()
+        probe = asyncio.create_task(health_probe(stop, interval))
+        await asyncio.sleep(interval * 5)
+        started = time.perf_counter()
+        await asyncio.gather(*(verify() for _ in range(logins)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        report(f"health lag / {label}", await probe)
+        print(f"{'':<34} {logins} logins in {elapsed:.2f} s")
+
+    hasher.shutdown()
+
+
+def run_against_server(url: str, email: str, password: str, logins: int, concurrency: int, interval: float):
+    import requests
+
+    stop = threading.Event()
+    health_samples = []
+    login_samples = []
+    remaining = iter(range(logins))
+    lock = threading.Lock()
+
+    def probe():
+        session = requests.Session()
+        while not stop.is_set():
+            started = time.perf_counter()
+            session.get(f"{url}/api/health", timeout=30)
+            health_samples.append(time.perf_counter() - started)
+            time.sleep(interval)
+
+    def login_worker():
+        session = requests.Session()
+        while True:
+            with lock:
+                if next(remaining, None) is None:
+                    return
+            started = time.perf_counter()
+            session.post(f"{url}/token", data={"username": email, "password": password}, timeout=60)
+            login_samples.append(time.perf_counter() - started)
+
+    probe_thread = threading.Thread(target=probe)
+    probe_thread.start()
+    time.sleep(interval * 20)
+    idle = list(health_samples)
+
+    workers = [threading.Thread(target=login_worker) for _ in range(concurrency)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    stop.set()
+    probe_thread.join()
+
+    loaded = health_samples[len(idle):]
+    report("/api/health idle", idle)
+    report("/api/health under /token", loaded)
+    report("/token", login_samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", help="Base URL of a running server; omit for the in-process comparison")
+    parser.add_argument("--email", default="admin@familydash.com")
+    parser.add_argument("--password", default="admin123")
+    parser.add_argument("--logins", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--interval", type=float, default=0.005, help="Seconds between health samples")
+    args = parser.parse_args()
+
+    if args.url:
+        run_against_server(args.url.rstrip("/"), args.email, args.password,
+                           args.logins, args.concurrency, args.interval)
+    else:
+        asyncio.run(run_in_process(args.logins, args.concurrency, args.interval))
+
+
+if __name__ == "__main__":
+    main()
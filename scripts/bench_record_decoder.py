@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Time converting raw Airtable records into the investor models.
+
+Times RecordDecoder.decode_many against the per-record, per-field loop
+AirtableDAO used before, on synthetic records for every model in
+app/models/models.py. The old loop never split comma-separated list fields
+and so rejects most Company and Event records; the speedup is measured
+against the same loop with only that check fixed, so both sides convert
+exactly the same records, and the results are checked to be equal.
+
+    python scripts/bench_record_decoder.py --records 10000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date
+from decimal import Decimal
+from typing import List, get_origin
+
+from pydantic import EmailStr, HttpUrl
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from app.dao.record_decoder import RecordDecoder
+from app.models.models import BlogPost, Company, Contact, Event, FundedCompany, Program, Sale
+
+MODELS = [Company, Contact, Program, Event, BlogPost, Sale, FundedCompany]
+
+
+def synthetic_value(annotation, name: str, i: int, rng: random.Random):
+    if get_origin(annotation) is list:
+        # Stored in Airtable as comma-separated text
+        return ", ".join(f"{name} {rng.randrange(50)}" for _ in range(rng.randint(0, 4)))
+    if annotation is HttpUrl:
+        return f"https://example.com/{name}/{i}"
+    if annotation is EmailStr:
+        return f"user{i}@example.com"
+    if annotation is Decimal:
+        return round(rng.uniform(100, 250000), 2)
+    if annotation is int:
+        return rng.randrange(10000)
+    if annotation is date:
+        return f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+    return f"{name} {i}"
+
+
+def synthetic_records(model_class, count: int, invalid_every: int) -> List[dict]:
+    """Airtable-shaped records; empty cells are left out like the API does."""
+    rng = random.Random(model_class.__name__)
+    fields = {name: field for name, field in model_class.model_fields.items() if name != 'id'}
+    records = []
+    for i in range(count):
+        values = {}
+        for name, field in fields.items():
+            value = synthetic_value(field.annotation, name, i, rng)
+            if value != "" and rng.random() > 0.05:
+                values[name] = value
+        if invalid_every and i % invalid_every == 0:
+            # A cell the model cannot accept, so both paths have to skip it
+            values[next(iter(fields))] = {"unexpected": "object"}
+        records.append({"id": f"rec{i:014d}", "createdTime": "2024-01-01T00:00:00.000Z", "fields": values})
+    return records
+
+
+def _old_list_check(annotation) -> bool:
+    # Never true for List[str]; kept to show how many records the old loop dropped
+    return isinstance(annotation, type(List))
+
+
+def _fixed_list_check(annotation) -> bool:
+    return get_origin(annotation) is list
+
+
+def legacy_convert(model_class, records: List[dict], is_list=_old_list_check) -> list:
+    """The conversion AirtableDAO used before RecordDecoder, kept for comparison."""
+    result = []
+    for record in records:
+        try:
+            fields = record['fields']
+            for field_name, field in model_class.model_fields.items():
+                if field_name == 'id':
+                    continue
+                if field_name in fields and is_list(field.annotation):
+                    if isinstance(fields[field_name], str):
+                        fields[field_name] = [item.strip() for item in fields[field_name].split(",") if item.strip()]
+                if field_name not in fields:
+                    if is_list(field.annotation):
+                        fields[field_name] = []
+                    elif field.annotation == str:
+                        fields[field_name] = ""
+            result.append(model_class(id=record['id'], **fields))
+        except Exception as e:
+            # AirtableDAO logged every rejected record, as decode_many reports it
+            str(e)
+            continue
+    return result
+
+
+def copies(records: List[dict]) -> List[dict]:
+    # The legacy loop mutates record fields in place
+    return [{**record, "fields": dict(record["fields"])} for record in records]
+
+
+def best_of(repeat: int, func):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Airtable record decoding benchmark")
+    parser.add_argument("--records", type=int, default=10000, help="synthetic records per model")
+    parser.add_argument("--invalid-every", type=int, default=100, help="make every Nth record invalid (0 for none)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{args.records:,} records per model, best of {args.repeat}; "
+          f"per-record = old loop with the list check fixed")
+    print(f"{'model':<15} {'per-record':>11} {'decoder':>10} {'speedup':>8}  converted (old loop)")
+    mismatched = []
+    for model_class in MODELS:
+        records = synthetic_records(model_class, args.records, args.invalid_every)
+        old_items = legacy_convert(model_class, copies(records))
+        baseline, baseline_items = best_of(args.repeat, lambda: legacy_convert(
+            model_class, copies(records), is_list=_fixed_list_check))
+        decoder = RecordDecoder(model_class)
+        compiled, (items, rejected) = best_of(args.repeat, lambda: decoder.decode_many(records))
+
+        print(f"{model_class.__name__:<15} {baseline * 1000:9.1f}ms {compiled * 1000:8.1f}ms "
+              f"{baseline / compiled:7.2f}x  {len(items):,} ({len(old_items):,})")
+        if items != baseline_items:
+            mismatched.append(model_class.__name__)
+
+    if mismatched:
+        sys.exit(f"decoder and per-record loop disagree for: {', '.join(mismatched)}")
+    print("✓ decoder output equals the per-record loop for every model")
+
+
+if __name__ == "__main__":
+    main()
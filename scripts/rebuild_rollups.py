@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Recompute the monthly_rollups collection from all transactions and verify it.
+
+    python scripts/rebuild_rollups.py            # rebuild, then verify
+    python scripts/rebuild_rollups.py --verify   # only report drift
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from dao import mongodb
+from dao.finance_dao import FinanceDAO
+
+
+async def main(verify_only: bool) -> int:
+    dao = FinanceDAO(mongodb.get_database())
+    try:
+        if not verify_only:
+            buckets = await dao.rebuild_rollups()
+            print(f"✓ Rebuilt monthly_rollups: {buckets} (month, category, type) buckets")
+
+        mismatches = await dao.verify_rollups()
+        if not mismatches:
+            print("✓ monthly_rollups matches transactions")
+            return 0
+
+        print(f"✗ {len(mismatches)} bucket(s) differ from transactions:")
+        for row in mismatches:
+            print(f"  {row['month']} {row['category']} ({row['type']}): "
+                  f"stored {row['stored_total']} / {row['stored_count']}, "
+                  f"expected {row['expected_total']} / {row['expected_count']}")
+        return 1
+    finally:
+        mongodb.close_client()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild and verify monthly_rollups")
+    parser.add_argument("--verify", action="store_true", help="Only compare, do not rebuild")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.verify)))
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Force a full resync of the local Airtable mirror, or show its freshness.
+
+    python scripts/resync_airtable_mirror.py                    # every table
+    python scripts/resync_airtable_mirror.py --table Companies  # one table
+    python scripts/resync_airtable_mirror.py --status           # lag only
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from dao import mongodb
+from app.dao.airtable_client import close_airtable_client
+from app.dao.airtable_mirror import MIRROR_TABLES, enable_airtable_mirror
+
+
+def print_status(mirror) -> None:
+    for table_name, row in mirror.status().items():
+        lag = f"{row['lag_seconds']:.0f}s" if row["lag_seconds"] is not None else "never synced"
+        marker = "✓" if row["serving"] else "✗"
+        error = f"  last error: {row['last_error']}" if row["last_error"] else ""
+        print(f"  {marker} {table_name:<16} lag {lag:<14} records {row['record_count'] or 0}{error}")
+
+
+async def main(tables, status_only: bool) -> int:
+    mirror = enable_airtable_mirror(mongodb.get_database())
+    try:
+        await mirror.load_state()
+        if not status_only:
+            failed = 0
+            for result in await mirror.sync_all(full=True, tables=tables):
+                if result.get("error"):
+                    failed += 1
+                    print(f"✗ {result['table']}: {result['error']}")
+                else:
+                    print(f"✓ {result['table']}: {result['changed']} records, {result['deleted']} removed")
+            if failed:
+                return 1
+        print("Mirror status:")
+        print_status(mirror)
+        return 0
+    finally:
+        close_airtable_client()
+        mongodb.close_client()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Resync the local Airtable mirror")
+    parser.add_argument("--table", action="append", choices=MIRROR_TABLES,
+                        help="Table to resync; repeat for several (default: all)")
+    parser.add_argument("--status", action="store_true", help="Only report freshness")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.table, args.status)))
@@ -1,27 +1,42 @@
-from fastapi import FastAPI, Request, HTTPException, Depends
+from fastapi import FastAPI, Request, Response, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 import logging
+import time
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 import os
 
 # Load environment variables from .env file
 load_dotenv()
 
+from dao import indexes, mongodb
+from dao.bills_dao import BillsDAO
+from dao.dependencies import get_finance_dao, get_user_dao
 from dao.finance_dao import FinanceDAO
 from dao.user_dao import UserDAO
-from models.financial_models import Income, Bill, Transaction
+from dao.password_hasher import password_hasher, PasswordHasherBusy
+from models.financial_models import Income, Bill, Transaction, FinancialSummary
 from models.user_models import UserCreate, User
 from app.auth.auth_utils import (
     create_access_token,
     get_current_user,
     get_current_active_admin,
+    get_auth_cache_stats,
     ACCESS_TOKEN_EXPIRE_MINUTES
 )
-from routers import bills, investors
+from app.dao.airtable_client import AirtableError, close_airtable_client, get_airtable_stats
+from app.dao.airtable_dao import get_airtable_cache_stats
+from app.dao.airtable_mirror import enable_airtable_mirror
+from app.dao.relation_index import get_relation_index_stats
+from app.config.airtable_config import get_airtable_settings
+from routers import bills, export, forecast, investors, transactions
+from services.airtable_sync import AirtableSyncWorker
+from services.bill_status import BillStatusScheduler
 
 # Configure logging
 logging.basicConfig(
@@ -30,10 +45,53 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The lifespan owns the Mongo client: it is created here, every DAO and
+    # background job is built on it, and it is closed on shutdown
+    logger.info("Connecting to MongoDB...")
+    await mongodb.connect()
+    database = mongodb.get_database()
+    app.state.finance_dao = FinanceDAO(database)
+    app.state.bills_dao = BillsDAO(database)
+    app.state.user_dao = UserDAO(database)
+    app.state.bill_status_scheduler = BillStatusScheduler(
+        app.state.bills_dao,
+        interval_seconds=float(os.getenv("BILL_STATUS_INTERVAL_SECONDS", "900"))
+    )
+    # Investor reads come from the local Mongo mirror once it has synced
+    airtable_mirror_interval = get_airtable_settings().AIRTABLE_MIRROR_INTERVAL_SECONDS
+    airtable_sync_worker = (
+        AirtableSyncWorker(enable_airtable_mirror(database), airtable_mirror_interval)
+        if airtable_mirror_interval > 0 else None
+    )
+
+    index_report = await indexes.ensure_indexes(database)
+    logger.info("Indexes created: %s, conflicts: %s, failed: %s",
+                index_report["created"], index_report["conflicts"], index_report["failed"])
+    if await app.state.finance_dao.ensure_rollups():
+        logger.info("Built monthly_rollups from existing transactions")
+    logger.info("Initializing admin user...")
+    await app.state.user_dao.init_admin()
+    app.state.bill_status_scheduler.start()
+    if airtable_sync_worker is not None:
+        airtable_sync_worker.start()
+    logger.info("Server startup complete")
+    yield
+    await app.state.bill_status_scheduler.stop()
+    if airtable_sync_worker is not None:
+        await airtable_sync_worker.stop()
+    password_hasher.shutdown()
+    close_airtable_client()
+    mongodb.close_client()
+    logger.info("MongoDB client closed")
+
 app = FastAPI(
     title="Baker Family Finances API",
     description="API for managing the Baker family's financial data including income and bills",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -61,25 +119,40 @@ app.add_middleware(
     expose_headers=["*"]
 )
 
-# Initialize DAOs
-finance_dao = FinanceDAO()
-user_dao = UserDAO()
-
 # Include routers
 app.include_router(bills.router)
+app.include_router(transactions.router)
+app.include_router(export.router)
+app.include_router(forecast.router)
 app.include_router(investors.router)
 
-@app.on_event("startup")
-async def startup_event():
-    logger.info("Initializing admin user...")
-    await user_dao.init_admin()
-    logger.info("Server startup complete")
+@app.exception_handler(AirtableError)
+async def airtable_error_handler(request: Request, exc: AirtableError):
+    """Report Airtable failures as upstream errors instead of a misleading 404 or 500."""
+    if exc.status_code == 429:
+        # Still rate limited after every backoff retry
+        return JSONResponse(status_code=503, content={"detail": "Airtable rate limit reached, retry shortly"},
+                            headers={"Retry-After": "30"})
+    if exc.status_code == 422:
+        return JSONResponse(status_code=400, content={"detail": f"Airtable rejected the record: {exc}"})
+    return JSONResponse(status_code=502, content={"detail": f"Airtable request failed: {exc}"})
 
 # Authentication endpoints
 @app.post("/token")
-async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends()):
+async def login_for_access_token(
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    user_dao: UserDAO = Depends(get_user_dao)
+):
     logger.info(f"Login attempt for user: {form_data.username}")
-    user = await user_dao.authenticate_user(form_data.username, form_data.password)
+    try:
+        user = await user_dao.authenticate_user(form_data.username, form_data.password)
+    except PasswordHasherBusy:
+        logger.warning("Password hashing queue full, rejecting login for: %s", form_data.username)
+        raise HTTPException(
+            status_code=503,
+            detail="Too many login attempts in progress, please retry",
+            headers={"Retry-After": "1"}
+        )
     if not user:
         logger.warning(f"Failed login attempt for user: {form_data.username}")
         raise HTTPException(
@@ -94,7 +167,11 @@ async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(
     return {"access_token": access_token, "token_type": "bearer"}
 
 @app.post("/api/users/register", response_model=User)
-async def register_user(user: UserCreate, current_user: User = Depends(get_current_active_admin)):
+async def register_user(
+    user: UserCreate,
+    user_dao: UserDAO = Depends(get_user_dao),
+    current_user: User = Depends(get_current_active_admin)
+):
     db_user = await user_dao.get_user_by_email(user.email)
     if db_user:
         raise HTTPException(status_code=400, detail="Email already registered")
@@ -132,79 +209,107 @@ async def health_check():
         }
     )
 
+@app.get("/api/metrics", tags=["Monitoring"])
+async def get_metrics(request: Request, current_user: User = Depends(get_current_user)):
+    """
+    In-process cache and performance counters
+    """
+    return {
+        "auth_cache": get_auth_cache_stats(),
+        "password_hasher": password_hasher.stats(),
+        "bill_status": request.app.state.bill_status_scheduler.stats(),
+        "airtable": {
+            "client": get_airtable_stats(),
+            "caches": get_airtable_cache_stats(),
+            "relation_indexes": get_relation_index_stats()
+        }
+    }
+
+@app.get("/api/metrics/indexes", tags=["Monitoring"])
+async def get_index_report(current_user: User = Depends(get_current_user)):
+    """
+    Declared indexes that are missing, unused or undeclared, from $indexStats
+    """
+    return await indexes.index_usage_report(mongodb.get_database())
+
 # Protected API Routes
+def format_server_timing(timings: dict) -> str:
+    return ", ".join(f"{name};dur={duration:.1f}" for name, duration in timings.items())
+
 @app.get("/api/finances", tags=["Financial Data"])
-async def get_financial_data(current_user: User = Depends(get_current_user)):
+async def get_financial_data(
+    response: Response,
+    snapshot: bool = False,
+    finance_dao: FinanceDAO = Depends(get_finance_dao),
+    current_user: User = Depends(get_current_user)
+):
     """
-    Retrieve the current financial data including income and bills
+    Retrieve the current financial data including income and bills.
+    Pass snapshot=true to read all collections at one consistent point in time.
     """
     try:
-        income = await finance_dao.get_income()
-        bills = await finance_dao.get_bills()
-        transactions = await finance_dao.get_transactions()
-        
+        started = time.perf_counter()
+        data, timings = await finance_dao.get_financial_snapshot(snapshot=snapshot)
+        timings["total"] = (time.perf_counter() - started) * 1000
+        response.headers["Server-Timing"] = format_server_timing(timings)
+
         logger.info("Financial data loaded successfully from MongoDB")
-        return {
-            "income": income,
-            "bills": bills,
-            "payments": transactions
-        }
+        return data
     except Exception as e:
         logger.error("Error loading financial data: %s", str(e))
         raise HTTPException(status_code=500, detail="Error loading financial data")
 
+@app.get("/api/finances/summary", tags=["Financial Data"], response_model=FinancialSummary)
+async def get_financial_summary(
+    start_month: Optional[str] = None,
+    end_month: Optional[str] = None,
+    finance_dao: FinanceDAO = Depends(get_finance_dao),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Income versus bills, spend per category per month and remaining budget.
+    Months are YYYY-MM and inclusive; the default is the last 12 months.
+    Income-type transactions are counted on top of the monthly income.
+    """
+    try:
+        return await finance_dao.get_summary(start_month, end_month)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @app.post("/api/finances", tags=["Financial Data"])
-async def update_financial_data(data: dict, current_user: User = Depends(get_current_user)):
+async def update_financial_data(
+    data: dict,
+    response: Response,
+    finance_dao: FinanceDAO = Depends(get_finance_dao),
+    current_user: User = Depends(get_current_user)
+):
     """
     Update the financial data with new income or bill information
     """
     try:
-        # Update income
-        if "income" in data:
-            income = Income(**data["income"])
-            await finance_dao.update_income(income)
-        
-        # Update bills
-        if "bills" in data:
-            # First, delete all existing bills
-            existing_bills = await finance_dao.get_bills()
-            for bill in existing_bills:
-                await finance_dao.delete_bill(bill.name)
-            
-            # Then add new bills
-            for bill_data in data["bills"]:
-                bill = Bill(**bill_data)
-                await finance_dao.add_bill(bill)
-        
-        # Update transactions/payments
+        income = Income(**data["income"]) if "income" in data else None
+        bills = [Bill(**bill_data) for bill_data in data["bills"]] if "bills" in data else None
+        transactions = None
         if "payments" in data:
-            # First, get and delete all existing transactions
-            existing_transactions = await finance_dao.get_transactions()
-            for trans in existing_transactions:
-                await finance_dao.delete_transaction(str(trans.id))
-            
-            # Then add new transactions
-            for payment in data["payments"]:
-                transaction = Transaction(
+            transactions = [
+                Transaction(
                     date=datetime.fromisoformat(payment["date"]),
                     description=payment["description"],
                     category=payment["category"],
                     amount=payment["amount"],
                     type="expense"
                 )
-                await finance_dao.add_transaction(transaction)
-        
+                for payment in data["payments"]
+            ]
+
+        changes = await finance_dao.sync_financial_data(income, bills, transactions)
+        logger.info("Financial data sync applied: %s", changes)
         logger.info("Financial data updated successfully in MongoDB")
-        return await get_financial_data()
+        return await get_financial_data(response, finance_dao=finance_dao, current_user=current_user)
     except Exception as e:
         logger.error("Error updating financial data: %s", str(e))
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    finance_dao.close()
-    user_dao.close()
-
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
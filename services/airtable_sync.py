@@ -0,0 +1,63 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional
+from app.dao.airtable_dao import get_table_cache
+from app.dao.airtable_mirror import AirtableMirror
+from app.dao.relation_index import invalidate_relation_indexes
+
+logger = logging.getLogger(__name__)
+
+Sleep = Callable[[float], Awaitable[None]]
+
+
+class AirtableSyncWorker:
+    """
+    Periodic in-process job that keeps the Airtable mirror current.
+
+    Loads the persisted sync state, then syncs every table each
+    ``interval_seconds``. Tables whose records changed have their read cache
+    and relation indexes cleared, so the mirror's data is visible without
+    waiting out the TTL.
+    """
+
+    def __init__(self, mirror: AirtableMirror, interval_seconds: float, sleep: Sleep = asyncio.sleep):
+        self.mirror = mirror
+        self.interval_seconds = interval_seconds
+        self.sleep = sleep
+        self._task: Optional[asyncio.Task] = None
+        self.runs = 0
+
+    async def run_once(self, full: bool = False) -> List[dict]:
+        results = await self.mirror.sync_all(full=full)
+        self.runs += 1
+        for result in results:
+            if result.get("error"):
+                logger.warning("Airtable mirror sync of %s failed: %s", result["table"], result["error"])
+            elif result["changed"] or result["deleted"]:
+                get_table_cache(result["table"]).clear()
+                invalidate_relation_indexes(result["table"])
+        return results
+
+    async def _run_forever(self) -> None:
+        await self.mirror.load_state()
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("Airtable mirror sync failed")
+            await self.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        if self.interval_seconds <= 0 or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
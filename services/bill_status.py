@@ -0,0 +1,100 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, Optional
+from dao.bills_dao import BillsDAO
+
+logger = logging.getLogger(__name__)
+
+Clock = Callable[[], datetime]
+Sleep = Callable[[float], Awaitable[None]]
+
+
+class BillStatusScheduler:
+    """
+    Periodic in-process job that keeps bill statuses current server-side.
+
+    Each run first opens the next occurrence of paid recurring bills, then
+    flips every past-due pending bill to overdue, so a new occurrence that is
+    already late is marked in the same run. ``clock`` and ``sleep`` are injectable so
+    a run can be driven at any instant without waiting on real time.
+    """
+
+    def __init__(self, bills_dao: BillsDAO, interval_seconds: float,
+                 clock: Clock = datetime.now, sleep: Sleep = asyncio.sleep):
+        self.bills_dao = bills_dao
+        self.interval_seconds = interval_seconds
+        self.clock = clock
+        self.sleep = sleep
+        self._task: Optional[asyncio.Task] = None
+        self.runs = 0
+        self.failures = 0
+        self.rolled_forward = 0
+        self.marked_overdue = 0
+        self.last_run_at: Optional[datetime] = None
+        self.last_duration_ms: Optional[float] = None
+        self.max_duration_ms = 0.0
+        self.last_result: Optional[dict] = None
+        self.last_error: Optional[str] = None
+
+    async def run_once(self) -> dict:
+        now = self.clock()
+        started = time.perf_counter()
+        try:
+            rolled = await self.bills_dao.roll_recurring_forward(now)
+            overdue = await self.bills_dao.mark_overdue(now)
+        except Exception as e:
+            self.failures += 1
+            self.last_error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self.runs += 1
+            self.last_run_at = now
+            self.last_duration_ms = (time.perf_counter() - started) * 1000
+            self.max_duration_ms = max(self.max_duration_ms, self.last_duration_ms)
+
+        self.rolled_forward += rolled
+        self.marked_overdue += overdue
+        self.last_result = {"rolled_forward": rolled, "marked_overdue": overdue}
+        return self.last_result
+
+    async def _run_forever(self) -> None:
+        while True:
+            try:
+                result = await self.run_once()
+                if result["rolled_forward"] or result["marked_overdue"]:
+                    logger.info("Bill status run: %s", result)
+            except Exception:
+                logger.exception("Bill status run failed")
+            await self.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        if self.interval_seconds <= 0 or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "running": self._task is not None,
+            "interval_seconds": self.interval_seconds,
+            "runs": self.runs,
+            "failures": self.failures,
+            "rolled_forward": self.rolled_forward,
+            "marked_overdue": self.marked_overdue,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_duration_ms": round(self.last_duration_ms, 2) if self.last_duration_ms is not None else None,
+            "max_duration_ms": round(self.max_duration_ms, 2),
+            "last_result": self.last_result,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,144 @@
+import heapq
+from calendar import monthrange
+from datetime import datetime
+from itertools import chain, islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from models.bills import Bill, BillOccurrence
+
+PERIOD_MONTHS = {"monthly": 1, "quarterly": 3, "yearly": 12}
+
+
+def shift_months(anchor: datetime, months: int, day: Optional[int] = None) -> datetime:
+    """
+    Move ``anchor`` by whole months, clamping the day (Jan 31 -> Feb 28).
+
+    ``day`` overrides ``anchor.day``, so a date that was already clamped
+    (Feb 28 of a series on the 31st) lands back on Mar 31.
+    """
+    index = anchor.year * 12 + anchor.month - 1 + months
+    year, month = divmod(index, 12)
+    month += 1
+    return anchor.replace(year=year, month=month, day=min(day or anchor.day, monthrange(year, month)[1]))
+
+
+def period_months(bill: Bill) -> Optional[int]:
+    if not bill.recurring:
+        return None
+    return PERIOD_MONTHS.get((bill.recurring_period or "monthly").lower())
+
+
+def _occurrence(bill: Bill, due_date: datetime, projected: bool) -> BillOccurrence:
+    return BillOccurrence(
+        bill_id=bill.id,
+        name=bill.name,
+        amount=bill.amount,
+        category=bill.category,
+        due_date=due_date,
+        status="pending" if projected else bill.status,
+        payment_account=bill.payment_account,
+        recurring_period=bill.recurring_period if bill.recurring else None,
+        projected=projected,
+    )
+
+
+def occurrences(bill: Bill, start: datetime, end: Optional[datetime] = None) -> Iterator[BillOccurrence]:
+    """
+    Lazily yield a bill's due dates in [start, end), in order; ``end=None`` never stops.
+
+    The stored due_date is the first occurrence; later ones fall on the
+    series' ``anchor_day`` when it is set. Recurring bills jump straight to
+    the first period on or after ``start`` instead of stepping from the
+    anchor, so a far-off window costs the same as a near one.
+    """
+    step = period_months(bill)
+    anchor = bill.due_date
+    day = bill.anchor_day
+    if step is None:
+        if anchor >= start and (end is None or anchor < end):
+            yield _occurrence(bill, anchor, projected=False)
+        return
+
+    n = 0
+    if anchor < start:
+        months_behind = (start.year - anchor.year) * 12 + start.month - anchor.month
+        n = max(0, months_behind // step)
+        while shift_months(anchor, n * step, day) < start:
+            n += 1
+
+    while True:
+        due_date = shift_months(anchor, n * step, day)
+        if end is not None and due_date >= end:
+            return
+        yield _occurrence(bill, due_date, projected=n > 0)
+        n += 1
+
+
+def series_members(bills: Iterable[Bill]) -> List[Tuple[Bill, List[Bill]]]:
+    """
+    Group bills into series: (latest document, earlier documents oldest first).
+
+    Older data stores one document per month for the same bill; expanding
+    every one of them would repeat each occurrence, so only the latest one
+    generates dates. A series is a recurring bill's (name, recurring_period);
+    each one-off bill is its own series with no earlier documents.
+    """
+    series: Dict[Tuple[str, str], List[Bill]] = {}
+    one_off = []
+    for bill in bills:
+        if period_months(bill) is None:
+            one_off.append((bill, []))
+            continue
+        series.setdefault((bill.name, (bill.recurring_period or "monthly").lower()), []).append(bill)
+    grouped = []
+    for members in series.values():
+        members.sort(key=lambda bill: bill.due_date)
+        grouped.append((members[-1], members[:-1]))
+    return one_off + grouped
+
+
+def series_heads(bills: Iterable[Bill]) -> List[Bill]:
+    """The latest document of each recurring series, plus every one-off bill."""
+    return [head for head, _ in series_members(bills)]
+
+
+def series_occurrences(head: Bill, earlier: List[Bill], start: datetime,
+                       end: Optional[datetime] = None) -> Iterator[BillOccurrence]:
+    """
+    A series' due dates in [start, end): earlier stored documents as they are
+    (a previous month still unpaid), then the head and the dates after it.
+    """
+    stored = (
+        _occurrence(bill, bill.due_date, projected=False)
+        for bill in earlier
+        if bill.due_date >= start and (end is None or bill.due_date < end)
+    )
+    return chain(stored, occurrences(head, start, end))
+
+
+def merge_occurrences(bills: Iterable[Bill], start: datetime,
+                      end: Optional[datetime] = None) -> Iterator[BillOccurrence]:
+    """Merge every series' occurrence stream into one due-date ordered stream with a heap."""
+    streams = [series_occurrences(head, earlier, start, end) for head, earlier in series_members(bills)]
+    return heapq.merge(*streams, key=lambda occurrence: occurrence.due_date)
+
+
+def projected_month_totals(bills: Iterable[Bill], start: datetime, end: datetime) -> Dict[str, float]:
+    """
+    Amount due per "YYYY-MM" month in [start, end) from recurring periods
+    that are not stored yet, i.e. those after each series' latest document.
+    """
+    totals: Dict[str, float] = {}
+    for bill in series_heads(bills):
+        for occurrence in occurrences(bill, start, end):
+            if occurrence.projected:
+                month = occurrence.due_date.strftime("%Y-%m")
+                totals[month] = totals.get(month, 0.0) + occurrence.amount
+    return totals
+
+
+def upcoming(bills: Iterable[Bill], start: datetime, end: datetime,
+             limit: Optional[int] = None, include_paid: bool = False) -> List[BillOccurrence]:
+    stream = merge_occurrences(bills, start, end)
+    if not include_paid:
+        stream = (occurrence for occurrence in stream if occurrence.status != "paid")
+    return list(islice(stream, limit))
@@ -0,0 +1,310 @@
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Run from anywhere: the app imports modules from the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Settings the app requires at import; no test talks to Airtable or Mongo
+os.environ.setdefault("AIRTABLE_API_KEY", "test-key")
+os.environ.setdefault("AIRTABLE_BASE_ID", "appTest")
+os.environ.setdefault("AIRTABLE_MIRROR_INTERVAL_SECONDS", "0")
+
+from bson import ObjectId
+from pymongo import DeleteOne, InsertOne, ReplaceOne, UpdateOne
+from pymongo.errors import OperationFailure
+
+COMPARISONS = {
+    "$lt": lambda a, b: a is not None and a < b,
+    "$lte": lambda a, b: a is not None and a <= b,
+    "$gt": lambda a, b: a is not None and a > b,
+    "$gte": lambda a, b: a is not None and a >= b,
+    "$ne": lambda a, b: a != b,
+    "$in": lambda a, b: a in b,
+}
+
+
+def _get(doc, path):
+    for part in path.split("."):
+        if not isinstance(doc, dict):
+            return None
+        doc = doc.get(part)
+    return doc
+
+
+def _equals(value, expected):
+    # Like Mongo, a list-valued field matches when any element does
+    return value == expected or (isinstance(value, list) and expected in value)
+
+
+def _test(value, op, expected):
+    if op == "$in" and isinstance(value, list):
+        return any(item in expected for item in value)
+    return COMPARISONS[op](value, expected)
+
+
+def matches(doc, query):
+    """The subset of Mongo query matching the DAOs use: equality, comparisons, $in, $and and $or."""
+    for field, condition in (query or {}).items():
+        if field == "$and":
+            if not all(matches(doc, part) for part in condition):
+                return False
+        elif field == "$or":
+            if not any(matches(doc, part) for part in condition):
+                return False
+        elif isinstance(condition, dict) and condition and all(key.startswith("$") for key in condition):
+            if not all(_test(_get(doc, field), op, value) for op, value in condition.items()):
+                return False
+        elif not _equals(_get(doc, field), condition):
+            return False
+    return True
+
+
+def _project(doc, projection):
+    if not projection:
+        return dict(doc)
+    if all(not value for value in projection.values()):
+        return {key: value for key, value in doc.items() if key not in projection}
+    projected = {"_id": doc["_id"]} if projection.get("_id", 1) else {}
+    for path in projection:
+        if path == "_id" or not projection[path]:
+            continue
+        value, target, parts = _get(doc, path), projected, path.split(".")
+        if value is None:
+            continue
+        for part in parts[:-1]:
+            target = target.setdefault(part, {})
+        target[parts[-1]] = value
+    return projected
+
+
+def _apply_update(doc, update):
+    for field, value in update.get("$set", {}).items():
+        doc[field] = value
+    for field, value in update.get("$inc", {}).items():
+        doc[field] = doc.get(field, 0) + value
+
+
+class FakeCursor:
+    """Motor cursor over a fixed list: chainable sort/skip/limit, to_list and async iteration."""
+
+    def __init__(self, docs):
+        self.docs = list(docs)
+        self.order = None
+        self.skipped = 0
+
+    def sort(self, keys, direction=None):
+        self.order = [(keys, direction)] if isinstance(keys, str) else list(keys)
+        for field, direction in reversed(self.order):
+            self.docs.sort(key=lambda doc: _get(doc, field), reverse=direction < 0)
+        return self
+
+    def skip(self, count):
+        self.skipped = count
+        self.docs = self.docs[count:]
+        return self
+
+    def limit(self, count):
+        if count:
+            self.docs = self.docs[:count]
+        return self
+
+    async def to_list(self, length):
+        return self.docs[:length] if length else self.docs
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.docs:
+            raise StopAsyncIteration
+        return self.docs.pop(0)
+
+
+class FakeCollection:
+    """
+    In-memory stand-in for a Motor collection.
+
+    ``docs`` holds the stored documents. ``aggregated`` is what ``aggregate``
+    returns: a list, or a callable taking the pipeline. ``indexes`` is what
+    ``index_information`` reports, and index names in ``failing`` make
+    ``create_indexes`` raise; the names it did create are in
+    ``created_indexes``. Every call is recorded in ``calls`` and every
+    pipeline in ``pipelines``; the last cursor handed out is ``cursor``.
+    """
+
+    def __init__(self, name, docs=(), aggregated=(), indexes=None, failing=()):
+        self.name = name
+        self.docs = []
+        for doc in docs:
+            self._insert(dict(doc))
+        self.aggregated = aggregated if callable(aggregated) else list(aggregated)
+        self.indexes = {"_id_": {"key": [("_id", 1)], "v": 2}, **(indexes or {})}
+        self.failing = set(failing)
+        self.calls = []
+        self.pipelines = []
+        self.bulk = []
+        self.created_indexes = []
+        self.cursor = None
+
+    def _matching(self, query):
+        return [doc for doc in self.docs if matches(doc, query)]
+
+    def _insert(self, doc):
+        doc.setdefault("_id", ObjectId())
+        self.docs.append(dict(doc))
+        return doc["_id"]
+
+    # Reads
+    def find(self, query=None, projection=None, session=None, **kwargs):
+        self.calls.append("find")
+        self.cursor = FakeCursor(_project(doc, projection) for doc in self._matching(query))
+        return self.cursor
+
+    async def find_one(self, query=None, projection=None, session=None):
+        self.calls.append("find_one")
+        found = self._matching(query)
+        return _project(found[0], projection) if found else None
+
+    def aggregate(self, pipeline, session=None):
+        self.calls.append("aggregate")
+        self.pipelines.append(pipeline)
+        return FakeCursor(self.aggregated(pipeline) if callable(self.aggregated) else self.aggregated)
+
+    async def estimated_document_count(self):
+        return len(self.docs)
+
+    # Writes
+    async def insert_one(self, doc, session=None):
+        self.calls.append("insert_one")
+        return SimpleNamespace(acknowledged=True, inserted_id=self._insert(doc))
+
+    async def insert_many(self, docs, session=None):
+        self.calls.append("insert_many")
+        return SimpleNamespace(acknowledged=True, inserted_ids=[self._insert(doc) for doc in docs])
+
+    async def _update(self, query, update, many, upsert=False):
+        found = self._matching(query)[:None if many else 1]
+        for doc in found:
+            _apply_update(doc, update)
+        if not found and upsert:
+            doc = {key: value for key, value in query.items() if not key.startswith("$")}
+            _apply_update(doc, update)
+            self._insert(doc)
+        return SimpleNamespace(acknowledged=True, matched_count=len(found), modified_count=len(found))
+
+    async def update_one(self, query, update, upsert=False, session=None):
+        self.calls.append("update_one")
+        return await self._update(query, update, many=False, upsert=upsert)
+
+    async def update_many(self, query, update, upsert=False, session=None):
+        self.calls.append("update_many")
+        return await self._update(query, update, many=True, upsert=upsert)
+
+    async def replace_one(self, query, replacement, upsert=False, session=None):
+        self.calls.append("replace_one")
+        found = self._matching(query)[:1]
+        for doc in found:
+            kept_id = doc["_id"]
+            doc.clear()
+            doc.update(replacement, _id=kept_id)
+        if not found and upsert:
+            self._insert(dict(replacement))
+        return SimpleNamespace(acknowledged=True, matched_count=len(found), modified_count=len(found))
+
+    async def _delete(self, query, many):
+        found = self._matching(query)[:None if many else 1]
+        self.docs = [doc for doc in self.docs if not any(doc is gone for gone in found)]
+        return found
+
+    async def delete_one(self, query, session=None):
+        self.calls.append("delete_one")
+        return SimpleNamespace(acknowledged=True, deleted_count=len(await self._delete(query, many=False)))
+
+    async def delete_many(self, query, session=None):
+        self.calls.append("delete_many")
+        return SimpleNamespace(acknowledged=True, deleted_count=len(await self._delete(query, many=True)))
+
+    async def find_one_and_delete(self, query, session=None):
+        self.calls.append("find_one_and_delete")
+        found = await self._delete(query, many=False)
+        return found[0] if found else None
+
+    async def bulk_write(self, operations, ordered=True, session=None):
+        self.calls.append("bulk_write")
+        self.bulk.extend(operations)
+        counts = {"inserted_count": 0, "modified_count": 0, "deleted_count": 0, "upserted_count": 0}
+        for operation in operations:
+            if isinstance(operation, InsertOne):
+                self._insert(operation._doc)
+                counts["inserted_count"] += 1
+            elif isinstance(operation, DeleteOne):
+                counts["deleted_count"] += len(await self._delete(operation._filter, many=False))
+            elif isinstance(operation, ReplaceOne):
+                result = await self.replace_one(operation._filter, operation._doc, upsert=bool(operation._upsert))
+                counts["modified_count"] += result.modified_count
+            elif isinstance(operation, UpdateOne):
+                result = await self._update(operation._filter, operation._doc, many=False,
+                                            upsert=bool(operation._upsert))
+                counts["modified_count"] += result.modified_count
+        return SimpleNamespace(acknowledged=True, **counts)
+
+    # Indexes
+    async def index_information(self):
+        return self.indexes
+
+    async def create_indexes(self, models):
+        for model in models:
+            name = model.document["name"]
+            if name in self.failing:
+                raise OperationFailure("E11000 duplicate key error")
+            self.created_indexes.append(name)
+            self.indexes[name] = {"key": list(model.document["key"].items()),
+                                  "unique": model.document.get("unique", False)}
+
+
+class FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def with_transaction(self, callback):
+        await callback(self)
+
+
+class FakeClient:
+    async def start_session(self):
+        return FakeSession()
+
+
+class FakeDatabase:
+    """Motor database whose collections spring into existence on first access, by item or attribute."""
+
+    def __init__(self):
+        self.client = FakeClient()
+        self.collections = {}
+
+    def __getitem__(self, name):
+        if name not in self.collections:
+            self.collections[name] = FakeCollection(name)
+        return self.collections[name]
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self[name]
+
+    def collection(self, name, **kwargs):
+        """Replace ``name`` with a collection seeded from ``kwargs`` (see FakeCollection)."""
+        self.collections[name] = FakeCollection(name, **kwargs)
+        return self.collections[name]
+
+
+@pytest.fixture
+def fake_db():
+    """An empty in-memory Motor database shared by the DAO tests."""
+    return FakeDatabase()
@@ -0,0 +1,100 @@
+import asyncio
+import json
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+
+import server
+from app.auth.auth_utils import get_current_user
+from app.dao.table_daos import BlogPostDAO, EventDAO, ProgramDAO, SaleDAO
+from app.models.models import BlogPost, Event, Program, Sale
+
+
+class JsonTable:
+    """
+    Fake pyairtable table: payloads go through json.dumps like the real HTTP
+    request body, and come back as Airtable records.
+    """
+
+    def __init__(self):
+        self.records = {}
+
+    def _store(self, record_id, fields):
+        fields = json.loads(json.dumps(fields))
+        self.records[record_id] = fields
+        return {"id": record_id, "createdTime": "2025-01-01T00:00:00.000Z", "fields": fields}
+
+    def create(self, fields):
+        return self._store(f"rec{len(self.records)}", fields)
+
+    def batch_create(self, records):
+        return [self.create(fields) for fields in records]
+
+    def batch_update(self, records):
+        return [self._store(record["id"], record["fields"]) for record in records]
+
+    def batch_upsert(self, records, key_fields):
+        created = []
+        results = []
+        for record in records:
+            record_id = record.get("id") or next(
+                (existing_id for existing_id, fields in self.records.items()
+                 if all(fields.get(key) == record["fields"].get(key) for key in key_fields)), None)
+            if record_id is None:
+                record_id = f"rec{len(self.records)}"
+                created.append(record_id)
+            results.append(self._store(record_id, record["fields"]))
+        return {"createdRecords": created, "updatedRecords": [], "records": results}
+
+
+CASES = [
+    (ProgramDAO, Program(program_name="Seed", description="d", eligibility_criteria="e",
+                         application_process="a", funding_amount=Decimal("250000.50"))),
+    (SaleDAO, Sale(product_name="Plan", price=Decimal("19.99"), details="x", company="recC", sales_metrics=3)),
+    (EventDAO, Event(event_name="Demo day", date=date(2025, 5, 17), location="Austin",
+                     keywords=["ai", "fintech"], target_audience="founders")),
+    (BlogPostDAO, BlogPost(post_title="Launch", date=date(2025, 2, 3), content_summary="s",
+                           engagement_metrics=40, related_company="recC")),
+]
+
+
+def strip_id(item):
+    return item.model_dump(exclude={"id"})
+
+
+@pytest.mark.parametrize("dao_class,item", CASES, ids=[case[0].__name__ for case in CASES])
+def test_bulk_round_trip(dao_class, item):
+    dao = dao_class()
+    dao.table = JsonTable()
+
+    async def run():
+        created = await dao.bulk_create([item, item])
+        assert (created.succeeded, created.failed) == (2, 0), created.results
+        first_id = created.results[0].id
+
+        updated = await dao.bulk_update([item.model_copy(update={"id": first_id})])
+        assert (updated.succeeded, updated.failed) == (1, 0), updated.results
+
+        upserted = await dao.bulk_upsert([item], key_fields=[next(iter(dao.table.records[first_id]))])
+        assert (upserted.succeeded, upserted.failed) == (1, 0), upserted.results
+
+        single = await dao.create(item)
+        return dao._convert_records([
+            {"id": record_id, "fields": fields} for record_id, fields in dao.table.records.items()
+        ]), single
+
+    stored, single = asyncio.run(run())
+    assert strip_id(single) == strip_id(item)
+    assert [strip_id(record) for record in stored] == [strip_id(item)] * len(stored)
+
+
+def test_bulk_upsert_without_key_fields_is_a_client_error():
+    server.app.dependency_overrides[get_current_user] = lambda: None
+    try:
+        response = TestClient(server.app).post("/api/investors/sales/bulk/upsert", json=[])
+    finally:
+        server.app.dependency_overrides.clear()
+    assert response.status_code == 422
+    assert "key field" in response.json()["detail"]
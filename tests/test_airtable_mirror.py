@@ -0,0 +1,37 @@
+import asyncio
+from datetime import datetime, timezone
+
+from pymongo import ASCENDING, DESCENDING
+
+from app.dao.airtable_mirror import AirtableMirror
+
+
+def find(db, **kwargs):
+    collection = db.collection("airtable_companies", docs=[
+        {"_id": "rec2", "fields": {"company_name": "b", "industry": "x"}},
+        {"_id": "rec1", "fields": {"company_name": "a", "industry": "x"}},
+        {"_id": "rec3", "fields": {"company_name": "b", "industry": "x"}},
+    ])
+    mirror = AirtableMirror(db, client=None, clock=lambda: datetime.now(timezone.utc))
+    records = asyncio.run(mirror.find("Companies", **kwargs))
+    # Documents come back in Airtable's record shape
+    assert all(set(record) == {"id", "fields", "createdTime"} for record in records)
+    return [record["id"] for record in records], collection.cursor
+
+
+def test_unsorted_pages_are_ordered_by_id(fake_db):
+    ids, cursor = find(fake_db, skip=1, limit=2)
+    assert cursor.order == [("_id", ASCENDING)]
+    assert cursor.skipped == 1
+    assert ids == ["rec2", "rec3"]
+
+
+def test_sorted_pages_end_with_id(fake_db):
+    ids, cursor = find(fake_db, sort=["-company_name", "industry"], limit=10)
+    assert cursor.order == [
+        ("fields.company_name", DESCENDING),
+        ("fields.industry", ASCENDING),
+        ("_id", ASCENDING),
+    ]
+    # Equal sort keys fall back to _id, so pages never overlap
+    assert ids == ["rec2", "rec3", "rec1"]
@@ -0,0 +1,82 @@
+import asyncio
+import threading
+import time
+
+from app.dao.airtable_client import get_airtable_client
+from app.dao.table_daos import CompanyDAO
+
+LATENCY = 0.2
+REQUESTS = 10
+
+
+class SlowTable:
+    """Blocks like a real HTTPS round trip to Airtable and counts the calls that reach it."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get(self, record_id):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency)
+        return {"id": record_id, "fields": {
+            "company_name": "Acme",
+            "industry": "Fintech",
+            "website": "https://acme.example",
+            "linkedin_page": "https://linkedin.com/company/acme",
+        }}
+
+
+class InlineDAO(CompanyDAO):
+    """The behaviour before AirtableClient: pyairtable called straight from async code."""
+
+    async def get_by_id(self, id: str):
+        return self._from_airtable_record(self.table.get(id))
+
+
+async def probe(stop: asyncio.Event, interval: float = 0.01) -> float:
+    """Worst lateness of a 10 ms tick, i.e. the longest the event loop was stalled."""
+    worst = 0.0
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - expected)
+    return worst
+
+
+async def burst(dao, prefix: str):
+    stop = asyncio.Event()
+    probe_task = asyncio.create_task(probe(stop))
+    await asyncio.sleep(0.03)
+    started = time.perf_counter()
+    # Distinct ids so the per-table read cache cannot coalesce the requests
+    companies = await asyncio.gather(*(dao.get_by_id(f"{prefix}{i}") for i in range(REQUESTS)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    return companies, elapsed, await probe_task
+
+
+def test_pooled_calls_do_not_stall_the_event_loop():
+    dao = CompanyDAO()
+    dao.table = SlowTable(LATENCY)
+    companies, elapsed, worst_stall = asyncio.run(burst(dao, "recPool"))
+
+    assert [company.id for company in companies] == [f"recPool{i}" for i in range(REQUESTS)]
+    assert dao.table.calls == REQUESTS  # every request reached the table; nothing was coalesced
+    assert worst_stall < LATENCY / 2
+    # Calls overlap on the worker threads instead of running back to back
+    workers = get_airtable_client().max_workers
+    assert elapsed < REQUESTS * LATENCY / min(workers, REQUESTS) + LATENCY
+
+
+def test_inline_calls_stall_the_event_loop():
+    # Control for the probe: the old inline call blocks the loop for each round trip
+    dao = InlineDAO()
+    dao.table = SlowTable(LATENCY)
+    _, elapsed, worst_stall = asyncio.run(burst(dao, "recInline"))
+
+    assert dao.table.calls == REQUESTS
+    assert worst_stall >= LATENCY * 0.9
+    assert elapsed >= REQUESTS * LATENCY * 0.9
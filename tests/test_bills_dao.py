@@ -0,0 +1,131 @@
+import asyncio
+from datetime import datetime
+
+from bson import ObjectId
+
+from dao.bills_dao import BillsDAO, bill_statistics
+from models.bills import Bill
+from services.recurrence import occurrences
+
+
+def make_dao(db, heads, stored=()):
+    """BillsDAO whose series-head aggregation returns ``heads``."""
+    bills = db.collection("bills", docs=stored, aggregated=heads)
+    return BillsDAO(db=db), bills
+
+
+def inserted(bills, *existing_ids):
+    return [doc for doc in bills.docs if doc["_id"] not in existing_ids]
+
+
+def test_roll_forward_inserts_next_occurrence_and_keeps_paid_bill(fake_db):
+    paid_id = ObjectId()
+    paid = {"_id": paid_id, "name": "Rent", "amount": 1200.0, "due_date": datetime(2025, 1, 31),
+            "category": "housing", "status": "paid", "payment_account": "Checking",
+            "recurring": True, "recurring_period": "Monthly"}
+    dao, bills = make_dao(fake_db, [{"_id": {"name": "Rent", "period": "monthly"}, "head": dict(paid)}], [paid])
+    now = datetime(2025, 2, 10)
+
+    assert asyncio.run(dao.roll_recurring_forward(now)) == 1
+
+    # The paid bill stays as payment history
+    assert bills.calls == ["aggregate", "insert_many"]
+    assert bills.docs[0] == paid
+    [created] = inserted(bills, paid_id)
+    assert created["_id"] != paid_id
+    assert created["due_date"] == datetime(2025, 2, 28)
+    assert created["status"] == "pending"
+    assert created["recurring_period"] == "Monthly"
+
+
+def test_month_end_bill_keeps_its_day_across_periods(fake_db):
+    head = {"_id": ObjectId(), "name": "Rent", "amount": 1200.0, "due_date": datetime(2025, 1, 31),
+            "category": "housing", "status": "paid", "recurring": True, "recurring_period": "monthly"}
+    due_dates = []
+    for now in (datetime(2025, 2, 1), datetime(2025, 3, 1), datetime(2025, 4, 1)):
+        dao, bills = make_dao(fake_db, [{"_id": {"name": "Rent", "period": "monthly"}, "head": head}])
+        asyncio.run(dao.roll_recurring_forward(now))
+        [head] = inserted(bills)
+        due_dates.append(head["due_date"])
+        head = dict(head, status="paid")
+
+    assert due_dates == [datetime(2025, 2, 28), datetime(2025, 3, 31), datetime(2025, 4, 30)]
+    assert head["anchor_day"] == 31
+
+    # The upcoming expansion of the stored copy stays on the 31st too
+    bill = Bill(**{key: value for key, value in head.items() if key != "_id"})
+    expanded = [occurrence.due_date for occurrence in occurrences(bill, datetime(2025, 4, 1), datetime(2025, 8, 1))]
+    assert expanded == [datetime(2025, 4, 30), datetime(2025, 5, 31), datetime(2025, 6, 30), datetime(2025, 7, 31)]
+
+
+def test_roll_forward_groups_periods_case_insensitively(fake_db):
+    dao, bills = make_dao(fake_db, [])
+    assert asyncio.run(dao.roll_recurring_forward(datetime(2025, 2, 10))) == 0
+    [pipeline] = bills.pipelines
+    group = next(stage["$group"] for stage in pipeline if "$group" in stage)
+    assert group["_id"]["period"] == {"$toLower": {"$ifNull": ["$recurring_period", "monthly"]}}
+
+
+def test_quarterly_step(fake_db):
+    paid = {"_id": ObjectId(), "name": "Water", "due_date": datetime(2024, 11, 15),
+            "status": "paid", "recurring": True, "recurring_period": "QUARTERLY"}
+    dao, bills = make_dao(fake_db, [{"_id": {"name": "Water", "period": "quarterly"}, "head": paid}])
+    asyncio.run(dao.roll_recurring_forward(datetime(2025, 1, 1)))
+    assert inserted(bills)[0]["due_date"] == datetime(2025, 2, 15)
+
+
+def statistics_facet(bills):
+    """Answers the statistics $facet from the bills the collection holds."""
+    def aggregate(pipeline):
+        assert "$facet" in pipeline[0]
+        total = sum(doc["amount"] for doc in bills.docs)
+        return [{
+            "totals": [{"_id": None, "total_amount": total, "count": len(bills.docs),
+                        "avg_amount": total / len(bills.docs) if bills.docs else None,
+                        "categories": sorted({doc["category"] for doc in bills.docs})}],
+            "by_status": [], "by_category": [], "by_due_month": [], "by_payment_account": [],
+        }]
+    return aggregate
+
+
+def test_bill_write_invalidates_memoized_statistics(fake_db):
+    bills = fake_db.bills
+    bills.aggregated = statistics_facet(bills)
+    dao = BillsDAO(db=fake_db)
+    water = Bill(name="Water", amount=30.0, due_date=datetime(2025, 3, 1), category="utilities")
+
+    async def run():
+        # Start from a known empty memo; other tests share the process-wide cache
+        bill_statistics.invalidate()
+        first = await dao.get_bill_statistics()
+        assert await dao.get_bill_statistics() is first
+        assert len(bills.pipelines) == 1
+
+        bill_id = await dao.create_bill(water)
+        assert bill_statistics.version == first["version"] + 1
+        second = await dao.get_bill_statistics()
+        assert len(bills.pipelines) == 2
+        assert (second["count"], second["total_amount"]) == (1, 30.0)
+
+        await dao.update_bill(bill_id, water.model_copy(update={"amount": 45.0}))
+        third = await dao.get_bill_statistics()
+        assert len(bills.pipelines) == 3
+        assert third["total_amount"] == 45.0
+        assert third["version"] > second["version"]
+
+    asyncio.run(run())
+
+
+def test_statistics_computed_across_a_write_are_not_memoized(fake_db):
+    bills = fake_db.bills
+    facet = statistics_facet(bills)
+
+    def racing_facet(pipeline):
+        # A bill write lands while the $facet is running
+        bill_statistics.invalidate()
+        return facet(pipeline)
+
+    bills.aggregated = racing_facet
+    bill_statistics.invalidate()
+    asyncio.run(BillsDAO(db=fake_db).get_bill_statistics())
+    assert bill_statistics.get() is None
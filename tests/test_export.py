@@ -0,0 +1,97 @@
+import asyncio
+import csv
+import gzip
+import io
+import json
+from datetime import datetime
+
+import pytest
+from bson import Decimal128, ObjectId
+from fastapi.testclient import TestClient
+
+import server
+from app.auth.auth_utils import get_current_user
+from dao.dependencies import get_finance_dao
+from dao.finance_dao import FinanceDAO
+from routers.export import TRANSACTION_COLUMNS, _encode, _gzip
+
+IDS = [ObjectId(), ObjectId(), ObjectId()]
+
+
+def stored_transactions():
+    # Stored field order differs from the export columns, and carries BSON types
+    return [
+        {"type": "expense", "amount": Decimal128("12.50"), "_id": IDS[0], "category": "food",
+         "description": "Groceries", "date": datetime(2025, 3, 2, 9, 30)},
+        {"_id": IDS[1], "date": datetime(2025, 3, 1), "description": "Pay, March", "category": "salary",
+         "amount": Decimal128("3000"), "type": "income"},
+        {"_id": IDS[2], "date": datetime(2025, 2, 28), "description": 'Say "hi"', "category": "gifts",
+         "amount": Decimal128("-5.25"), "type": "expense", "note": "dropped"},
+    ]
+
+
+EXPECTED = [
+    {"id": str(IDS[0]), "date": "2025-03-02T09:30:00", "description": "Groceries", "category": "food",
+     "amount": "12.50", "type": "expense"},
+    {"id": str(IDS[1]), "date": "2025-03-01T00:00:00", "description": "Pay, March", "category": "salary",
+     "amount": "3000", "type": "income"},
+    {"id": str(IDS[2]), "date": "2025-02-28T00:00:00", "description": 'Say "hi"', "category": "gifts",
+     "amount": "-5.25", "type": "expense"},
+]
+
+
+async def collect(chunks):
+    return [chunk async for chunk in chunks]
+
+
+def parse(body, format):
+    text = body.decode()
+    if format == "csv":
+        reader = csv.reader(io.StringIO(text))
+        header = next(reader)
+        return header, [dict(zip(header, row)) for row in reader]
+    rows = [json.loads(line, object_pairs_hook=list) for line in text.splitlines()]
+    return [key for key, _ in rows[0]], [dict(row) for row in rows]
+
+
+@pytest.mark.parametrize("compress", [False, True], ids=["plain", "gzip"])
+@pytest.mark.parametrize("format", ["ndjson", "csv"])
+def test_export_encodes_rows_in_column_order(fake_db, format, compress):
+    cursor = fake_db.collection("transactions", docs=stored_transactions()).find({})
+    body = _encode(cursor, TRANSACTION_COLUMNS, format, batch_size=2)
+    if compress:
+        body = _gzip(body)
+    chunks = asyncio.run(collect(body))
+
+    data = b"".join(chunks)
+    if compress:
+        data = gzip.decompress(data)
+    else:
+        # Two rows per chunk: the first batch is flushed before the cursor is drained
+        assert len(chunks) == 2
+    columns, rows = parse(data, format)
+
+    assert columns == TRANSACTION_COLUMNS
+    if format == "ndjson":
+        # Amounts are JSON numbers, as trusted_json writes them
+        assert [row["amount"] for row in rows] == [12.5, 3000, -5.25]
+        assert isinstance(rows[1]["amount"], int) and isinstance(rows[0]["amount"], float)
+        rows = [{**row, "amount": expected["amount"]} for row, expected in zip(rows, EXPECTED)]
+    assert rows == EXPECTED
+    assert all("_id" not in row and "note" not in row for row in rows)
+
+
+def test_export_route_streams_from_the_transactions_cursor(fake_db):
+    fake_db.collection("transactions", docs=stored_transactions())
+    dao = FinanceDAO(fake_db)
+    server.app.dependency_overrides[get_finance_dao] = lambda: dao
+    server.app.dependency_overrides[get_current_user] = lambda: None
+    try:
+        response = TestClient(server.app).get("/api/export/transactions?format=csv&gzip=true")
+    finally:
+        server.app.dependency_overrides.clear()
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-disposition"] == 'attachment; filename="transactions.csv"'
+    # The client undoes the gzip transfer encoding
+    assert parse(response.content, "csv") == (TRANSACTION_COLUMNS, EXPECTED)
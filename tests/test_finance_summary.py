@@ -0,0 +1,23 @@
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
+from dao.finance_dao import FinanceDAO
+
+
+def test_summary_includes_recurring_bills_not_stored_yet(fake_db):
+    rent = {"name": "Rent", "amount": Decimal("1000"), "due_date": datetime(2025, 1, 31), "category": "housing",
+            "status": "pending", "recurring": True, "recurring_period": "monthly"}
+    water = {"name": "Water", "amount": Decimal("50"), "due_date": datetime(2025, 2, 10), "category": "utilities",
+             "status": "pending", "recurring": False}
+    fake_db.collection("income", docs=[{"monthly": Decimal("3000")}])
+    # Stored bills by due month, as the $group returns them: the rent head and a one-off in February
+    fake_db.collection("bills", docs=[rent, water], aggregated=[{"_id": "2025-01", "total": 1000.0},
+                                                                {"_id": "2025-02", "total": 50.0}])
+
+    summary = asyncio.run(FinanceDAO(fake_db).get_summary("2025-01", "2025-04"))
+
+    assert [(month.month, month.bills) for month in summary.months] == [
+        ("2025-01", 1000.0), ("2025-02", 1050.0), ("2025-03", 1000.0), ("2025-04", 1000.0)
+    ]
+    assert summary.total_bills == 4050.0
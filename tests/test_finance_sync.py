@@ -0,0 +1,117 @@
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
+from bson import Decimal128, ObjectId
+from pymongo import DeleteOne, InsertOne, UpdateOne
+
+from dao.finance_dao import FinanceDAO
+from dao.finance_sync import bill_key, diff_documents, plan_documents, plan_operations, transaction_key
+from models.financial_models import Bill
+
+
+def transaction(amount, description="Groceries", **fields):
+    doc = {"date": datetime(2025, 3, 1), "description": description, "category": "food",
+           "amount": amount, "type": "expense"}
+    doc.update(fields)
+    return doc
+
+
+def stored(doc):
+    return {"_id": ObjectId(), **doc}
+
+
+def test_unchanged_documents_produce_no_operations():
+    existing = [stored(transaction(Decimal128("12.50"))), stored(transaction(Decimal("3"), "Coffee"))]
+    desired = [transaction(Decimal("12.50")), transaction(Decimal("3.0"), "Coffee")]
+
+    assert plan_documents(existing, desired, transaction_key) == ([], [], [])
+    assert diff_documents(existing, desired, transaction_key) == []
+
+
+def test_changed_amount_is_a_delete_plus_insert():
+    old = stored(transaction(Decimal("12.50")))
+    new = transaction(Decimal("13.00"))
+
+    deletes, updates, inserts = plan_documents([old], [new], transaction_key)
+
+    assert (deletes, updates, inserts) == ([old], [], [new])
+
+
+def test_changed_non_key_field_is_an_update():
+    old = stored({"name": "Rent", "amount": Decimal("1000"), "status": "pending"})
+    new = {"name": "Rent", "amount": Decimal("1000"), "status": "paid"}
+
+    deletes, updates, inserts = plan_documents([old], [new], bill_key)
+
+    assert (deletes, updates, inserts) == ([], [(old, new)], [])
+
+
+def monthly(due_date, **fields):
+    return {"name": "Rent", "amount": Decimal("1200"), "due_date": due_date, "category": "housing",
+            "status": "pending", "payment_account": "Checking", "recurring": True,
+            "recurring_period": "monthly", **fields}
+
+
+def test_unchanged_same_name_series_produces_no_operations():
+    dates = [datetime(2025, month, 1) for month in (1, 2, 3, 4)]
+    # Stored by BillsDAO, with fields the submitted model does not declare
+    existing = [stored(monthly(due_date, anchor_day=1, created_at=datetime(2024, 12, 1))) for due_date in dates]
+    desired = [monthly(due_date) for due_date in reversed(dates)]
+
+    assert plan_documents(existing, desired, bill_key) == ([], [], [])
+
+
+def test_changed_series_member_keeps_the_other_ids():
+    dates = [datetime(2025, month, 1) for month in (1, 2, 3)]
+    existing = [stored(monthly(due_date)) for due_date in dates]
+    desired = [monthly(dates[0]), monthly(dates[1], status="paid"), monthly(dates[2])]
+
+    deletes, updates, inserts = plan_documents(existing, desired, bill_key)
+
+    assert (deletes, inserts) == ([], [])
+    assert updates == [(existing[1], desired[1])]
+
+
+def test_duplicate_keys_are_matched_one_to_one():
+    twice = [stored(transaction(Decimal("5"))), stored(transaction(Decimal("5")))]
+
+    # One fewer copy submitted: exactly one stored duplicate goes
+    deletes, updates, inserts = plan_documents(twice, [transaction(Decimal("5"))], transaction_key)
+    assert len(deletes) == 1 and deletes[0] in twice
+    assert (updates, inserts) == ([], [])
+
+    # One more copy submitted: exactly one new document is inserted
+    desired = [transaction(Decimal("5"))] * 3
+    deletes, updates, inserts = plan_documents(twice, desired, transaction_key)
+    assert (deletes, updates) == ([], [])
+    assert inserts == [transaction(Decimal("5"))]
+
+
+def test_deletes_come_before_updates_and_inserts():
+    gone = stored({"name": "Gym", "amount": Decimal("40")})
+    changed = stored({"name": "Rent", "amount": Decimal("1000")})
+    desired = [{"name": "Rent", "amount": Decimal("1100")}, {"name": "Water", "amount": Decimal("30")}]
+
+    ops = plan_operations(*plan_documents([gone, changed], desired, bill_key))
+
+    assert ops == [
+        DeleteOne({"_id": gone["_id"]}),
+        UpdateOne({"_id": changed["_id"]}, {"$set": desired[0]}),
+        InsertOne(desired[1]),
+    ]
+
+
+def test_save_keeps_fields_the_submitted_model_does_not_declare(fake_db):
+    # Written by BillsDAO.roll_recurring_forward: the series falls on the 31st
+    fake_db.collection("bills", docs=[
+        monthly(datetime(2025, 2, 28), anchor_day=31, created_at=datetime(2025, 2, 1)),
+    ])
+    paid = Bill(**monthly(datetime(2025, 2, 28), status="paid"))
+
+    summary = asyncio.run(FinanceDAO(fake_db).sync_financial_data(bills=[paid]))
+
+    assert summary["bills"] == {"inserted": 0, "updated": 1, "deleted": 0}
+    [stored_bill] = fake_db.bills.docs
+    assert stored_bill["status"] == "paid"
+    assert (stored_bill["anchor_day"], stored_bill["created_at"]) == (31, datetime(2025, 2, 1))
@@ -0,0 +1,61 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from models.bills import Account, Bill
+from models.financial_models import Income
+from models.forecast_models import ForecastScenario, ScenarioAdjustment
+from services.forecast import CashFlowProjection
+
+ACCOUNTS = [Account(name="Checking", balance=1000.0, type="checking"),
+            Account(name="Card", balance=200.0, type="credit")]
+BILLS = [
+    Bill(name="Rent", amount=1200.0, due_date=datetime(2025, 1, 15), category="housing",
+         payment_account="Checking", recurring=True, recurring_period="monthly"),
+    Bill(name="Streaming", amount=15.0, due_date=datetime(2025, 1, 20), category="fun", payment_account="Card"),
+]
+INCOME = Income(biweekly=Decimal("0"), monthly=Decimal("3000"))
+
+
+def project(*scenarios):
+    projection = CashFlowProjection(ACCOUNTS, BILLS, INCOME, start=date(2025, 1, 1), months=2)
+    return {result.name: result for result in projection.run(list(scenarios)).scenarios}
+
+
+def test_baseline_balances():
+    baseline = project()["baseline"]
+
+    # Paid on Jan 1 and Feb 1; rent on the 15th of both months; one streaming charge on the card
+    assert baseline.ending_balances == {"Checking": 4600.0, "Card": -215.0}
+    assert baseline.month_end_totals == [2585.0, 4385.0]
+    assert baseline.ending_total == 4385.0
+    assert (baseline.min_total, baseline.min_total_date) == (2585.0, date(2025, 1, 20))
+    assert baseline.first_negative_date is None
+
+
+def test_scenario_adjustments():
+    results = project(
+        ForecastScenario(name="no rent", adjustments=[
+            ScenarioAdjustment(kind="cancel_bill", bill_name="Rent", start_date=date(2025, 2, 1))]),
+        ForecastScenario(name="raise", adjustments=[
+            ScenarioAdjustment(kind="income_change", percent=10, start_date=date(2025, 2, 1))]),
+        ForecastScenario(name="splurge", adjustments=[
+            ScenarioAdjustment(kind="one_time", amount=-3000, account="Checking", start_date=date(2025, 1, 16))]),
+    )
+
+    assert results["no rent"].ending_balances == {"Checking": 5800.0, "Card": -215.0}
+    assert results["no rent"].month_end_totals == [2585.0, 5585.0]
+    assert results["raise"].ending_balances == {"Checking": 4900.0, "Card": -215.0}
+
+    splurge = results["splurge"]
+    assert splurge.ending_balances == {"Checking": 1600.0, "Card": -215.0}
+    assert splurge.month_end_totals == [-415.0, 1385.0]
+    assert splurge.first_negative_date == date(2025, 1, 16)
+    assert (splurge.min_total, splurge.min_total_date) == (-415.0, date(2025, 1, 20))
+
+
+def test_duplicate_account_names_are_rejected():
+    accounts = ACCOUNTS + [Account(name="Checking", balance=50.0, type="savings")]
+    with pytest.raises(ValueError, match="duplicated: Checking"):
+        CashFlowProjection(accounts, BILLS, INCOME, start=date(2025, 1, 1), months=2)
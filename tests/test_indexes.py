@@ -0,0 +1,60 @@
+import asyncio
+
+from dao.indexes import INDEXES, ensure_indexes, index_usage_report
+
+
+def test_ensure_indexes_reconciles_against_existing_indexes(fake_db):
+    db = fake_db
+    db.collection("users", indexes={"email_unique": {"key": [("email", 1)], "unique": True}})
+    db.collection("bills", indexes={
+        # Declared as non-unique
+        "name": {"key": [("name", 1)], "unique": True},
+        # Same key pattern under the default name
+        "status_1_due_date_1": {"key": [("status", 1), ("due_date", 1)]},
+    }, failing={"recurring"})
+    # Declared descending on both fields
+    db.collection("transactions", indexes={"date_id": {"key": [("date", 1), ("_id", 1)]}})
+
+    report = asyncio.run(ensure_indexes(db))
+
+    assert sorted(report["present"]) == ["bills.status_due_date", "users.email_unique"]
+    assert sorted(report["conflicts"]) == ["bills.name", "transactions.date_id"]
+    assert report["failed"] == ["bills.recurring"]
+    assert db.bills.created_indexes == ["due_date"]
+    assert db.transactions.created_indexes == ["category_date_id"]
+    assert db.users.created_indexes == []
+    # Everything else is created, and nothing is reported twice
+    declared = [f"{name}.{model.document['name']}" for name, models in INDEXES.items() for model in models]
+    assert sorted(sum(report.values(), [])) == sorted(declared)
+
+
+def test_ensure_indexes_is_idempotent(fake_db):
+    first = asyncio.run(ensure_indexes(fake_db))
+    second = asyncio.run(ensure_indexes(fake_db))
+
+    assert first["present"] == [] and second["created"] == []
+    assert second["present"] == first["created"]
+    assert second["conflicts"] == second["failed"] == []
+
+
+def stat(name, ops):
+    return {"name": name, "accesses": {"ops": ops}}
+
+
+def test_index_usage_report_lists_missing_unused_and_undeclared(fake_db):
+    db = fake_db
+    db.collection("users", aggregated=[stat("_id_", 0), stat("email_unique", 42)])
+    db.collection("bills", aggregated=[stat("_id_", 3), stat("name", 0), stat("status_due_date", 7),
+                                       stat("due_date", 1), stat("recurring", 2), stat("amount_1", 9)])
+
+    report = asyncio.run(index_usage_report(db))
+
+    assert report["unused"] == ["bills.name"]
+    assert report["undeclared"] == ["bills.amount_1"]
+    assert report["usage"]["users.email_unique"] == 42
+    assert report["usage"]["bills.amount_1"] == 9
+    # The _id index is counted but never flagged
+    assert report["usage"]["users._id_"] == 0
+    assert "users._id_" not in report["unused"]
+    assert "transactions.date_id" in report["missing"]
+    assert not any(name.startswith(("users.", "bills.")) for name in report["missing"])
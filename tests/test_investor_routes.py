@@ -0,0 +1,24 @@
+from fastapi.testclient import TestClient
+
+import server
+from app.auth.auth_utils import get_current_user
+from routers.investors import COMPANY_FULL_MAX_IDS
+
+
+def get(url):
+    server.app.dependency_overrides[get_current_user] = lambda: None
+    try:
+        return TestClient(server.app).get(url)
+    finally:
+        server.app.dependency_overrides.clear()
+
+
+def test_companies_full_without_ids_is_a_client_error():
+    response = get("/api/investors/companies/full")
+    assert response.status_code == 422
+    assert "company id" in response.json()["detail"]
+
+
+def test_companies_full_rejects_too_many_ids():
+    ids = "&".join(f"ids=rec{i}" for i in range(COMPANY_FULL_MAX_IDS + 1))
+    assert get(f"/api/investors/companies/full?{ids}").status_code == 422
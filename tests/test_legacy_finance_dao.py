@@ -0,0 +1,26 @@
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
+from app.DataAccessLayer.finance_dao import FinanceDAO
+from app.models.financial_models import Transaction
+from dao.rollups import ROLLUP_COLLECTION
+
+
+def test_transaction_writes_update_monthly_rollups(fake_db):
+    dao = FinanceDAO(fake_db)
+    transaction = Transaction(date=datetime(2025, 3, 4), description="Groceries", category="food",
+                              amount=Decimal("42.50"), type="expense")
+
+    async def run():
+        assert await dao.add_transaction(transaction)
+        [transaction_id] = [doc["_id"] for doc in fake_db.transactions.docs]
+        assert await dao.delete_transaction(transaction_id)
+
+    asyncio.run(run())
+    assert [operation._doc["$inc"] for operation in fake_db[ROLLUP_COLLECTION].bulk] == [
+        {"total": Decimal("42.50"), "count": 1},
+        {"total": Decimal("-42.50"), "count": -1},
+    ]
+    [rollup] = fake_db[ROLLUP_COLLECTION].docs
+    assert (rollup["month"], rollup["total"], rollup["count"]) == ("2025-03", 0, 0)
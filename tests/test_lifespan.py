@@ -0,0 +1,27 @@
+from fastapi.testclient import TestClient
+
+import server
+from dao import mongodb
+from dao.dependencies import get_finance_dao
+from app.auth.auth_utils import get_current_user
+
+
+def test_import_does_not_create_mongo_client():
+    # Routers and DAOs are resolved per request; only the lifespan connects
+    assert mongodb._client is None
+
+
+def test_routes_use_the_dao_from_dependencies():
+    class FakeFinanceDAO:
+        async def get_summary(self, start_month, end_month):
+            raise ValueError("bad month")
+
+    server.app.dependency_overrides[get_finance_dao] = lambda: FakeFinanceDAO()
+    server.app.dependency_overrides[get_current_user] = lambda: None
+    try:
+        # No lifespan: TestClient outside a with-block never connects to Mongo
+        response = TestClient(server.app).get("/api/finances/summary?start_month=x")
+    finally:
+        server.app.dependency_overrides.clear()
+    assert response.status_code == 400
+    assert mongodb._client is None
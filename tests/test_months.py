@@ -0,0 +1,35 @@
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+import server
+from app.auth.auth_utils import get_current_user
+from dao.dependencies import get_finance_dao
+from dao.finance_dao import FinanceDAO
+from dao.months import MAX_MONTHS, month_range
+
+
+def test_month_range_allows_max_span():
+    start, end = month_range("2015-01", "2024-12")
+    assert (start, end) == (datetime(2015, 1, 1), datetime(2025, 1, 1))
+    assert MAX_MONTHS == 120
+
+
+def test_month_range_rejects_wider_span():
+    with pytest.raises(ValueError, match="121 months"):
+        month_range("2015-01", "2025-01")
+
+
+def test_summary_route_rejects_unbounded_range_before_querying(fake_db):
+    dao = FinanceDAO(fake_db)
+    server.app.dependency_overrides[get_finance_dao] = lambda: dao
+    server.app.dependency_overrides[get_current_user] = lambda: None
+    try:
+        response = TestClient(server.app).get("/api/finances/summary?start_month=1900-01")
+    finally:
+        server.app.dependency_overrides.clear()
+    assert response.status_code == 400
+    assert "at most 120" in response.json()["detail"]
+    # The range check runs before any query
+    assert all(not collection.calls for collection in fake_db.collections.values())
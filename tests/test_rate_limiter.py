@@ -0,0 +1,135 @@
+import io
+import threading
+import time
+
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+
+from app.dao.airtable_client import ThrottledAdapter, TokenBucket
+
+
+class FakeClock:
+    """Monotonic clock that only moves when something sleeps on it."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_bucket(rate=2.0, burst=3):
+    clock = FakeClock()
+    return TokenBucket(rate, burst, clock=clock, sleep=clock.sleep), clock
+
+
+def test_burst_is_served_immediately_then_refills_at_rate():
+    bucket, clock = make_bucket(rate=2.0, burst=3)
+
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.acquire() == 0.5
+    assert bucket.acquire() == 0.5
+    assert clock.now == 101.0
+    assert bucket.stats()["throttled"] == 2
+
+
+def test_idle_time_never_banks_more_than_burst():
+    bucket, clock = make_bucket(rate=2.0, burst=3)
+    clock.now += 60
+
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.acquire() == 0.5
+
+
+def test_pause_holds_back_every_caller_until_it_ends():
+    # Real clock and threads: the pause has to stop callers already waiting, not just the next one
+    bucket = TokenBucket(rate=1000.0, burst=10)
+    bucket.pause(0.2)
+    paused_until = time.monotonic() + 0.2 - 0.01
+    acquired_at = []
+
+    def caller():
+        bucket.acquire()
+        acquired_at.append(time.monotonic())
+
+    threads = [threading.Thread(target=caller) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(acquired_at) == 4
+    assert min(acquired_at) >= paused_until
+    assert bucket.stats()["rate_limited_429"] == 1
+
+
+def test_pause_drains_banked_tokens():
+    bucket, clock = make_bucket(rate=2.0, burst=3)
+    bucket.pause(5.0)
+
+    # Nothing is left over from before the 429: wait out the pause, then one refill interval
+    assert bucket.acquire() == 5.5
+    assert clock.now == 105.5
+
+
+def response(status, headers=None):
+    res = Response()
+    res.status_code = status
+    res.raw = io.BytesIO(b"{}")
+    res.headers.update(headers or {})
+    return res
+
+
+class StubTransport(HTTPAdapter):
+    """Stands in for the network: hands back queued responses instead of sending."""
+
+    def __init__(self, *args, responses=(), **kwargs):
+        self.responses = list(responses)
+        self.sent = 0
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        self.sent += 1
+        return self.responses.pop(0)
+
+
+class StubbedAdapter(ThrottledAdapter, StubTransport):
+    pass
+
+
+def prepared():
+    request = PreparedRequest()
+    request.prepare(method="GET", url="https://api.airtable.com/v0/appTest/Companies")
+    return request
+
+
+def test_429_is_retried_after_the_retry_after_delay():
+    bucket, clock = make_bucket()
+    adapter = StubbedAdapter(bucket, responses=[response(429, {"Retry-After": "7"}), response(200)])
+
+    result = adapter.send(prepared())
+
+    assert result.status_code == 200
+    assert adapter.sent == 2
+    assert bucket.rate_limited == 1
+    assert bucket.retries_exhausted == 0
+    # The second attempt waited out Retry-After (plus one refill) on the shared bucket
+    assert clock.sleeps[0] == 7.0
+
+
+def test_retries_exhausted_is_counted_after_max_retries():
+    bucket, _ = make_bucket()
+    limited = [response(429, {"Retry-After": "1"}) for _ in range(3)]
+    adapter = StubbedAdapter(bucket, max_rate_limit_retries=2, responses=limited)
+
+    result = adapter.send(prepared())
+
+    assert result.status_code == 429
+    assert adapter.sent == 3
+    assert bucket.rate_limited == 2
+    assert bucket.retries_exhausted == 1
@@ -0,0 +1,39 @@
+from app.dao.record_decoder import decoder_for
+from app.models.models import Company, Event
+
+COMPANY = {"id": "rec1", "fields": {
+    "company_name": "Acme",
+    "funding_programs": "Seed, , Series A",
+    "website": " acme.example ",
+    "linkedin_page": "https://linkedin.com/company/acme",
+}}
+
+
+def test_decode_applies_precompiled_rules_without_mutating_the_record():
+    fields = dict(COMPANY["fields"])
+    company = decoder_for(Company).decode(COMPANY)
+
+    assert company.funding_programs == ["Seed", "Series A"]
+    assert company.key_contacts == []
+    assert company.industry == ""
+    assert str(company.website) == "https://acme.example/"
+    assert COMPANY["fields"] == fields
+
+
+def test_decode_many_matches_decode_and_reports_bad_rows():
+    records = [
+        COMPANY,
+        {"id": "rec2", "fields": {"company_name": "No links"}},
+        {"fields": {}},
+        {**COMPANY, "id": "rec3"},
+    ]
+    items, rejected = decoder_for(Company).decode_many(records)
+
+    assert items == [decoder_for(Company).decode(COMPANY), decoder_for(Company).decode({**COMPANY, "id": "rec3"})]
+    assert [record_id for record_id, _ in rejected] == ["unknown", "rec2"]
+    assert "website" in rejected[1][1]
+
+
+def test_list_fields_are_detected_from_typing():
+    assert decoder_for(Company).list_fields == {"funding_programs", "key_contacts", "recent_events"}
+    assert decoder_for(Event).list_fields == {"keywords"}
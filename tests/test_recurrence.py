@@ -0,0 +1,46 @@
+from datetime import date, datetime
+
+from models.bills import Account, Bill
+from services.forecast import CashFlowProjection
+from services.recurrence import projected_month_totals, upcoming
+
+
+def rent(due_date, status="pending"):
+    return Bill(id=f"rent-{due_date:%m}", name="Rent", amount=1000.0, due_date=due_date, category="housing",
+                status=status, payment_account="Checking", recurring=True, recurring_period="monthly")
+
+
+# One series stored a document per month: January and February are both still unpaid
+SERIES = [rent(datetime(2025, 1, 15)), rent(datetime(2025, 2, 15)), rent(datetime(2024, 12, 15), status="paid")]
+
+
+def test_upcoming_keeps_earlier_pending_documents_of_a_series():
+    due = upcoming(SERIES, datetime(2025, 1, 1), datetime(2025, 4, 1))
+
+    assert [(o.due_date, o.bill_id, o.projected) for o in due] == [
+        (datetime(2025, 1, 15), "rent-01", False),
+        (datetime(2025, 2, 15), "rent-02", False),
+        (datetime(2025, 3, 15), "rent-02", True),
+    ]
+
+
+def test_paid_earlier_documents_are_listed_only_on_request():
+    due = upcoming(SERIES, datetime(2024, 12, 1), datetime(2025, 2, 1), include_paid=True)
+
+    assert [(o.due_date, o.status) for o in due] == [
+        (datetime(2024, 12, 15), "paid"), (datetime(2025, 1, 15), "pending")
+    ]
+
+
+def test_only_dates_after_the_head_are_projected():
+    assert projected_month_totals(SERIES, datetime(2025, 1, 1), datetime(2025, 4, 1)) == {"2025-03": 1000.0}
+
+
+def test_forecast_charges_earlier_pending_documents_of_a_series():
+    accounts = [Account(name="Checking", balance=5000.0, type="checking")]
+    projection = CashFlowProjection(accounts, SERIES, None, start=date(2025, 1, 1), months=3)
+
+    [baseline] = projection.run([]).scenarios
+
+    # January, February and the projected March rent
+    assert baseline.month_end_totals == [4000.0, 3000.0, 2000.0]
@@ -0,0 +1,155 @@
+import asyncio
+from typing import List, Optional
+
+import pytest
+from pydantic import BaseModel
+
+from app.dao import airtable_dao
+from app.dao.relation_index import (
+    RelationIndex, get_relation_index, invalidate_relation_indexes, register_relation_index
+)
+from app.dao.table_daos import ContactDAO
+
+
+class Tagged(BaseModel):
+    id: Optional[str] = None
+    companies: List[str] = []
+
+
+class Loader:
+    """Table ``list_all`` stand-in that counts how often the index reads it."""
+
+    def __init__(self, items):
+        self.items = items
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return list(self.items)
+
+
+def ids(items):
+    return sorted(item.id for item in items)
+
+
+def test_index_is_built_once_from_the_loader_and_rebuilt_after_ttl():
+    now = [0.0]
+    loader = Loader([Tagged(id="rec1", companies=["recA"]), Tagged(id="rec2", companies=["recB"])])
+    index = RelationIndex("Tagged", "companies", loader, ttl=60, clock=lambda: now[0])
+
+    async def run():
+        assert ids(await index.lookup("recA")) == ["rec1"]
+        assert ids(await index.lookup("recB")) == ["rec2"]
+        assert await index.lookup("recZ") == []
+        assert loader.calls == 1
+        now[0] = 61
+        await index.lookup("recA")
+        assert loader.calls == 2
+
+    asyncio.run(run())
+
+
+def test_multi_valued_link_fields_are_filed_under_every_value():
+    both = Tagged(id="rec1", companies=["recA", "recB"])
+    index = RelationIndex("Tagged", "companies", Loader([both, Tagged(id="rec2", companies=["recB"])]))
+
+    async def run():
+        grouped = await index.lookup_many(["recA", "recB", "recC"])
+        assert {key: ids(items) for key, items in grouped.items()} == {
+            "recA": ["rec1"], "recB": ["rec1", "rec2"], "recC": []
+        }
+
+        # An update refiles the record under its new values only
+        index.apply(item=Tagged(id="rec1", companies=["recC"]))
+        assert await index.lookup("recA") == []
+        assert ids(await index.lookup("recB")) == ["rec2"]
+        assert ids(await index.lookup("recC")) == ["rec1"]
+
+        index.apply(deleted_id="rec2")
+        assert await index.lookup("recB") == []
+
+    asyncio.run(run())
+
+
+def test_invalidate_relation_indexes_forces_a_rebuild():
+    loader = Loader([Tagged(id="rec1", companies=["recA"])])
+    index = register_relation_index("InvalidatedTable", "companies", loader, ttl=60)
+
+    async def run():
+        assert ids(await index.lookup("recA")) == ["rec1"]
+        # The mirror sync picked up a change the index has not seen
+        loader.items = [Tagged(id="rec1", companies=["recA"]), Tagged(id="rec2", companies=["recA"])]
+        assert ids(await index.lookup("recA")) == ["rec1"]
+
+        invalidate_relation_indexes("InvalidatedTable")
+        assert index.stats()["built"] is False
+        assert ids(await index.lookup("recA")) == ["rec1", "rec2"]
+        assert loader.calls == 2
+
+    asyncio.run(run())
+
+
+def contact_record(record_id, company):
+    return {"id": record_id, "fields": {
+        "name": "Ada", "position": "CTO", "email": "ada@example.com",
+        "linkedin_profile": "https://linkedin.com/in/ada", "company": company, "recent_posts": "",
+    }}
+
+
+RECORDS = [contact_record("recX", "recA"), contact_record("recY", "recB")]
+
+
+class FakeTable:
+    def __init__(self):
+        self.formulas = []
+
+    def all(self, formula=None):
+        self.formulas.append(formula)
+        return RECORDS
+
+
+class FakeMirror:
+    def __init__(self):
+        self.finds = []
+
+    def is_fresh(self, table_name):
+        return True
+
+    async def find(self, table_name, *args, **kwargs):
+        self.finds.append(table_name)
+        return RECORDS
+
+
+@pytest.fixture
+def cold_contacts(monkeypatch):
+    dao = ContactDAO()
+    dao.table = FakeTable()
+    index = get_relation_index("Contacts", "company")
+    # The index is shared per table and loads through whichever DAO registered it first
+    monkeypatch.setattr(index, "loader", dao.list_all)
+    dao.cache.clear()
+    index.invalidate()
+    yield dao
+    dao.cache.clear()
+    index.invalidate()
+
+
+def test_cold_index_is_built_from_airtable_without_a_mirror(cold_contacts, monkeypatch):
+    monkeypatch.setattr(airtable_dao, "get_airtable_mirror", lambda: None)
+
+    found = asyncio.run(cold_contacts.search("company", "recA"))
+
+    assert ids(found) == ["recX"]
+    # One unfiltered read of the table fills the index; no per-value formula
+    assert cold_contacts.table.formulas == [None]
+
+
+def test_cold_index_is_built_from_a_fresh_mirror(cold_contacts, monkeypatch):
+    mirror = FakeMirror()
+    monkeypatch.setattr(airtable_dao, "get_airtable_mirror", lambda: mirror)
+
+    grouped = asyncio.run(cold_contacts.search_many("company", ["recA", "recB"]))
+
+    assert {key: ids(items) for key, items in grouped.items()} == {"recA": ["recX"], "recB": ["recY"]}
+    assert mirror.finds == ["Contacts"]
+    assert cold_contacts.table.formulas == []
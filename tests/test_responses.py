@@ -0,0 +1,44 @@
+import json
+from datetime import datetime
+from decimal import Decimal
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+from fastapi.testclient import TestClient
+
+import server
+from app.auth.auth_utils import get_current_user
+from dao.dependencies import get_finance_dao
+from models.financial_models import Transaction, TransactionPage
+from routers.responses import trusted_json
+
+PAGE = TransactionPage(items=[
+    Transaction(id="t1", date=datetime(2025, 3, 1, 12, 30), description="Groceries",
+                category="food", amount=Decimal("12.50"), type="expense"),
+    Transaction(id="t2", date=datetime(2025, 3, 2), description="Refund",
+                category="food", amount=Decimal("40"), type="income"),
+], next_cursor="abc")
+
+
+def test_trusted_json_matches_orjson_response_of_plain_data():
+    # What /api/finances returns: plain dicts run through jsonable_encoder
+    assert trusted_json(PAGE).body == ORJSONResponse(jsonable_encoder(PAGE.model_dump())).body
+
+
+def test_transactions_amount_is_a_json_number():
+    class FakeFinanceDAO:
+        async def get_transactions_page(self, **kwargs):
+            return PAGE
+
+    server.app.dependency_overrides[get_finance_dao] = lambda: FakeFinanceDAO()
+    server.app.dependency_overrides[get_current_user] = lambda: None
+    try:
+        response = TestClient(server.app).get("/api/transactions")
+    finally:
+        server.app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    items = json.loads(response.content)["items"]
+    assert items[0]["amount"] == 12.5
+    assert items[1]["amount"] == 40
+    assert all(isinstance(item["amount"], (int, float)) for item in items)
@@ -0,0 +1,78 @@
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from bson import ObjectId
+from fastapi.testclient import TestClient
+
+import server
+from app.auth.auth_utils import get_current_user
+from dao.dependencies import get_finance_dao
+from dao.finance_dao import FinanceDAO
+from dao.pagination import decode_cursor, encode_cursor
+
+
+def transaction(day):
+    return {"_id": ObjectId(), "date": datetime(2025, 3, day), "description": "x", "category": "food",
+            "amount": Decimal("1.00"), "type": "expense"}
+
+
+def walk(dao, limit, **filters):
+    pages, cursor = [], None
+    while True:
+        page = asyncio.run(dao.get_transactions_page(limit=limit, cursor=cursor, **filters))
+        pages.append([item.id for item in page.items])
+        cursor = page.next_cursor
+        if cursor is None:
+            return pages
+
+
+@pytest.fixture
+def docs():
+    # Several rows per day, so page boundaries fall inside runs of equal dates
+    return [transaction(day) for day in (1, 1, 1, 2, 2, 3, 3, 3, 3, 4)]
+
+
+@pytest.fixture
+def dao(fake_db, docs):
+    fake_db.collection("transactions", docs=docs)
+    return FinanceDAO(fake_db)
+
+
+def test_pages_cover_ties_on_date_without_gaps_or_repeats(dao, docs):
+    expected = [str(doc["_id"]) for doc in sorted(docs, key=lambda d: (d["date"], d["_id"]), reverse=True)]
+
+    for limit in (1, 2, 3, 4):
+        pages = walk(dao, limit)
+        assert [row for page in pages for row in page] == expected
+        assert all(len(page) == limit for page in pages[:-1])
+
+
+def test_last_page_has_no_next_cursor(dao, docs):
+    # An exact multiple of the page size still ends without a dangling cursor
+    assert [len(page) for page in walk(dao, 5)] == [5, 5]
+    page = asyncio.run(dao.get_transactions_page(limit=len(docs)))
+    assert page.next_cursor is None
+
+
+def test_cursor_round_trips():
+    doc_id = ObjectId()
+    assert decode_cursor(encode_cursor(datetime(2025, 3, 1, 12, 30), doc_id)) == (datetime(2025, 3, 1, 12, 30), doc_id)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor(datetime(2025, 3, 1), ObjectId())[:-4], "e30"])
+def test_malformed_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        decode_cursor(cursor)
+
+
+def test_route_answers_malformed_cursor_with_400(dao):
+    server.app.dependency_overrides[get_finance_dao] = lambda: dao
+    server.app.dependency_overrides[get_current_user] = lambda: None
+    try:
+        response = TestClient(server.app).get("/api/transactions?cursor=not-a-cursor")
+    finally:
+        server.app.dependency_overrides.clear()
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid pagination cursor"
@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from dao.ttl_cache import TTLCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cancelling_the_first_caller_does_not_fail_the_waiters():
+    cache = TTLCache()
+    release = asyncio.Event()
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await release.wait()
+        return "alice"
+
+    async def run():
+        first = asyncio.create_task(cache.get_or_load("alice", loader))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(cache.get_or_load("alice", loader))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(run()) == "alice"
+    assert len(calls) == 1
+    assert cache.get("alice") == "alice"
+
+
+def test_waiters_retry_when_the_load_itself_is_cancelled():
+    cache = TTLCache()
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        if len(calls) == 1:
+            raise asyncio.CancelledError
+        return "bob"
+
+    async def run():
+        return await asyncio.gather(*(cache.get_or_load("bob", loader) for _ in range(3)))
+
+    assert asyncio.run(run()) == ["bob"] * 3
+    assert len(calls) == 2
+
+
+def test_concurrent_misses_share_one_load_and_errors_reach_every_caller():
+    cache = TTLCache()
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0)
+        raise LookupError("down")
+
+    async def run():
+        return await asyncio.gather(*(cache.get_or_load("k", loader) for _ in range(3)),
+                                    return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(isinstance(result, LookupError) for result in results)
+    assert cache.stats()["coalesced"] == 2
+
+
+def test_stale_entry_is_served_while_one_background_load_refreshes_it():
+    clock = Clock()
+    cache = TTLCache(ttl=10, stale_ttl=10, clock=clock)
+    cache.set("k", "old")
+    clock.now = 15
+
+    async def loader():
+        return "new"
+
+    async def run():
+        stale = await cache.get_or_load("k", loader)
+        await asyncio.sleep(0)
+        return stale, cache.get("k")
+
+    assert asyncio.run(run()) == ("old", "new")